@@ -0,0 +1,28 @@
+from typing import Optional
+import hmac
+
+from fastapi import Header, HTTPException
+
+from app.config import settings
+
+# 관리 기능 인증 (관리 엔드포인트 /admin/*, 요청 프로파일링)
+#
+# ADMIN_TOKEN을 지정한 경우에만 관리 기능을 사용할 수 있으며, 요청의 X-Admin-Token
+# 헤더가 이 값과 같아야 합니다. 지정하지 않으면 관리 기능은 모두 거부합니다.
+
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """관리 토큰 확인 (ADMIN_TOKEN이 없으면 항상 False, 상수 시간 비교)"""
+    if not settings.admin_token or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), settings.admin_token.encode())
+
+def require_admin(x_admin_token: Optional[str] = Header(None, description="관리 토큰 (ADMIN_TOKEN)")):
+    """관리 엔드포인트 의존성 (토큰이 없으면 401, 다르거나 ADMIN_TOKEN을 지정하지 않았으면 403)"""
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    if x_admin_token is None:
+        raise HTTPException(status_code=401, detail="Admin token required")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
@@ -0,0 +1,236 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import pickle
+import threading
+import time
+
+from app.config import settings
+
+# 읽기 캐시
+#
+# 게시물 상세와 피드 페이지처럼 읽기가 쓰기보다 훨씬 많은 데이터를 캐시합니다.
+# 기본 백엔드는 프로세스 내 LRU(MemoryCache)이며, 여러 워커가 캐시와 무효화를
+# 공유해야 하면 Redis 호환 클라이언트를 사용하는 RedisCache를 사용합니다.
+
+class CacheStats:
+    """캐시 적중/실패 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.evictions = 0
+
+    def record(self, **counts: int):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "evictions": self.evictions,
+        }
+
+class Cache(ABC):
+    """캐시 백엔드 인터페이스"""
+
+    backend = "base"
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키를 조회하여 찾은 값만 반환"""
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        """여러 값을 저장"""
+
+    @abstractmethod
+    def delete(self, *keys: str):
+        """키 삭제"""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """카운터 증가 후 새 값 반환 (만료 없음, 통계에 포함하지 않음)"""
+
+    @abstractmethod
+    def counter(self, key: str) -> int:
+        """카운터 현재 값 (없으면 0)"""
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.set_many({key: value}, ttl)
+
+    @abstractmethod
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "ttl": self.ttl, **self.stats.as_dict()}
+
+class NullCache(Cache):
+    """캐시를 사용하지 않을 때의 백엔드 (항상 실패)"""
+
+    backend = "none"
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        self.stats.record(misses=len(keys))
+        return {}
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        pass
+
+    def delete(self, *keys: str):
+        pass
+
+    def incr(self, key: str) -> int:
+        return 0
+
+    def counter(self, key: str) -> int:
+        return 0
+
+    def clear(self):
+        pass
+
+class MemoryCache(Cache):
+    """프로세스 내 LRU 캐시 (항목별 TTL)"""
+
+    backend = "memory"
+
+    def __init__(self, ttl: float, max_entries: int):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        self.stats.record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        evicted = 0
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        self.stats.record(sets=len(items), evictions=evicted)
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        self.stats.record(deletes=len(keys))
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return {**super().info(), "entries": len(self._entries), "max_entries": self.max_entries}
+
+class RedisCache(Cache):
+    """Redis 호환 클라이언트(get/mget/set/delete/incr/pipeline)를 사용하는 캐시
+
+    redis.Redis 또는 테스트용 fakeredis.FakeRedis처럼 같은 인터페이스를 가진
+    클라이언트를 받습니다. 값은 pickle로 직렬화하며 키에는 prefix를 붙입니다.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, ttl: float, prefix: str = "threads:"):
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        values = self.client.mget([self.prefix + key for key in keys])
+        found = {key: pickle.loads(value) for key, value in zip(keys, values) if value is not None}
+        self.stats.record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        pipeline = self.client.pipeline()
+        for key, value in items.items():
+            pipeline.set(self.prefix + key, pickle.dumps(value), px=int((ttl or self.ttl) * 1000))
+        pipeline.execute()
+        self.stats.record(sets=len(items))
+
+    def delete(self, *keys: str):
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+        self.stats.record(deletes=len(keys))
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def counter(self, key: str) -> int:
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+def create_cache() -> Cache:
+    """설정에 맞는 캐시 백엔드 생성"""
+    if settings.cache_backend == "redis":
+        import redis  # 선택 의존성
+
+        return RedisCache(redis.Redis.from_url(settings.redis_url), settings.cache_ttl)
+    if settings.cache_backend == "memory":
+        return MemoryCache(settings.cache_ttl, settings.cache_max_entries)
+    return NullCache(settings.cache_ttl)
+
+cache: Cache = create_cache()
+
+def set_cache(backend: Cache):
+    """캐시 백엔드 교체 (예: 테스트에서 fakeredis 클라이언트를 사용하는 RedisCache)"""
+    global cache
+    cache = backend
+
+def get_cache() -> Cache:
+    """현재 캐시 백엔드"""
+    return cache
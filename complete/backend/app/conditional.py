@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Optional
+import hashlib
+
+from fastapi import Request, Response
+
+from app.config import settings
+
+# 조건부 GET (게시물 상세, 게시물 댓글 목록, 사용자 프로필)
+#
+# ETag는 응답 본문을 결정하는 값(항목 ID, updated_at, 카운터, is_liked, 페이지 정보)의
+# 해시입니다. 작성자 정보는 바뀌지 않고 내용을 수정하면 updated_at이 바뀌므로, 같은 ETag는
+# 같은 응답 본문을 뜻합니다.
+#
+# 요청에 If-None-Match가 있으면 라우트는 먼저 내용/작성자 없이 ID, 시각, 카운터만 읽는
+# 가벼운 조회로 ETag를 계산하고, 일치하면 응답을 만들지 않고 304를 반환합니다.
+# Last-Modified도 함께 보내지만 좋아요/댓글 수 변경은 updated_at을 바꾸지 않으므로
+# If-Modified-Since만으로는 304를 반환하지 않습니다.
+#
+# username으로 is_liked를 확인한 응답은 사용자마다 다르므로 Cache-Control을 private으로
+# 보내 공유 캐시(프록시, CDN)에 저장되지 않게 합니다.
+
+def etag(*parts: Any) -> str:
+    """버전 값으로 강한 ETag 생성"""
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest() + '"'
+
+def is_conditional(request: Request) -> bool:
+    """If-None-Match가 있는 요청인지 확인 (가벼운 조회로 먼저 비교할지 결정)"""
+    return "if-none-match" in request.headers
+
+def matches(request: Request, tag: str) -> bool:
+    """If-None-Match가 tag와 일치하는지 확인 (약한 비교, *는 항상 일치)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or tag in (value.removeprefix("W/") for value in candidates)
+
+def _http_date(value: datetime) -> str:
+    """datetime을 HTTP 날짜 형식으로 변환 (시간대가 없으면 UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def validator_headers(tag: str, last_modified: Optional[datetime], private: bool = False) -> Dict[str, str]:
+    """ETag, Last-Modified, Cache-Control 헤더 (private=True이면 사용자별 응답)"""
+    scope = "private" if private else "public"
+    headers = {
+        "ETag": tag,
+        # 캐시가 저장하되 HTTP_CACHE_MAX_AGE가 지나면 If-None-Match로 다시 확인하도록 함
+        "Cache-Control": f"{scope}, max-age={settings.http_cache_max_age}, must-revalidate",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+def not_modified(tag: str, last_modified: Optional[datetime], private: bool = False) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers=validator_headers(tag, last_modified, private))
+
+def with_validators(
+    result: Any, response: Response, tag: str, last_modified: Optional[datetime], private: bool = False
+) -> Any:
+    """응답에 검증 헤더 추가
+
+    라우트가 Response(빠른 직렬화)를 반환하면 그 응답에, dict를 반환하면 FastAPI가
+    주입한 response에 헤더를 설정합니다.
+    """
+    target = result if isinstance(result, Response) else response
+    target.headers.update(validator_headers(tag, last_modified, private))
+    return result
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """None을 제외한 가장 늦은 시각 (Last-Modified 계산용)"""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
@@ -0,0 +1,72 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Optional
+
+class Settings(BaseSettings):
+    """애플리케이션 설정 (환경 변수 또는 .env 파일에서 로드, 이름은 대소문자 무관)"""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # 데이터베이스 URL 설정 (기본값은 SQLite)
+    database_url: str = "sqlite:///./threads_app.db"
+
+    # 비동기 데이터베이스 사용 여부 및 드라이버 URL (지정하지 않으면 database_url에서 유도)
+    database_async: bool = False
+    async_database_url: Optional[str] = None
+
+    # 커넥션 풀 설정 (SQLite 외 데이터베이스에서 모두 적용, SQLite 파일 DB는 크기/타임아웃만 적용)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # SQLite PRAGMA 설정 (연결마다 적용, 빈 값이면 SQLite 기본값 사용)
+    sqlite_journal_mode: Optional[str] = "WAL"
+    sqlite_synchronous: Optional[str] = "NORMAL"
+    sqlite_mmap_size: Optional[int] = 256 * 1024 * 1024
+    sqlite_busy_timeout: Optional[int] = 5000  # 밀리초
+
+    # 읽기 캐시 설정 (memory: 프로세스 내 LRU, redis: Redis 공유 캐시, none: 사용 안 함)
+    cache_backend: str = "memory"
+    cache_ttl: float = 60.0  # 초
+    cache_max_entries: int = 10000
+    redis_url: str = "redis://localhost:6379/0"
+
+    # 사용자 이름 -> ID 캐시 설정 (프로세스 내)
+    user_cache_size: int = 10000
+    user_cache_ttl: float = 3600.0  # 초
+
+    # 좋아요 쓰기 지연 버퍼 (켜면 좋아요/취소를 모아 주기적으로 한 트랜잭션에 반영)
+    like_buffer_enabled: bool = False
+    like_buffer_flush_interval: float = 0.5  # 초
+    like_buffer_max_events: int = 1000  # 이만큼 쌓이면 주기를 기다리지 않고 반영
+
+    # 실시간 이벤트 GET /events (memory: 프로세스 내, redis: 여러 워커가 Redis pub/sub로 공유, none: 사용 안 함)
+    event_broker: str = "memory"
+    events_queue_size: int = 100  # 구독자별로 쌓아 둘 최대 이벤트 수 (넘으면 느린 구독자로 보고 연결 종료)
+    events_heartbeat: float = 15.0  # 초, 이벤트가 없을 때 연결 유지를 위해 보내는 주기
+    events_max_subscribers: int = 10000  # 워커별 최대 구독 연결 수
+
+    # 요청/DB 메트릭 수집 및 GET /metrics 노출 여부
+    metrics_enabled: bool = True
+
+    # 조건부 GET 응답의 Cache-Control max-age (초, 0이면 매번 ETag로 확인)
+    http_cache_max_age: int = 0
+
+    # 목록 응답을 응답 모델 재검증 없이 orjson으로 바로 직렬화 (orjson 필요)
+    fast_json_responses: bool = True
+
+    # 관리 토큰 (지정하면 X-Admin-Token 헤더로 관리 엔드포인트 사용, 없으면 관리 엔드포인트는 403)
+    admin_token: Optional[str] = None
+
+    # 느린 쿼리 기록 (기준 시간을 지정하면 사용, GET /admin/slow-queries 에서 조회)
+    slow_query_threshold_ms: Optional[float] = None
+    slow_query_log_size: int = 100
+
+    # 요청 단위 프로파일링 (켜면 X-Profile 헤더 또는 profile 쿼리 파라미터가 있고 관리 토큰이 맞는 요청을 측정)
+    profiling_enabled: bool = False
+    profiling_dir: str = "./profiles"
+    profiling_interval_ms: float = 1.0
+    profiling_max_files: int = 100  # 저장할 최대 프로파일 파일 수 (넘으면 오래된 것부터 삭제)
+
+settings = Settings()
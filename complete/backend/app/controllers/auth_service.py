@@ -5,8 +5,8 @@ from typing import Dict
 
 def login(db: Session, user_data: schemas.UserLoginSimple) -> Dict:
     """사용자 로그인 또는 신규 가입"""
-    user = user_service.login_user(db, user_data.username)
+    user_id = user_service.get_or_create_user_id(db, user_data.username)
     return {
-        "userId": user.id,
-        "username": user.username
+        "userId": user_id,
+        "username": user_data.username
     }
\ No newline at end of file
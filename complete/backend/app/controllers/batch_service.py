@@ -0,0 +1,119 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from pydantic import ValidationError
+from app.models import models, schemas
+from app.controllers import user_service, post_service, change_log
+from typing import Any, Callable, Dict, List, Tuple, Type
+from app import events
+
+# 일괄 작성
+#
+# 항목마다 요청 본문 검증, 작성자 조회/생성, 커밋을 반복하지 않도록
+# 전체 항목을 먼저 검증하고, 작성자를 한 번에 조회/생성한 뒤, 올바른 항목만
+# 한 번에 삽입합니다. 새 작성자 생성과 삽입은 한 트랜잭션에서 마지막에 한 번만 커밋하므로
+# 삽입이 실패하면 새 작성자도 함께 롤백됩니다. 결과는 요청 순서대로 항목별로 반환하며,
+# 실패한 항목은 error에 이유를 담고 나머지 항목은 그대로 작성합니다.
+
+def _error_message(error: ValidationError) -> str:
+    """검증 오류를 한 줄 메시지로 변환"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+        for item in error.errors()
+    )
+
+def _validate_items(items: List[Dict[str, Any]], model: Type) -> Tuple[List[Tuple[int, Any]], Dict[int, str]]:
+    """항목별 검증 결과 ((순서, 검증된 항목) 목록, 순서 -> 오류 메시지)"""
+    valid, errors = [], {}
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, model.model_validate(item)))
+        except ValidationError as error:
+            errors[index] = _error_message(error)
+    return valid, errors
+
+def _batch_result(count: int, ids: Dict[int, int], errors: Dict[int, str]) -> Dict[str, Any]:
+    """요청 순서대로 항목별 결과 구성"""
+    return {
+        "created": len(ids),
+        "failed": len(errors),
+        "items": [
+            {"index": index, "id": ids.get(index), "error": errors.get(index)}
+            for index in range(count)
+        ]
+    }
+
+def _insert_many(db: Session, model, valid: List[Tuple[int, Any]], values: Callable[[Any], Dict[str, Any]]) -> Dict[int, int]:
+    """검증된 항목을 한 번의 executemany로 삽입하고 순서 -> 생성된 ID를 반환 (커밋은 호출자가 수행)"""
+    if not valid:
+        return {}
+    
+    # RETURNING 결과를 요청 순서와 맞춤 (지원하는 데이터베이스는 여러 행을 한 문으로 삽입)
+    new_ids = db.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        [values(item) for _, item in valid]
+    ).scalars().all()
+    return {index: new_id for (index, _), new_id in zip(valid, new_ids)}
+
+def create_posts(db: Session, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """게시물 일괄 작성"""
+    valid, errors = _validate_items(items, schemas.PostCreate)
+    
+    # 작성자 일괄 조회 (없으면 한 번에 생성, 커밋은 삽입과 함께)
+    author_ids = user_service.get_or_create_user_ids(db, [post.username for _, post in valid], commit=False)
+    
+    # 한 번에 삽입
+    ids = _insert_many(db, models.Post, valid, lambda post: {
+        "content": post.content,
+        "author_id": author_ids[post.username]
+    })
+    change_log.record(db, [change_log.post_change(post_id, change_log.UPSERT) for post_id in ids.values()])
+    db.commit()
+    
+    if ids:
+        post_service.invalidate_feed()
+    for index, post in valid:
+        if index in ids:
+            events.publish_post("post_created", ids[index], author_ids[post.username])
+    return _batch_result(len(items), ids, errors)
+
+def create_comments(db: Session, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """댓글 일괄 작성 (여러 게시물에 작성 가능)"""
+    valid, errors = _validate_items(items, schemas.CommentBatchItem)
+    
+    # 게시물 존재 여부 일괄 확인
+    post_ids = {comment.post_id for _, comment in valid}
+    existing = set(db.execute(
+        select(models.Post.id).where(models.Post.id.in_(post_ids))
+    ).scalars()) if post_ids else set()
+    for index, comment in valid:
+        if comment.post_id not in existing:
+            errors[index] = "Post not found"
+    valid = [(index, comment) for index, comment in valid if index not in errors]
+    
+    # 작성자 일괄 조회 (없으면 한 번에 생성, 커밋은 삽입과 함께)
+    author_ids = user_service.get_or_create_user_ids(db, [comment.username for _, comment in valid], commit=False)
+    
+    # 한 번에 삽입하고 게시물별 댓글 수는 게시물마다 한 번씩 증가 (같은 트랜잭션)
+    ids = _insert_many(db, models.Comment, valid, lambda comment: {
+        "content": comment.content,
+        "post_id": comment.post_id,
+        "author_id": author_ids[comment.username]
+    })
+    
+    added: Dict[int, int] = {}
+    for _, comment in valid:
+        added[comment.post_id] = added.get(comment.post_id, 0) + 1
+    for post_id, delta in added.items():
+        post_service.adjust_post_counter(db, post_id, models.Post.comments_count, delta)
+    change_log.record(
+        db,
+        [change_log.comment_change(ids[index], comment.post_id, change_log.UPSERT) for index, comment in valid]
+        + [change_log.post_change(post_id, change_log.COUNTS) for post_id in added]
+    )
+    db.commit()
+    
+    for post_id in added:
+        post_service.invalidate_post(post_id)
+    for index, comment in valid:
+        events.publish_comment("comment_created", ids[index], comment.post_id, author_ids[comment.username])
+    return _batch_result(len(items), ids, errors)
@@ -0,0 +1,63 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select
+from app.models import models
+from datetime import datetime
+from typing import Any, Dict, List
+
+# 변경 기록 (GET /sync 증분 동기화)
+#
+# 게시물/댓글을 작성·수정·삭제하거나 좋아요/댓글 수가 바뀌면 같은 트랜잭션에서 changes
+# 테이블에 한 행씩 추가합니다. seq(기본키)가 워터마크이며 커밋 순서대로 증가하므로
+# 클라이언트는 마지막으로 받은 seq 이후의 행만 기본키 범위로 읽어 가면 됩니다.
+# 삭제는 행 대신 op=delete 기록(툼스톤)으로 남습니다.
+#
+# - upsert: 게시물/댓글 작성 또는 내용 수정 (동기화 응답에 항목 전체를 담음)
+# - counts: 게시물의 좋아요/댓글 수만 바뀜 (좋아요 수, 댓글 수만 담음)
+# - delete: 삭제 (게시물 삭제는 그 게시물의 댓글 삭제도 뜻하므로 댓글마다 기록하지 않음)
+#
+# seq가 커밋 순서와 같아야 클라이언트가 늦게 커밋된 낮은 seq를 건너뛰지 않습니다.
+# SQLite는 쓰기 트랜잭션이 하나씩 실행되어 항상 성립하고, 쓰기가 동시에 실행되는
+# PostgreSQL에서는 변경을 기록하기 전에 트랜잭션 advisory 잠금(CHANGE_LOG_LOCK)을 잡아
+# seq 할당부터 커밋까지를 직렬화합니다. 기록은 커밋 직전에 하므로 잠금은 짧게 유지됩니다.
+
+POST = "post"
+COMMENT = "comment"
+
+UPSERT = "upsert"
+COUNTS = "counts"
+DELETE = "delete"
+
+# 변경 기록 직렬화용 PostgreSQL advisory 잠금 키 (임의의 고정 값)
+CHANGE_LOG_LOCK = 0x7468726473796E63
+
+def post_change(post_id: int, op: str) -> Dict[str, Any]:
+    """게시물 변경 기록 값"""
+    return {"entity": POST, "entity_id": post_id, "post_id": post_id, "op": op}
+
+def comment_change(comment_id: int, post_id: int, op: str) -> Dict[str, Any]:
+    """댓글 변경 기록 값"""
+    return {"entity": COMMENT, "entity_id": comment_id, "post_id": post_id, "op": op}
+
+def lock_statement(dialect: str):
+    """seq 할당부터 커밋까지 직렬화하는 잠금 문 (필요 없는 데이터베이스는 None)"""
+    if dialect == "postgresql":
+        return select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK))
+    return None
+
+def record(db: Session, changes: List[Dict[str, Any]]):
+    """변경 기록을 한 번의 executemany로 추가 (커밋은 호출자가 수행, 잠금은 커밋 때 풀림)"""
+    if changes:
+        lock = lock_statement(db.get_bind().dialect.name)
+        if lock is not None:
+            db.execute(lock)
+        db.execute(insert(models.Change), changes)
+
+def prune(db: Session, before: datetime) -> int:
+    """before 이전의 변경 기록 삭제 (마지막 기록은 남겨 워터마크 확인에 사용)"""
+    newest = select(func.max(models.Change.seq)).scalar_subquery()
+    result = db.execute(
+        delete(models.Change).where(models.Change.changed_at < before, models.Change.seq < newest),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    return result.rowcount
@@ -1,10 +1,31 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, Query
 from sqlalchemy import func
 from app.models import models, schemas
-from app.controllers import user_service, post_service
-from typing import List, Optional, Dict, Any, Tuple
+from app.controllers import user_service, post_service, pagination, change_log
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from fastapi import HTTPException
-import math
+from app import events
+
+def comment_rows(db: Session) -> Query:
+    """댓글 읽기 전용 조회 (응답에 필요한 컬럼만, 작성자 JOIN)
+
+    post_service.post_rows와 같이 ORM 엔티티 대신 Row를 반환합니다.
+    작성자 컬럼은 author_id, author_username, author_profile_image_url 입니다.
+    """
+    return db.query(
+        models.Comment.id,
+        models.Comment.content,
+        models.Comment.post_id,
+        models.Comment.created_at,
+        models.Comment.updated_at,
+        models.User.id.label("author_id"),
+        models.User.username.label("author_username"),
+        models.User.profile_image_url.label("author_profile_image_url")
+    ).join(models.User, models.User.id == models.Comment.author_id)
+
+def comment_versions(db: Session) -> Query:
+    """댓글 버전 조회 (ETag 계산용, 내용/작성자 없이 ID와 시각만)"""
+    return db.query(models.Comment.id, models.Comment.created_at, models.Comment.updated_at)
 
 def get_comment(db: Session, comment_id: int):
     """ID로 댓글 조회"""
@@ -18,21 +39,26 @@ def create_comment(db: Session, post_id: int, comment: schemas.CommentCreate):
         raise HTTPException(status_code=404, detail="Post not found")
     
     # 작성자 확인 또는 생성
-    user = user_service.get_user_by_username(db, comment.username)
-    if not user:
-        user_data = schemas.UserCreate(username=comment.username)
-        user = user_service.create_user(db, user_data)
+    user_id = user_service.get_or_create_user_id(db, comment.username)
     
     # 새 댓글 생성
     db_comment = models.Comment(
         content=comment.content,
         post_id=post_id,
-        author_id=user.id
+        author_id=user_id
     )
     
     db.add(db_comment)
+    post_service.adjust_post_counter(db, post_id, models.Post.comments_count, 1)
+    db.flush()
+    change_log.record(db, [
+        change_log.comment_change(db_comment.id, post_id, change_log.UPSERT),
+        change_log.post_change(post_id, change_log.COUNTS)
+    ])
     db.commit()
+    post_service.invalidate_post(post_id)
     db.refresh(db_comment)
+    events.publish_comment("comment_created", db_comment.id, post_id, user_id)
     return db_comment
 
 def update_comment(db: Session, comment_id: int, comment_update: schemas.CommentUpdate, username: str):
@@ -41,13 +67,15 @@ def update_comment(db: Session, comment_id: int, comment_update: schemas.Comment
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    user = user_service.get_user_by_username(db, username)
-    if not user or comment.author_id != user.id:
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None or comment.author_id != user_id:
         raise HTTPException(status_code=401, detail="Not authorized to update this comment")
     
     comment.content = comment_update.content
+    change_log.record(db, [change_log.comment_change(comment_id, comment.post_id, change_log.UPSERT)])
     db.commit()
     db.refresh(comment)
+    events.publish_comment("comment_updated", comment_id, comment.post_id, user_id)
     return comment
 
 def delete_comment(db: Session, comment_id: int, username: str):
@@ -56,32 +84,78 @@ def delete_comment(db: Session, comment_id: int, username: str):
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    user = user_service.get_user_by_username(db, username)
-    if not user or comment.author_id != user.id:
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None or comment.author_id != user_id:
         raise HTTPException(status_code=401, detail="Not authorized to delete this comment")
     
     db.delete(comment)
+    post_service.adjust_post_counter(db, comment.post_id, models.Post.comments_count, -1)
+    change_log.record(db, [
+        change_log.comment_change(comment_id, comment.post_id, change_log.DELETE),
+        change_log.post_change(comment.post_id, change_log.COUNTS)
+    ])
     db.commit()
+    post_service.invalidate_post(comment.post_id)
+    events.publish_comment("comment_deleted", comment_id, comment.post_id, user_id)
     return {"message": "Comment deleted successfully"}
 
-def get_comments_for_post(db: Session, post_id: int, page: int = 1, limit: int = 10):
-    """게시물의 댓글 목록 조회 (페이지네이션 적용)"""
+def get_comments_for_post(
+    db: Session,
+    post_id: int,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    rows: Callable[[Session], Query] = comment_rows
+):
+    """게시물의 댓글 목록 조회 (페이지네이션 적용, rows의 Row 반환)
+
+    rows에 comment_versions를 주면 조건부 GET을 위한 버전만 조회합니다.
+    """
     # 게시물 확인
-    post = post_service.get_post(db, post_id)
-    if not post:
+    if not db.query(models.Post.id).filter(models.Post.id == post_id).first():
         raise HTTPException(status_code=404, detail="Post not found")
     
     # 총 댓글 수 조회
-    total = db.query(func.count(models.Comment.id)).filter(
-        models.Comment.post_id == post_id
-    ).scalar()
+    total = pagination.count_total(
+        db.query(models.Comment.id).filter(models.Comment.post_id == post_id),
+        count
+    )
     
     # 페이지네이션 정보 계산
-    pages = math.ceil(total / limit) if total > 0 else 0
+    pages = pagination.page_count(total, limit)
     
     # 댓글 목록 조회
-    comments = db.query(models.Comment).filter(
-        models.Comment.post_id == post_id
-    ).order_by(models.Comment.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
+    query = rows(db).filter(models.Comment.post_id == post_id)
+    comments, next_cursor = pagination.keyset_page(
+        query, models.Comment.created_at, models.Comment.id, page, limit, cursor
+    )
+    
+    return comments, total, page, limit, pages, next_cursor
+
+def get_comments_by_author(
+    db: Session,
+    author_id: int,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    rows: Callable[[Session], Query] = comment_rows
+):
+    """사용자가 작성한 댓글 목록 조회 (페이지네이션 적용, rows의 Row 반환)"""
+    # 총 댓글 수 조회
+    total = pagination.count_total(
+        db.query(models.Comment.id).filter(models.Comment.author_id == author_id),
+        count
+    )
+    
+    # 페이지네이션 정보 계산
+    pages = pagination.page_count(total, limit)
+    
+    # 댓글 목록 조회
+    query = rows(db).filter(models.Comment.author_id == author_id)
+    comments, next_cursor = pagination.keyset_page(
+        query, models.Comment.created_at, models.Comment.id, page, limit, cursor
+    )
     
-    return comments, total, page, limit, pages
\ No newline at end of file
+    return comments, total, page, limit, pages, next_cursor
\ No newline at end of file
@@ -0,0 +1,107 @@
+from sqlalchemy import select
+from app.database import SessionLocal
+from app.models import models
+from app.controllers import post_service
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+import json
+
+# NDJSON 내보내기
+#
+# 전체 게시물/댓글을 한 줄에 하나의 JSON 객체로 스트리밍합니다. 목록 API처럼 페이지마다
+# 전체 목록을 만들지 않고, 하나의 쿼리를 yield_per로 EXPORT_BATCH_SIZE개씩 나누어 읽어
+# 바로 내보내므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+# (PostgreSQL은 서버 측 커서, SQLite는 열린 커서에서 필요한 만큼만 읽음)
+#
+# - 응답 본문은 핸들러가 끝난 뒤에 생성되므로 요청 세션 대신 전용 세션을 열고,
+#   내보내기가 끝나거나 클라이언트가 연결을 끊으면 닫습니다.
+# - 하나의 읽기 트랜잭션에서 읽으므로 내보내는 도중의 변경은 결과에 섞이지 않습니다.
+# - (created_at, id) 오름차순으로 내보내며, since를 지정하면 그 시각 이후(포함)에
+#   작성된 항목만 (created_at, id) 인덱스로 찾아 내보냅니다. created_at은 시간대 없는
+#   UTC로 저장되므로 시간대가 있는 since는 UTC로 바꾼 뒤 비교합니다.
+
+# 한 번에 읽어 내보낼 행 수
+EXPORT_BATCH_SIZE = 1000
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _utc(value: datetime) -> datetime:
+    """since를 저장 형식(시간대 없는 UTC)으로 변환 (시간대가 없으면 UTC로 간주)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _stream(statement, to_dict: Callable[[Any], Dict[str, Any]]) -> Iterator[str]:
+    """쿼리 결과를 EXPORT_BATCH_SIZE개 행마다 NDJSON 덩어리로 생성"""
+    db = SessionLocal()
+    try:
+        result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for rows in result.partitions():
+            yield "".join(
+                json.dumps(to_dict(row), ensure_ascii=False, default=_json_default) + "\n"
+                for row in rows
+            )
+    finally:
+        db.close()
+
+def _author(row) -> Dict[str, Any]:
+    return {
+        "id": row.author_id,
+        "username": row.username,
+        "profile_image_url": row.profile_image_url
+    }
+
+def export_posts(since: Optional[datetime] = None) -> Iterator[str]:
+    """게시물 NDJSON 스트림 (작성자 포함, 좋아요 수는 반영 대기 중인 좋아요 포함)"""
+    statement = (
+        select(
+            models.Post.id, models.Post.content, models.Post.author_id,
+            models.Post.likes_count, models.Post.comments_count,
+            models.Post.created_at, models.Post.updated_at,
+            models.User.username, models.User.profile_image_url
+        )
+        .join(models.User, models.Post.author_id == models.User.id)
+        .order_by(models.Post.created_at, models.Post.id)
+    )
+    if since is not None:
+        statement = statement.where(models.Post.created_at >= _utc(since))
+
+    return _stream(statement, lambda row: {
+        "id": row.id,
+        "content": row.content,
+        "author": _author(row),
+        "likes_count": post_service.buffered_likes_count(row.id, row.likes_count),
+        "comments_count": row.comments_count,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at
+    })
+
+def export_comments(since: Optional[datetime] = None, post_id: Optional[int] = None) -> Iterator[str]:
+    """댓글 NDJSON 스트림 (작성자 포함, post_id를 지정하면 해당 게시물의 댓글만)"""
+    statement = (
+        select(
+            models.Comment.id, models.Comment.content, models.Comment.post_id,
+            models.Comment.author_id, models.Comment.created_at, models.Comment.updated_at,
+            models.User.username, models.User.profile_image_url
+        )
+        .join(models.User, models.Comment.author_id == models.User.id)
+        .order_by(models.Comment.created_at, models.Comment.id)
+    )
+    if post_id is not None:
+        statement = statement.where(models.Comment.post_id == post_id)
+    if since is not None:
+        statement = statement.where(models.Comment.created_at >= _utc(since))
+
+    return _stream(statement, lambda row: {
+        "id": row.id,
+        "content": row.content,
+        "post_id": row.post_id,
+        "author": _author(row),
+        "created_at": row.created_at,
+        "updated_at": row.updated_at
+    })
@@ -0,0 +1,147 @@
+from sqlalchemy.orm import Session, Query
+from sqlalchemy import func, tuple_, text
+from fastapi import HTTPException
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+import base64
+import math
+
+# 총 개수 계산 방식
+COUNT_MODES = ("exact", "estimate", "none")
+COUNT_MODE_PATTERN = "^(exact|estimate|none)$"
+
+# estimate 모드에서 필터가 있는 목록을 셀 때의 상한
+ESTIMATE_LIMIT = 1000
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """(created_at, id) 키를 불투명한 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, id) 키로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_page(
+    query: Query,
+    created_column,
+    id_column,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    key: Callable[[Any], Any] = lambda item: item
+) -> Tuple[List[Any], Optional[str]]:
+    """(created_at, id) 내림차순으로 한 페이지 조회
+
+    커서가 주어지면 키셋 조건으로, 없으면 OFFSET으로 시작 위치를 정합니다.
+    limit + 1 개를 조회하여 다음 페이지가 있을 때만 next_cursor를 반환합니다.
+    """
+    query = query.order_by(created_column.desc(), id_column.desc())
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        query = query.filter(tuple_(created_column, id_column) < tuple_(created_at, item_id))
+    else:
+        query = query.offset((page - 1) * limit)
+
+    items = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = key(items[-1])
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return items, next_cursor
+
+def encode_offset_cursor(offset: int) -> str:
+    """OFFSET 위치를 불투명한 커서 문자열로 인코딩 (관련도 순 목록용)"""
+    return base64.urlsafe_b64encode(f"offset|{offset}".encode()).decode().rstrip("=")
+
+def decode_offset_cursor(cursor: str) -> int:
+    """커서 문자열을 OFFSET 위치로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, offset = base64.urlsafe_b64decode(padded).decode().split("|")
+        if kind != "offset" or int(offset) < 0:
+            raise ValueError(cursor)
+        return int(offset)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def encode_id_cursor(item_id: int) -> str:
+    """마지막 항목 ID를 불투명한 커서 문자열로 인코딩 (ID 내림차순 목록용)"""
+    return base64.urlsafe_b64encode(f"id|{item_id}".encode()).decode().rstrip("=")
+
+def decode_id_cursor(cursor: str) -> int:
+    """커서 문자열을 마지막 항목 ID로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, item_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        if kind != "id":
+            raise ValueError(cursor)
+        return int(item_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def offset_page(
+    query: Query,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """이미 정렬된 query에서 OFFSET으로 한 페이지 조회
+
+    관련도 순처럼 (created_at, id) 키셋을 쓸 수 없는 목록에 사용하며,
+    next_cursor에는 다음 페이지의 OFFSET 위치가 담깁니다.
+    """
+    offset = decode_offset_cursor(cursor) if cursor else (page - 1) * limit
+    items = query.offset(offset).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_offset_cursor(offset + limit)
+
+    return items, next_cursor
+
+def estimate_table_rows(db: Session, model) -> int:
+    """테이블 전체 행 수 추정 (전체 스캔 없이)"""
+    if db.get_bind().dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples FROM pg_class WHERE relname = :name"),
+            {"name": model.__tablename__}
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    # 기본키 인덱스로 최대 ID를 조회 (삭제된 행이 있으면 실제보다 클 수 있음)
+    return db.query(func.max(model.id)).scalar() or 0
+
+def count_total(count_query: Query, mode: str = "exact", estimate: Optional[Callable[[], int]] = None) -> Optional[int]:
+    """총 개수 계산
+
+    - **exact**: COUNT(*)로 정확한 개수 계산
+    - **estimate**: estimate 함수가 있으면 사용하고, 없으면 ESTIMATE_LIMIT까지만 계산
+    - **none**: 계산하지 않음 (None 반환)
+    """
+    if mode == "none":
+        return None
+
+    if mode == "estimate":
+        if estimate is not None:
+            return estimate()
+        bounded = count_query.order_by(None).limit(ESTIMATE_LIMIT).subquery()
+        return count_query.session.query(func.count()).select_from(bounded).scalar()
+
+    return count_query.order_by(None).count()
+
+def page_count(total: Optional[int], limit: int) -> Optional[int]:
+    """총 페이지 수 계산"""
+    if total is None:
+        return None
+    return math.ceil(total / limit) if total > 0 else 0
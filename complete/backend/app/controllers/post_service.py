@@ -1,10 +1,163 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, Query
+from sqlalchemy import Integer, delete, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from app.models import models, schemas
-from app.controllers import user_service
-from typing import List, Optional, Dict, Any, Tuple
+from app.controllers import user_service, pagination, search_service, change_log
+from typing import Callable, List, Optional, Dict, Any, Set, Tuple
 from fastapi import HTTPException
-import math
+from app import cache, events
+from app.like_buffer import like_buffer
+
+# 캐시 키
+#
+# - post:{id}: 게시물 정보 (작성자, 카운터 포함, is_liked 제외)
+# - feed:{세대}:...: 피드 한 페이지의 게시물 ID 목록과 페이지 정보
+#
+# 피드 페이지에는 게시물 ID만 저장하고 게시물 정보는 post:{id}에서 가져오므로,
+# 좋아요/댓글/수정은 해당 게시물 키만 지우면 됩니다. 게시물이 생기거나 삭제되어
+# 페이지 구성이 바뀔 때만 피드 세대를 올려 이전 세대의 페이지를 모두 무효화합니다.
+#
+# 조회와 저장 사이에 쓰기가 커밋되면 조회한 값이 이미 낡았을 수 있으므로, 조회 전에 세대를
+# 읽어 두고 저장 직전에 세대가 바뀌었으면 저장하지 않습니다. 게시물 키를 지울 때도
+# 게시물 세대를 올려 진행 중인 조회가 지워진 값을 다시 채우지 못하게 합니다.
+FEED_GENERATION_KEY = "feed:generation"
+POST_GENERATION_KEY = "post:generation"
+
+def _post_cache_key(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def post_rows(db: Session) -> Query:
+    """게시물 읽기 전용 조회 (응답에 필요한 컬럼만, 작성자 JOIN)
+
+    ORM 엔티티 대신 Row를 반환하므로 identity map 등록, 변경 추적, 관계 로딩을 거치지
+    않습니다. 작성자 컬럼은 author_id, author_username, author_profile_image_url 입니다.
+    """
+    return db.query(
+        models.Post.id,
+        models.Post.content,
+        models.Post.likes_count,
+        models.Post.comments_count,
+        models.Post.created_at,
+        models.Post.updated_at,
+        models.User.id.label("author_id"),
+        models.User.username.label("author_username"),
+        models.User.profile_image_url.label("author_profile_image_url")
+    ).join(models.User, models.User.id == models.Post.author_id)
+
+def post_versions(db: Session) -> Query:
+    """게시물 버전 조회 (ETag 계산용, 내용/작성자 없이 ID, 시각, 카운터만)"""
+    return db.query(
+        models.Post.id,
+        models.Post.created_at,
+        models.Post.updated_at,
+        models.Post.likes_count,
+        models.Post.comments_count
+    )
+
+def post_to_dict(post: Row) -> Dict[str, Any]:
+    """post_rows의 Row를 캐시 가능한 응답 데이터로 변환 (is_liked 제외)"""
+    return {
+        "id": post.id,
+        "content": post.content,
+        "author": {
+            "id": post.author_id,
+            "username": post.author_username,
+            "profile_image_url": post.author_profile_image_url
+        },
+        "likes_count": post.likes_count,
+        "comments_count": post.comments_count,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at
+    }
+
+def invalidate_feed():
+    """피드 페이지 캐시를 모두 무효화 (커밋 후 호출)"""
+    cache.get_cache().incr(FEED_GENERATION_KEY)
+
+def invalidate_post(post_id: int, feed: bool = False):
+    """게시물 캐시 무효화 (feed=True이면 피드 페이지도 모두 무효화, 커밋 후 호출)"""
+    backend = cache.get_cache()
+    backend.delete(_post_cache_key(post_id))
+    backend.incr(POST_GENERATION_KEY)
+    if feed:
+        invalidate_feed()
+
+def _store_posts(backend: cache.Cache, post_data: Dict[int, Dict[str, Any]], generation: int):
+    """조회 중 게시물 캐시가 무효화되지 않았을 때만 post:{id}에 저장"""
+    if post_data and backend.counter(POST_GENERATION_KEY) == generation:
+        backend.set_many({_post_cache_key(post_id): data for post_id, data in post_data.items()})
+
+def _likes_count_subquery():
+    """게시물별 좋아요 수 상관 서브쿼리"""
+    return select(func.count(models.post_likes.c.user_id)).where(
+        models.post_likes.c.post_id == models.Post.id
+    ).scalar_subquery()
+
+def _comments_count_subquery():
+    """게시물별 댓글 수 상관 서브쿼리"""
+    return select(func.count(models.Comment.id)).where(
+        models.Comment.post_id == models.Post.id
+    ).scalar_subquery()
+
+def adjust_post_counter(db: Session, post_id: int, column, delta: int):
+    """게시물 카운터 컬럼을 원자적으로 증감 (커밋은 호출자가 수행)"""
+    db.execute(
+        update(models.Post)
+        .where(models.Post.id == post_id)
+        # 카운터 변경은 게시물 수정이 아니므로 updated_at은 그대로 유지
+        .values({column: column + delta, models.Post.updated_at: models.Post.updated_at}),
+        execution_options={"synchronize_session": False}
+    )
+
+def recount_post_counters(db: Session, post_ids: Optional[List[int]] = None) -> int:
+    """게시물의 좋아요/댓글 카운터를 실제 행 수로 다시 계산 (복구 및 백필용)"""
+    stmt = update(models.Post).values(
+        likes_count=_likes_count_subquery(),
+        comments_count=_comments_count_subquery(),
+        updated_at=models.Post.updated_at
+    )
+    if post_ids is not None:
+        stmt = stmt.where(models.Post.id.in_(post_ids))
+    
+    result = db.execute(stmt, execution_options={"synchronize_session": False})
+    db.commit()
+    return result.rowcount
+
+def is_liked_by(db: Session, post_id: int, user_id: int) -> bool:
+    """사용자가 게시물에 좋아요 했는지 확인"""
+    like = db.query(models.post_likes).filter(
+        models.post_likes.c.post_id == post_id,
+        models.post_likes.c.user_id == user_id
+    ).first()
+    return like is not None
+
+def liked_post_ids(db: Session, post_ids: List[int], username: Optional[str]) -> Set[int]:
+    """post_ids 중 사용자가 좋아요 한 게시물 ID 집합 (post_id IN (...) 한 번으로 조회)"""
+    if not username or not post_ids:
+        return set()
+    
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None:
+        return set()
+    
+    liked = set(db.execute(
+        select(models.post_likes.c.post_id).where(
+            models.post_likes.c.user_id == user_id,
+            models.post_likes.c.post_id.in_(post_ids)
+        )
+    ).scalars())
+    # 아직 반영되지 않은 좋아요/취소 반영
+    if like_buffer.enabled:
+        liked = like_buffer.overlay_liked(user_id, post_ids, liked)
+    return liked
+
+def buffered_likes_count(post_id: int, likes_count: int) -> int:
+    """저장된 좋아요 수에 아직 반영되지 않은 좋아요/취소를 더한 값"""
+    if like_buffer.enabled:
+        return likes_count + like_buffer.delta(post_id)
+    return likes_count
 
 def get_post(db: Session, post_id: int):
     """ID로 게시물 조회"""
@@ -13,20 +166,21 @@ def get_post(db: Session, post_id: int):
 def create_post(db: Session, post: schemas.PostCreate):
     """새 게시물 생성"""
     # 작성자 확인 또는 생성
-    user = user_service.get_user_by_username(db, post.username)
-    if not user:
-        user_data = schemas.UserCreate(username=post.username)
-        user = user_service.create_user(db, user_data)
+    user_id = user_service.get_or_create_user_id(db, post.username)
     
     # 새 게시물 생성
     db_post = models.Post(
         content=post.content,
-        author_id=user.id
+        author_id=user_id
     )
     
     db.add(db_post)
+    db.flush()
+    change_log.record(db, [change_log.post_change(db_post.id, change_log.UPSERT)])
     db.commit()
     db.refresh(db_post)
+    invalidate_post(db_post.id, feed=True)
+    events.publish_post("post_created", db_post.id, user_id)
     return db_post
 
 def delete_post(db: Session, post_id: int, username: str):
@@ -35,12 +189,18 @@ def delete_post(db: Session, post_id: int, username: str):
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    user = user_service.get_user_by_username(db, username)
-    if not user or post.author_id != user.id:
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None or post.author_id != user_id:
         raise HTTPException(status_code=401, detail="Not authorized to delete this post")
     
-    db.delete(post)
+    # 좋아요/댓글을 세션에 불러오지 않고 게시물과 함께 한 번에 삭제
+    db.execute(delete(models.post_likes).where(models.post_likes.c.post_id == post_id))
+    db.execute(delete(models.Comment).where(models.Comment.post_id == post_id))
+    db.execute(delete(models.Post).where(models.Post.id == post_id))
+    change_log.record(db, [change_log.post_change(post_id, change_log.DELETE)])
     db.commit()
+    invalidate_post(post_id, feed=True)
+    events.publish_post("post_deleted", post_id, user_id)
     return {"message": "Post deleted successfully"}
 
 def update_post(db: Session, post_id: int, post_update: schemas.PostUpdate, username: str):
@@ -49,131 +209,346 @@ def update_post(db: Session, post_id: int, post_update: schemas.PostUpdate, user
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    user = user_service.get_user_by_username(db, username)
-    if not user or post.author_id != user.id:
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None or post.author_id != user_id:
         raise HTTPException(status_code=401, detail="Not authorized to update this post")
     
     post.content = post_update.content
+    change_log.record(db, [change_log.post_change(post_id, change_log.UPSERT)])
     db.commit()
     db.refresh(post)
+    invalidate_post(post_id)
+    events.publish_post("post_updated", post_id, user_id)
     return post
 
-def get_posts_list(db: Session, page: int = 1, limit: int = 10):
-    """게시물 목록 조회 (페이지네이션 적용)"""
+def get_posts_list(
+    db: Session,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    author_id: Optional[int] = None,
+    rows: Callable[[Session], Query] = post_rows
+):
+    """게시물 목록 조회 (페이지네이션 적용)
+
+    post_rows의 Row(작성자 JOIN)를 반환하며, 좋아요 수와 댓글 수는 게시물의
+    카운터 컬럼(likes_count, comments_count)을 그대로 사용합니다.
+    cursor가 주어지면 OFFSET 대신 (created_at, id) 키셋으로 페이지를 찾습니다.
+    author_id가 주어지면 해당 사용자의 게시물만 조회합니다.
+    rows에 post_versions를 주면 조건부 GET을 위한 버전만 조회합니다.
+    """
+    query = rows(db)
+    count_query = db.query(models.Post.id)
+    estimate = lambda: pagination.estimate_table_rows(db, models.Post)
+    if author_id is not None:
+        query = query.filter(models.Post.author_id == author_id)
+        count_query = count_query.filter(models.Post.author_id == author_id)
+        estimate = None
+    
     # 총 게시물 수 조회
-    total = db.query(func.count(models.Post.id)).scalar()
+    total = pagination.count_total(count_query, count, estimate=estimate)
     
     # 페이지네이션 정보 계산
-    pages = math.ceil(total / limit) if total > 0 else 0
+    pages = pagination.page_count(total, limit)
     
-    # 게시물 목록 조회
-    posts = db.query(models.Post).order_by(
-        models.Post.created_at.desc()
-    ).offset((page - 1) * limit).limit(limit).all()
+    # 게시물 목록 조회 (작성자 JOIN)
+    posts, next_cursor = pagination.keyset_page(
+        query, models.Post.created_at, models.Post.id, page, limit, cursor
+    )
     
-    return posts, total, page, limit, pages
+    return posts, total, page, limit, pages, next_cursor
 
-def get_post_detail(db: Session, post_id: int, username: Optional[str] = None):
-    """게시물 상세 정보 조회"""
-    post = get_post(db, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+def get_cached_posts(db: Session, post_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """게시물 정보를 post:{id} 캐시에서 한 번에 가져오고, 없는 것만 한 번의 쿼리로 조회
+
+    존재하지 않는 게시물은 결과에서 빠집니다.
+    """
+    backend = cache.get_cache()
+    keys = [_post_cache_key(post_id) for post_id in post_ids]
+    cached = backend.get_many(keys)
+    post_data = {post_id: cached[key] for post_id, key in zip(post_ids, keys) if key in cached}
     
-    # 좋아요 수 조회
-    likes_count = db.query(func.count(models.post_likes.c.user_id)).filter(
-        models.post_likes.c.post_id == post_id
-    ).scalar()
-    
-    # 댓글 수 조회
-    comments_count = db.query(func.count(models.Comment.id)).filter(
-        models.Comment.post_id == post_id
-    ).scalar()
-    
-    # 현재 사용자가 좋아요 했는지 확인
-    is_liked = False
-    if username:
-        user = user_service.get_user_by_username(db, username)
-        if user:
-            like = db.query(models.post_likes).filter(
-                models.post_likes.c.post_id == post_id,
-                models.post_likes.c.user_id == user.id
-            ).first()
-            is_liked = like is not None
-    
-    return post, likes_count, comments_count, is_liked
-
-def like_post(db: Session, post_id: int, username: str):
-    """게시물 좋아요"""
-    post = get_post(db, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
+    # 캐시에 없는 게시물만 조회 (작성자 JOIN)
+    missing = [post_id for post_id in post_ids if post_id not in post_data]
+    if missing:
+        generation = backend.counter(POST_GENERATION_KEY)
+        posts = post_rows(db).filter(models.Post.id.in_(missing)).all()
+        loaded = {post.id: post_to_dict(post) for post in posts}
+        _store_posts(backend, loaded, generation)
+        post_data.update(loaded)
     
-    user = user_service.get_user_by_username(db, username)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    return post_data
+
+def get_like_status(db: Session, post_ids: List[int], username: Optional[str] = None) -> List[Dict[str, Any]]:
+    """여러 게시물의 좋아요 여부와 좋아요/댓글 수 조회 (요청 순서 유지, 없는 게시물은 제외)"""
+    post_ids = list(dict.fromkeys(post_ids))
+    post_data = get_cached_posts(db, post_ids)
+    liked = liked_post_ids(db, list(post_data), username)
     
-    # 이미 좋아요 했는지 확인
-    like = db.query(models.post_likes).filter(
-        models.post_likes.c.post_id == post_id,
-        models.post_likes.c.user_id == user.id
-    ).first()
+    return [
+        {
+            "post_id": post_id,
+            "is_liked": post_id in liked,
+            "likes_count": buffered_likes_count(post_id, post_data[post_id]["likes_count"]),
+            "comments_count": post_data[post_id]["comments_count"]
+        }
+        for post_id in post_ids if post_id in post_data
+    ]
+
+def get_feed(
+    db: Session,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    username: Optional[str] = None
+) -> Dict[str, Any]:
+    """피드 한 페이지 조회 (get_posts_list 앞단의 읽기 캐시)
+
+    페이지 구성(게시물 ID, 총 개수, 다음 커서)은 피드 세대별로 캐시하고,
+    게시물 정보는 post:{id} 캐시에서 한 번에 가져온 뒤 없는 것만 DB에서 조회합니다.
+    username이 주어지면 페이지 전체의 is_liked를 한 번의 쿼리로 확인합니다.
+    """
+    backend = cache.get_cache()
+    # 조회 전에 세대를 읽어 두고, 조회 중 무효화되면 낡은 결과를 저장하지 않음
+    generation = backend.counter(FEED_GENERATION_KEY)
+    page_key = f"feed:{generation}:{limit}:{cursor or page}:{count}"
+    
+    feed_page = backend.get(page_key)
+    if feed_page is None:
+        post_generation = backend.counter(POST_GENERATION_KEY)
+        posts, total, page, limit, pages, next_cursor = get_posts_list(db, page, limit, cursor, count)
+        post_data = {post.id: post_to_dict(post) for post in posts}
+        _store_posts(backend, post_data, post_generation)
+        feed_page = {
+            "ids": list(post_data),
+            "total": total,
+            "pages": pages,
+            "next_cursor": next_cursor
+        }
+        if backend.counter(FEED_GENERATION_KEY) == generation:
+            backend.set(page_key, feed_page)
+    else:
+        post_data = get_cached_posts(db, feed_page["ids"])
     
-    if like:
-        raise HTTPException(status_code=400, detail="Already liked this post")
+    liked = liked_post_ids(db, feed_page["ids"], username)
     
-    # 좋아요 추가
-    stmt = models.post_likes.insert().values(
-        post_id=post_id,
-        user_id=user.id
+    return {
+        # 조회 사이에 삭제된 게시물은 제외
+        "items": [
+            {
+                **post_data[post_id],
+                "likes_count": buffered_likes_count(post_id, post_data[post_id]["likes_count"]),
+                "is_liked": post_id in liked
+            }
+            for post_id in feed_page["ids"] if post_id in post_data
+        ],
+        "total": feed_page["total"],
+        "page": page,
+        "size": limit,
+        "pages": feed_page["pages"],
+        "next_cursor": feed_page["next_cursor"]
+    }
+
+def search_posts(
+    db: Session,
+    q: str,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    sort: str = "recent"
+):
+    """게시물 내용으로 검색 (검색 인덱스 사용, post_rows의 Row 반환)"""
+    # 게시물 목록 조회 (작성자 JOIN, 관련도 순은 총 개수 생략)
+    posts, total, next_cursor = search_service.search_page(
+        db, post_rows(db), models.Post, "posts_fts", q, sort, page, limit, cursor, count
     )
-    db.execute(stmt)
+    
+    # 페이지네이션 정보 계산
+    pages = pagination.page_count(total, limit)
+    
+    return posts, total, page, limit, pages, next_cursor
+
+def get_post_detail(db: Session, post_id: int, username: Optional[str] = None) -> Dict[str, Any]:
+    """게시물 상세 정보 조회 (게시물 정보는 캐시를 거쳐 조회)"""
+    backend = cache.get_cache()
+    key = _post_cache_key(post_id)
+    post_data = backend.get(key)
+    if post_data is None:
+        generation = backend.counter(POST_GENERATION_KEY)
+        post = post_rows(db).filter(models.Post.id == post_id).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        post_data = post_to_dict(post)
+        _store_posts(backend, {post_id: post_data}, generation)
+    
+    # 현재 사용자가 좋아요 했는지 확인 (사용자마다 다르므로 캐시하지 않음)
+    is_liked = post_id in liked_post_ids(db, [post_id], username)
+    
+    return {
+        **post_data,
+        "likes_count": buffered_likes_count(post_id, post_data["likes_count"]),
+        "is_liked": is_liked
+    }
+
+def _like_change_statement(db: Session, post_id: int, user_id: int, liked: bool):
+    """좋아요 추가/삭제 문 (이미 같은 상태이거나 게시물이 없으면 아무 행도 바꾸지 않음)"""
+    if not liked:
+        return delete(models.post_likes).where(
+            models.post_likes.c.post_id == post_id,
+            models.post_likes.c.user_id == user_id
+        )
+    
+    # 게시물이 있을 때만 삽입 (외래 키 오류 방지), 중복 좋아요는 무시
+    post_exists = select(models.Post.id).where(models.Post.id == post_id).exists()
+    source = select(literal(post_id, Integer), literal(user_id, Integer)).where(post_exists)
+    dialect = db.get_bind().dialect.name
+    dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    return dialect_insert(models.post_likes).from_select(
+        ["post_id", "user_id"], source
+    ).on_conflict_do_nothing()
+
+def _change_like(db: Session, post_id: int, user_id: int, liked: bool) -> bool:
+    """좋아요 행만 추가/삭제하고 변경 여부를 반환 (카운터는 갱신하지 않음)"""
+    if db.get_bind().dialect.name in ("sqlite", "postgresql"):
+        return db.execute(_like_change_statement(db, post_id, user_id, liked)).rowcount > 0
+    
+    if is_liked_by(db, post_id, user_id) == liked or get_post(db, post_id) is None:
+        return False
+    try:
+        with db.begin_nested():
+            if liked:
+                db.execute(models.post_likes.insert().values(post_id=post_id, user_id=user_id))
+            else:
+                db.execute(_like_change_statement(db, post_id, user_id, liked))
+        return True
+    except IntegrityError:
+        return False
+
+def apply_like_events(db: Session, events: Dict[Tuple[int, int], bool]) -> List[int]:
+    """모아 둔 좋아요 이벤트((게시물 ID, 사용자 ID) -> 좋아요 여부)를 한 트랜잭션으로 반영
+
+    게시물별 카운터는 실제로 바뀐 행 수만큼 한 번씩 갱신하며, 바뀐 게시물 ID 목록을 반환합니다.
+    """
+    deltas: Dict[int, int] = {}
+    for (post_id, user_id), liked in events.items():
+        if _change_like(db, post_id, user_id, liked):
+            deltas[post_id] = deltas.get(post_id, 0) + (1 if liked else -1)
+    
+    for post_id, delta in deltas.items():
+        if delta:
+            adjust_post_counter(db, post_id, models.Post.likes_count, delta)
+    change_log.record(db, [
+        change_log.post_change(post_id, change_log.COUNTS) for post_id, delta in deltas.items() if delta
+    ])
     db.commit()
+    return list(deltas)
+
+def _set_like(db: Session, post_id: int, user_id: int, liked: bool) -> Tuple[bool, Optional[int]]:
+    """좋아요 상태를 바꾸고 (변경 여부, 새 좋아요 수)를 반환 (게시물이 없으면 좋아요 수는 None)
+
+    - PostgreSQL: 좋아요 추가/삭제와 카운터 갱신을 CTE로 묶어 한 번의 왕복으로 처리
+    - SQLite: INSERT ... ON CONFLICT DO NOTHING / DELETE 후 UPDATE ... RETURNING
+    - 그 외: 좋아요 여부 확인 후 세이브포인트 안에서 변경
+    변경이 없을 때(이미 같은 상태)만 현재 좋아요 수를 따로 조회합니다. 커밋은 호출자가 수행합니다.
+    """
+    delta = 1 if liked else -1
+    counter_update = update(models.Post).where(models.Post.id == post_id).values(
+        likes_count=models.Post.likes_count + delta,
+        # 카운터 변경은 게시물 수정이 아니므로 updated_at은 그대로 유지
+        updated_at=models.Post.updated_at
+    )
+    dialect = db.get_bind().dialect
+    
+    if dialect.name == "postgresql":
+        changed = _like_change_statement(db, post_id, user_id, liked).returning(
+            models.post_likes.c.post_id
+        ).cte("changed")
+        likes_count = db.execute(
+            counter_update.where(select(changed.c.post_id).exists()).returning(models.Post.likes_count),
+            execution_options={"synchronize_session": False}
+        ).scalar()
+        changed = likes_count is not None
+    else:
+        changed = _change_like(db, post_id, user_id, liked)
+        likes_count = None
+        if changed and dialect.update_returning:
+            likes_count = db.execute(
+                counter_update.returning(models.Post.likes_count),
+                execution_options={"synchronize_session": False}
+            ).scalar()
+        elif changed:
+            db.execute(counter_update, execution_options={"synchronize_session": False})
+    
+    if likes_count is None:
+        likes_count = db.execute(
+            select(models.Post.likes_count).where(models.Post.id == post_id)
+        ).scalar()
+    return changed, likes_count
+
+def _buffer_like(db: Session, post_id: int, user_id: int, liked: bool, idempotent: bool):
+    """좋아요 추가/취소를 쓰기 지연 버퍼에 기록 (DB에는 버퍼가 주기적으로 반영)"""
+    post_data = get_cached_posts(db, [post_id]).get(post_id)
+    if post_data is None:
+        raise HTTPException(status_code=404, detail="Post not found")
     
-    # 좋아요 수 계산
-    likes_count = db.query(func.count(models.post_likes.c.user_id)).filter(
-        models.post_likes.c.post_id == post_id
-    ).scalar()
+    stored = like_buffer.state(post_id, user_id)
+    if stored is None:
+        stored = is_liked_by(db, post_id, user_id)
     
+    changed = like_buffer.record(post_id, user_id, liked, stored)
+    if not changed and not idempotent:
+        detail = "Already liked this post" if liked else "Haven't liked this post"
+        raise HTTPException(status_code=400, detail=detail)
+    
+    likes_count = buffered_likes_count(post_id, post_data["likes_count"])
+    if changed:
+        events.publish_likes(post_id, likes_count)
     return {
         "post_id": post_id,
-        "is_liked": True,
+        "is_liked": liked,
         "likes_count": likes_count
     }
 
-def unlike_post(db: Session, post_id: int, username: str):
-    """게시물 좋아요 취소"""
-    post = get_post(db, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    
-    user = user_service.get_user_by_username(db, username)
-    if not user:
+def _update_like(db: Session, post_id: int, username: str, liked: bool, idempotent: bool):
+    """좋아요 추가/취소 공통 처리"""
+    user_id = user_service.get_user_id(db, username)
+    if user_id is None:
+        if get_post(db, post_id) is None:
+            raise HTTPException(status_code=404, detail="Post not found")
         raise HTTPException(status_code=404, detail="User not found")
     
-    # 좋아요 했는지 확인
-    like = db.query(models.post_likes).filter(
-        models.post_likes.c.post_id == post_id,
-        models.post_likes.c.user_id == user.id
-    ).first()
+    if like_buffer.enabled:
+        return _buffer_like(db, post_id, user_id, liked, idempotent)
     
-    if not like:
-        raise HTTPException(status_code=400, detail="Haven't liked this post")
+    changed, likes_count = _set_like(db, post_id, user_id, liked)
+    if likes_count is None:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Post not found")
+    if not changed and not idempotent:
+        db.rollback()
+        detail = "Already liked this post" if liked else "Haven't liked this post"
+        raise HTTPException(status_code=400, detail=detail)
     
-    # 좋아요 삭제
-    stmt = models.post_likes.delete().where(
-        models.post_likes.c.post_id == post_id,
-        models.post_likes.c.user_id == user.id
-    )
-    db.execute(stmt)
+    if changed:
+        change_log.record(db, [change_log.post_change(post_id, change_log.COUNTS)])
     db.commit()
-    
-    # 좋아요 수 계산
-    likes_count = db.query(func.count(models.post_likes.c.user_id)).filter(
-        models.post_likes.c.post_id == post_id
-    ).scalar()
+    if changed:
+        invalidate_post(post_id)
+        events.publish_likes(post_id, likes_count)
     
     return {
         "post_id": post_id,
-        "is_liked": False,
+        "is_liked": liked,
         "likes_count": likes_count
-    }
\ No newline at end of file
+    }
+
+def like_post(db: Session, post_id: int, username: str, idempotent: bool = False):
+    """게시물 좋아요 (idempotent=True이면 이미 좋아요 한 경우에도 성공으로 처리)"""
+    return _update_like(db, post_id, username, True, idempotent)
+
+def unlike_post(db: Session, post_id: int, username: str, idempotent: bool = False):
+    """게시물 좋아요 취소 (idempotent=True이면 좋아요 하지 않은 경우에도 성공으로 처리)"""
+    return _update_like(db, post_id, username, False, idempotent)
@@ -0,0 +1,169 @@
+from sqlalchemy.orm import Query, Session
+from typing import Any, List, Optional, Tuple
+from sqlalchemy.engine import Connection
+from sqlalchemy import func, literal_column, select, table, column, text
+import sqlite3
+
+from app.controllers import pagination
+
+# 검색 인덱스 구성
+#
+# - SQLite: trigram 토크나이저를 사용하는 FTS5 외부 콘텐츠 테이블(users_fts, posts_fts)을
+#   두고, 원본 테이블의 트리거로 INSERT/UPDATE/DELETE 시 자동으로 동기화합니다.
+#   trigram 인덱스는 3글자 이상의 부분 문자열 검색을 인덱스로 처리하고 bm25로 순위를 매깁니다.
+# - PostgreSQL: pg_trgm 확장의 GIN 인덱스로 ILIKE 부분 일치를 처리하고 similarity로 순위를 매깁니다.
+# - 그 외(또는 3글자 미만 검색어): ILIKE 부분 일치 후 짧은 값 순으로 정렬합니다.
+#
+# 정렬 방식
+#
+# - recent: 일치하는 행을 최신순(id 내림차순)으로 반환합니다. 인덱스 순서대로 읽으므로
+#   일치하는 행이 아무리 많아도 페이지 크기만큼만 읽으며, 커서에는 마지막 id가 담겨
+#   깊은 페이지도 OFFSET 없이 id 범위로 이어서 읽습니다.
+# - relevance: 일치하는 행 중 최신 RELEVANCE_CANDIDATES개만 관련도 점수로 다시 정렬합니다.
+#   흔한 검색어에서 수십만 행의 점수를 계산하지 않도록 후보 수를 제한하므로 전체 일치
+#   항목이 아닌 상위 N개 보기이며, 총 개수(total)와 페이지 수(pages)는 계산하지 않습니다.
+#   후보가 최대 RELEVANCE_CANDIDATES개이므로 커서에는 OFFSET 위치가 담깁니다.
+
+# 검색 대상: 인덱스 이름 -> (원본 테이블, 검색 컬럼)
+SEARCH_INDEXES = {
+    "users_fts": ("users", "username"),
+    "posts_fts": ("posts", "content"),
+}
+
+# trigram 인덱스로 찾을 수 있는 최소 검색어 길이
+TRIGRAM_MIN_LENGTH = 3
+
+# 정렬 방식
+SORT_PATTERN = "^(relevance|recent)$"
+
+# relevance 정렬 시 점수를 계산할 최대 후보 수
+RELEVANCE_CANDIDATES = 200
+
+def sqlite_fts_supported() -> bool:
+    """SQLite FTS5 trigram 토크나이저 지원 여부 (SQLite 3.34.0 이상)"""
+    return sqlite3.sqlite_version_info >= (3, 34, 0)
+
+def create_search_indexes(conn: Connection):
+    """검색 인덱스 생성 및 기존 데이터 색인 (마이그레이션에서 사용)"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite" and sqlite_fts_supported():
+        for index, (source, field) in SEARCH_INDEXES.items():
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+                f"{field}, content='{source}', content_rowid='id', tokenize='trigram')"
+            ))
+            conn.execute(text(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {source} BEGIN "
+                f"INSERT INTO {index}(rowid, {field}) VALUES (new.id, new.{field}); END"
+            ))
+            conn.execute(text(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {source} BEGIN "
+                f"INSERT INTO {index}({index}, rowid, {field}) VALUES ('delete', old.id, old.{field}); END"
+            ))
+            # 검색 컬럼이 바뀔 때만 재색인 (카운터 갱신 등은 무시)
+            conn.execute(text(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {field} ON {source} BEGIN "
+                f"INSERT INTO {index}({index}, rowid, {field}) VALUES ('delete', old.id, old.{field}); "
+                f"INSERT INTO {index}(rowid, {field}) VALUES (new.id, new.{field}); END"
+            ))
+            conn.execute(text(f"INSERT INTO {index}({index}) VALUES ('rebuild')"))
+    elif dialect == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for index, (source, field) in SEARCH_INDEXES.items():
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{source}_{field}_trgm "
+                f"ON {source} USING gin ({field} gin_trgm_ops)"
+            ))
+
+def _like_pattern(term: str) -> str:
+    """LIKE 패턴으로 사용할 수 있도록 와일드카드 문자 이스케이프"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+def apply_text_search(
+    db: Session,
+    query: Query,
+    model,
+    index: str,
+    term: str,
+    sort: str = "recent",
+    before_id: Optional[int] = None
+) -> Query:
+    """query에 검색 조건과 정렬을 적용
+
+    - **model**: 검색 대상 모델 (SEARCH_INDEXES의 원본 테이블)
+    - **index**: 검색 인덱스 이름 (users_fts, posts_fts)
+    - **term**: 검색어 (부분 일치)
+    - **sort**: 정렬 방식 (relevance: 관련도 순, recent: 최신순)
+    - **before_id**: recent 정렬에서 이 ID보다 작은 행만 조회 (커서 페이지네이션)
+    """
+    field = getattr(model, SEARCH_INDEXES[index][1])
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "sqlite" and sqlite_fts_supported() and len(term) >= TRIGRAM_MIN_LENGTH:
+        fts = table(index, column("rowid"))
+        # 검색어 전체를 하나의 구문으로 검색 (FTS 쿼리 문법 무시)
+        match = literal_column(index).match('"' + term.replace('"', '""') + '"')
+
+        if sort == "recent":
+            query = query.join(fts, fts.c.rowid == model.id).filter(match)
+            if before_id is not None:
+                # FTS 인덱스의 rowid 범위로 조건을 넘겨 커서 이후만 읽음
+                query = query.filter(fts.c.rowid < before_id)
+            return query.order_by(fts.c.rowid.desc())
+
+        candidates = select(
+            fts.c.rowid.label("id"),
+            func.bm25(literal_column(index)).label("score")
+        ).where(match).order_by(fts.c.rowid.desc()).limit(RELEVANCE_CANDIDATES).subquery()
+        return query.join(candidates, candidates.c.id == model.id).order_by(
+            candidates.c.score, model.id.desc()
+        )
+
+    condition = field.ilike(_like_pattern(term), escape="\\")
+    if sort == "recent":
+        query = query.filter(condition)
+        if before_id is not None:
+            query = query.filter(model.id < before_id)
+        return query.order_by(model.id.desc())
+
+    candidates = select(model.id).where(condition).order_by(model.id.desc()).limit(RELEVANCE_CANDIDATES)
+    query = query.filter(model.id.in_(candidates.scalar_subquery()))
+    if dialect == "postgresql":
+        return query.order_by(func.similarity(field, term).desc(), model.id.desc())
+    return query.order_by(func.length(field), model.id.desc())
+
+def search_page(
+    db: Session,
+    query: Query,
+    model,
+    index: str,
+    term: str,
+    sort: str,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """검색 결과 한 페이지 조회 ((항목 목록, 총 개수, 다음 페이지 커서))
+
+    recent는 마지막 ID 커서로, relevance는 상위 후보 안에서 OFFSET 커서로 이어서 읽습니다.
+    relevance는 상위 후보만 보므로 총 개수를 계산하지 않습니다 (None).
+    """
+    matches = apply_text_search(db, query, model, index, term, sort)
+    if sort == "relevance":
+        items, next_cursor = pagination.offset_page(matches, page, limit, cursor)
+        return items, None, next_cursor
+
+    total = pagination.count_total(matches.with_entities(model.id), count)
+    if cursor:
+        matches = apply_text_search(db, query, model, index, term, sort, pagination.decode_id_cursor(cursor))
+    else:
+        matches = matches.offset((page - 1) * limit)
+
+    items = matches.limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = pagination.encode_id_cursor(items[-1].id)
+    return items, total, next_cursor
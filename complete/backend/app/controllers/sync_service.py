@@ -0,0 +1,130 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from app.models import models
+from app.controllers import post_service, comment_service, change_log
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+
+# 증분 동기화 (GET /sync)
+#
+# 클라이언트는 since 없이 호출해 현재 워터마크를 받은 뒤 목록 API로 데이터를 불러오고,
+# 이후에는 마지막으로 받은 워터마크를 since로 보내 그 뒤의 변경만 받습니다.
+# (워터마크를 먼저 받으므로 그 사이의 변경은 다음 동기화에서 다시 전달되며, 같은 항목을
+# 다시 받아도 덮어쓰면 되므로 안전합니다.)
+#
+# - 변경이 없으면 changes 기본키의 최솟값/최댓값만 확인하는 한 번의 조회로 끝납니다.
+# - 변경 기록을 seq 순서대로 limit개까지 읽어 항목별로 합친 뒤(나중 변경 우선, 단
+#   카운터 변경은 작성/수정/삭제를 덮어쓰지 않음), 현재 값을 종류별로 한 번씩 조회합니다.
+#   그 사이 삭제된 항목은 건너뛰며 삭제 표시는 이후 동기화에서 전달됩니다.
+# - since가 보관 중인 기록보다 오래되었거나(manage.py prune-changes) 이 데이터베이스의
+#   워터마크가 아니면 410을 반환하며, 클라이언트는 처음부터 다시 불러와야 합니다.
+# - seq는 커밋 순서와 같으므로(change_log 참고) 워터마크 이후에 늦게 커밋되는 낮은 seq는
+#   없습니다.
+
+def _watermarks(db: Session) -> Tuple[Optional[int], Optional[int]]:
+    """보관 중인 가장 오래된/최신 seq (기본키 양 끝만 읽음)"""
+    return db.execute(select(
+        select(func.min(models.Change.seq)).scalar_subquery(),
+        select(func.max(models.Change.seq)).scalar_subquery()
+    )).one()
+
+def _merge(changes) -> Tuple[Dict[int, str], Dict[int, Tuple[str, int]]]:
+    """변경 기록을 항목별 최종 변경으로 합침 (게시물 ID -> op, 댓글 ID -> (op, 게시물 ID))"""
+    posts: Dict[int, str] = {}
+    comments: Dict[int, Tuple[str, int]] = {}
+    for change in changes:
+        if change.entity == change_log.COMMENT:
+            comments[change.entity_id] = (change.op, change.post_id)
+        elif change.op != change_log.COUNTS or change.entity_id not in posts:
+            posts[change.entity_id] = change.op
+    return posts, comments
+
+def _comment_to_dict(comment) -> Dict[str, Any]:
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "post_id": comment.post_id,
+        "author": {
+            "id": comment.author_id,
+            "username": comment.author_username,
+            "profile_image_url": comment.author_profile_image_url
+        },
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at
+    }
+
+def get_changes(db: Session, since: Optional[int], limit: int = 500, username: Optional[str] = None) -> Dict[str, Any]:
+    """since 이후의 게시물/댓글/좋아요 수 변경과 삭제 표시, 새 워터마크 조회"""
+    oldest, newest = _watermarks(db)
+    result = {
+        "watermark": newest or 0,
+        "has_more": False,
+        "posts": [],
+        "likes": [],
+        "comments": [],
+        "deleted_posts": [],
+        "deleted_comments": []
+    }
+    if since is None:
+        return result
+    if since > (newest or 0) or (oldest is not None and since < oldest - 1):
+        raise HTTPException(status_code=410, detail="Sync watermark expired, reload and sync again")
+    if since == (newest or 0):
+        result["watermark"] = since
+        return result
+
+    changes = db.execute(
+        select(models.Change.seq, models.Change.entity, models.Change.entity_id, models.Change.post_id, models.Change.op)
+        .where(models.Change.seq > since)
+        .order_by(models.Change.seq)
+        .limit(limit + 1)
+    ).all()
+    result["has_more"] = len(changes) > limit
+    changes = changes[:limit]
+    result["watermark"] = changes[-1].seq
+
+    posts, comments = _merge(changes)
+    upserted = [post_id for post_id, op in posts.items() if op == change_log.UPSERT]
+    counted = [post_id for post_id, op in posts.items() if op == change_log.COUNTS]
+
+    post_rows = {
+        row.id: row for row in
+        post_service.post_rows(db).filter(models.Post.id.in_(upserted)).all()
+    } if upserted else {}
+    count_rows = {
+        row.id: row for row in db.query(
+            models.Post.id, models.Post.likes_count, models.Post.comments_count
+        ).filter(models.Post.id.in_(counted)).all()
+    } if counted else {}
+    liked = post_service.liked_post_ids(db, list(post_rows) + list(count_rows), username)
+
+    for post_id in upserted:
+        if post_id in post_rows:
+            data = post_service.post_to_dict(post_rows[post_id])
+            data["likes_count"] = post_service.buffered_likes_count(post_id, data["likes_count"])
+            data["is_liked"] = post_id in liked
+            result["posts"].append(data)
+    for post_id in counted:
+        if post_id in count_rows:
+            row = count_rows[post_id]
+            result["likes"].append({
+                "post_id": post_id,
+                "is_liked": post_id in liked,
+                "likes_count": post_service.buffered_likes_count(post_id, row.likes_count),
+                "comments_count": row.comments_count
+            })
+    result["deleted_posts"] = [post_id for post_id, op in posts.items() if op == change_log.DELETE]
+
+    comment_ids = [comment_id for comment_id, (op, _) in comments.items() if op == change_log.UPSERT]
+    comment_rows = {
+        row.id: row for row in
+        comment_service.comment_rows(db).filter(models.Comment.id.in_(comment_ids)).all()
+    } if comment_ids else {}
+    result["comments"] = [
+        _comment_to_dict(comment_rows[comment_id]) for comment_id in comment_ids if comment_id in comment_rows
+    ]
+    result["deleted_comments"] = [
+        {"id": comment_id, "post_id": post_id}
+        for comment_id, (op, post_id) in comments.items() if op == change_log.DELETE
+    ]
+    return result
@@ -1,25 +1,107 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from app.models import models, schemas
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from fastapi import HTTPException
+from app.controllers import pagination, search_service
+from app.cache import MemoryCache
+from app.config import settings
+
+# 사용자 이름 -> ID 캐시 (프로세스 내, 크기 제한)
+#
+# 사용자 이름과 ID는 바뀌지 않으므로 요청마다 users 테이블을 조회하지 않도록
+# 존재하는 사용자만 캐시합니다. 사용자 정보를 바꾸거나 삭제하는 코드는
+# forget_user로 캐시에서 지워야 합니다.
+user_id_cache = MemoryCache(settings.user_cache_ttl, settings.user_cache_size)
+
+def _default_profile_image(username: str) -> str:
+    """기본 프로필 이미지 URL"""
+    return "https://api.dicebear.com/7.x/avataaars/svg?seed=" + username
 
 def get_user_by_username(db: Session, username: str):
     """사용자 이름으로 사용자 검색"""
     return db.query(models.User).filter(models.User.username == username).first()
 
+def get_user_ids(db: Session, usernames: Iterable[str]) -> Dict[str, int]:
+    """여러 사용자 이름의 ID를 한 번에 조회 (캐시 우선, 없는 사용자는 결과에서 제외)"""
+    usernames = list(dict.fromkeys(usernames))
+    user_ids = user_id_cache.get_many(usernames)
+    
+    missing = [username for username in usernames if username not in user_ids]
+    if missing:
+        loaded = dict(db.execute(
+            select(models.User.username, models.User.id).where(models.User.username.in_(missing))
+        ).all())
+        user_id_cache.set_many(loaded)
+        user_ids.update(loaded)
+    return user_ids
+
+def get_user_id(db: Session, username: str) -> Optional[int]:
+    """사용자 이름으로 사용자 ID 조회 (캐시 우선, 없는 사용자는 None)"""
+    return get_user_ids(db, [username]).get(username)
+
+def get_or_create_user_ids(db: Session, usernames: Iterable[str], commit: bool = True) -> Dict[str, int]:
+    """여러 사용자 이름의 ID를 조회하고 없는 사용자는 생성 (동시 요청에도 안전)
+
+    새 사용자는 INSERT ... ON CONFLICT DO NOTHING으로 한 번에 추가하므로, 같은 이름으로
+    동시에 가입해도 IntegrityError 없이 같은 ID를 받습니다. commit=False이면 커밋하지 않고
+    호출자의 트랜잭션에 포함하며, 롤백될 수 있으므로 새 사용자의 ID는 캐시하지 않습니다.
+    """
+    usernames = list(dict.fromkeys(usernames))
+    user_ids = get_user_ids(db, usernames)
+    missing = [username for username in usernames if username not in user_ids]
+    if not missing:
+        return user_ids
+    
+    values = [
+        {"username": username, "profile_image_url": _default_profile_image(username)}
+        for username in missing
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        db.execute(
+            dialect_insert(models.User).on_conflict_do_nothing(index_elements=[models.User.username]),
+            values
+        )
+    else:
+        # ON CONFLICT를 지원하지 않는 데이터베이스는 세이브포인트 안에서 하나씩 삽입
+        for row in values:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(models.User).values(**row))
+            except IntegrityError:
+                pass
+    if not commit:
+        user_ids.update(db.execute(
+            select(models.User.username, models.User.id).where(models.User.username.in_(missing))
+        ).all())
+        return user_ids
+    db.commit()
+    
+    user_ids.update(get_user_ids(db, missing))
+    return user_ids
+
+def get_or_create_user_id(db: Session, username: str) -> int:
+    """사용자 이름으로 사용자 ID 조회, 없으면 생성 (동시 요청에도 안전)"""
+    return get_or_create_user_ids(db, [username])[username]
+
+def forget_user(username: str):
+    """사용자 이름 -> ID 캐시에서 제거 (사용자 변경/삭제 시 호출)"""
+    user_id_cache.delete(username)
+
 def get_user_by_id(db: Session, user_id: int):
     """ID로 사용자 검색"""
     return db.query(models.User).filter(models.User.id == user_id).first()
 
 def create_user(db: Session, user: schemas.UserCreate):
     """새 사용자 생성"""
-    # 기본 프로필 이미지 URL
-    default_image = "https://api.dicebear.com/7.x/avataaars/svg?seed=" + user.username
-    
     db_user = models.User(
         username=user.username,
-        profile_image_url=default_image
+        profile_image_url=_default_profile_image(user.username)
     )
     db.add(db_user)
     db.commit()
@@ -28,15 +110,7 @@ def create_user(db: Session, user: schemas.UserCreate):
 
 def login_user(db: Session, username: str):
     """사용자 로그인 (없으면 새로 생성)"""
-    # 기존 사용자 검색
-    user = get_user_by_username(db, username)
-    
-    # 사용자가 없으면 새로 생성
-    if not user:
-        new_user = schemas.UserCreate(username=username)
-        user = create_user(db, new_user)
-    
-    return user
+    return get_user_by_id(db, get_or_create_user_id(db, username))
 
 def get_user_profile(db: Session, user_id: int):
     """사용자 프로필 정보 조회"""
@@ -44,19 +118,26 @@ def get_user_profile(db: Session, user_id: int):
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # 게시물 수 계산
+    # 게시물 수 및 댓글 수 계산
     posts_count = db.query(func.count(models.Post.id)).filter(models.Post.author_id == user_id).scalar()
+    comments_count = db.query(func.count(models.Comment.id)).filter(models.Comment.author_id == user_id).scalar()
     
-    return user, posts_count
+    return user, posts_count, comments_count
 
-def search_users(db: Session, username: str, page: int, limit: int) -> Tuple[List[models.User], int]:
-    """사용자 이름으로 검색"""
-    # 총 사용자 수 조회 (검색어와 일치하는)
-    total = db.query(func.count(models.User.id)).filter(models.User.username.ilike(f"%{username}%")).scalar()
-    
-    # 페이지네이션 적용한 사용자 목록 조회
-    users = db.query(models.User).filter(
-        models.User.username.ilike(f"%{username}%")
-    ).offset((page - 1) * limit).limit(limit).all()
+def search_users(
+    db: Session,
+    username: str,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    count: str = "exact",
+    sort: str = "recent"
+) -> Tuple[List[Row], Optional[int], Optional[str]]:
+    """사용자 이름으로 검색 (검색 인덱스 사용, id/username/profile_image_url 컬럼만 조회한 Row 반환)"""
+    users, total, next_cursor = search_service.search_page(
+        db,
+        db.query(models.User.id, models.User.username, models.User.profile_image_url),
+        models.User, "users_fts", username, sort, page, limit, cursor, count
+    )
     
-    return users, total
\ No newline at end of file
+    return users, total, next_cursor
\ No newline at end of file
@@ -1,21 +1,98 @@
-import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
+from typing import Any, Dict
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
+from app.config import settings
+
 # 데이터베이스 URL 설정 (기본값은 SQLite)
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./threads_app.db")
+DATABASE_URL = settings.database_url
+
+# 비동기 데이터베이스 사용 여부 (true면 라우트가 AsyncSession으로 처리됨)
+DATABASE_ASYNC = settings.database_async
+
+# 비동기 드라이버 URL (지정하지 않으면 DATABASE_URL에서 유도)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def _async_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환"""
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+ASYNC_DATABASE_URL = settings.async_database_url or _async_url(DATABASE_URL)
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """데이터베이스 종류별 엔진/커넥션 풀 옵션"""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        # 메모리 DB는 연결마다 별도 DB가 되므로 하나의 연결을 공유
+        if url.database in (None, "", ":memory:"):
+            return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+        # 파일 DB는 연결 비용이 작아 재활용/사전 확인 없이 크기와 대기 시간만 설정
+        return {
+            "connect_args": {"check_same_thread": False},
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+        }
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+def _apply_sqlite_pragmas(bind: Engine):
+    """SQLite 연결마다 PRAGMA 적용
+
+    WAL 모드에서는 읽기가 쓰기를 기다리지 않고, synchronous=NORMAL은 WAL에서
+    커밋마다 fsync하지 않으며, busy_timeout은 쓰기 잠금 충돌 시 즉시 실패하지 않고 대기합니다.
+    """
+    if bind.dialect.name != "sqlite":
+        return
+
+    pragmas = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "busy_timeout": settings.sqlite_busy_timeout,
+    }
+
+    @event.listens_for(bind, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            if value not in (None, ""):
+                cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
 # SQLAlchemy 엔진 생성
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+_apply_sqlite_pragmas(engine)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 및 세션 팩토리 생성 (비동기 모드에서만, 드라이버는 선택 의존성)
+async_engine = None
+AsyncSessionLocal = None
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL))
+    _apply_sqlite_pragmas(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 # 모델의 베이스 클래스 생성
 Base = declarative_base()
 
@@ -25,4 +102,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 비동기 데이터베이스 세션 의존성 함수
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
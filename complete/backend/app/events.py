@@ -0,0 +1,311 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+import asyncio
+import json
+import logging
+import threading
+
+from app.config import settings
+
+# 실시간 이벤트 (GET /events, Server-Sent Events)
+#
+# 게시물/댓글 작성·수정·삭제와 좋아요 수 변경을 커밋 후에 토픽별로 발행하고, 구독 중인
+# 연결에 바로 보냅니다. 클라이언트는 목록/상세를 주기적으로 다시 조회하는 대신 필요한
+# 토픽만 구독하고, 이벤트를 받았을 때만 해당 항목을 조회(또는 GET /sync)합니다.
+#
+# - 토픽: feed(새 게시물, 게시물 수정/삭제), post:{id}(게시물 수정/삭제, 댓글, 좋아요 수),
+#   user:{id}(사용자가 작성/수정/삭제한 게시물과 댓글)
+# - 이벤트는 발행할 때 SSE 프레임으로 한 번만 인코딩하고, 구독자마다 크기가 제한된
+#   큐(EVENTS_QUEUE_SIZE)에 넣습니다. 큐가 가득 찬 느린 구독자는 쌓인 이벤트를 버리고
+#   overflow 이벤트를 보낸 뒤 연결을 끊으므로, 다시 연결한 뒤 GET /sync로 따라잡아야 합니다.
+# - 구독은 이벤트 루프에서 대기하므로 연결마다 스레드를 쓰지 않습니다. 다른 스레드(동기
+#   핸들러)에서 발행하면 이벤트 루프마다 한 번씩 넘겨 구독자에게 나눠 줍니다.
+# - memory 브로커는 프로세스마다 따로 있으므로, 여러 워커가 이벤트를 공유하려면 redis
+#   브로커(Redis pub/sub)를 사용합니다.
+
+logger = logging.getLogger(__name__)
+
+FEED = "feed"
+
+REDIS_CHANNEL = "threads:events"
+
+# 연결 직후 보내는 재연결 대기 시간(밀리초), 하트비트, 느린 구독자 종료 알림
+RETRY_FRAME = b"retry: 3000\n\n"
+HEARTBEAT_FRAME = b": ping\n\n"
+OVERFLOW_FRAME = b"event: overflow\ndata: {}\n\n"
+
+def post_topic(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def user_topic(user_id: int) -> str:
+    return f"user:{user_id}"
+
+def encode(event_type: str, data: Dict[str, Any]) -> bytes:
+    """SSE 프레임으로 인코딩"""
+    return f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+class Subscription:
+    """구독 하나 (구독한 이벤트 루프에서만 읽고 쓰는 크기 제한 큐)"""
+
+    def __init__(self, topics: Iterable[str], queue_size: int):
+        self.topics = frozenset(topics)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.dropped = False
+
+    def deliver(self, frame: bytes) -> bool:
+        """큐에 프레임 추가 (이벤트 루프에서 호출, 가득 차면 느린 구독자로 보고 종료 알림)"""
+        if self.dropped:
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            self.dropped = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW_FRAME)
+            return False
+
+    def _heartbeat(self):
+        if self.queue.empty():
+            self.queue.put_nowait(HEARTBEAT_FRAME)
+
+    async def next(self, heartbeat: float) -> bytes:
+        """쌓인 프레임을 모두 합쳐 반환 (heartbeat초 동안 없으면 하트비트 프레임)"""
+        # 대기마다 태스크를 만들지 않도록 타이머로 하트비트를 넣음
+        timer = self.loop.call_later(heartbeat, self._heartbeat)
+        try:
+            frames = [await self.queue.get()]
+        finally:
+            timer.cancel()
+        while not self.queue.empty():
+            frames.append(self.queue.get_nowait())
+        return b"".join(frames)
+
+class EventBroker(ABC):
+    """이벤트 브로커 인터페이스 (발행 방식만 다르고 구독자에게 나눠 주는 방식은 같음)"""
+
+    backend = "base"
+    enabled = True
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._lock = threading.Lock()
+        self._topics: Dict[str, Set[Subscription]] = defaultdict(set)
+        self.subscribers = 0
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @abstractmethod
+    def publish(self, event_type: str, data: Dict[str, Any], topics: List[str]):
+        """이벤트 발행 (커밋 후 호출)"""
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def full(self) -> bool:
+        return self.subscribers >= self.max_subscribers
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        """구독 추가 (이벤트 루프에서 호출)"""
+        subscription = Subscription(topics, self.queue_size)
+        with self._lock:
+            for topic in subscription.topics:
+                self._topics[topic].add(subscription)
+            self.subscribers += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._topics.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[topic]
+            self.subscribers -= 1
+
+    def _fan_out(self, topics: Iterable[str], frame: bytes):
+        """이 프로세스에서 topics를 구독 중인 연결에 프레임 전달 (한 연결에는 한 번만)"""
+        with self._lock:
+            self.published += 1
+            targets: Set[Subscription] = set()
+            for topic in topics:
+                targets.update(self._topics.get(topic, ()))
+        if not targets:
+            return
+
+        by_loop: Dict[asyncio.AbstractEventLoop, List[Subscription]] = defaultdict(list)
+        for subscription in targets:
+            by_loop[subscription.loop].append(subscription)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, subscriptions in by_loop.items():
+            if loop is running:
+                self._deliver(subscriptions, frame)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._deliver, subscriptions, frame)
+            except RuntimeError:  # 이벤트 루프가 이미 닫힘
+                pass
+
+    def _deliver(self, subscriptions: List[Subscription], frame: bytes):
+        delivered = dropped = 0
+        for subscription in subscriptions:
+            was_dropped = subscription.dropped
+            if subscription.deliver(frame):
+                delivered += 1
+            elif not was_dropped:
+                dropped += 1
+        with self._lock:
+            self.delivered += delivered
+            self.dropped += dropped
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "subscribers": self.subscribers,
+            "topics": len(self._topics),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+class NullBroker(EventBroker):
+    """실시간 이벤트를 사용하지 않을 때의 브로커 (발행한 이벤트는 버림)"""
+
+    backend = "none"
+    enabled = False
+
+    def publish(self, event_type: str, data: Dict[str, Any], topics: List[str]):
+        pass
+
+class MemoryBroker(EventBroker):
+    """프로세스 내 브로커 (발행한 워커의 구독자에게만 전달)"""
+
+    backend = "memory"
+
+    def publish(self, event_type: str, data: Dict[str, Any], topics: List[str]):
+        self._fan_out(topics, encode(event_type, data))
+
+class RedisBroker(EventBroker):
+    """Redis pub/sub으로 여러 워커가 이벤트를 공유하는 브로커
+
+    발행한 이벤트는 한 채널로 보내고, 워커마다 수신 스레드가 받아 자기 구독자에게
+    나눠 줍니다. redis.Redis 또는 테스트용 fakeredis.FakeRedis 클라이언트를 받습니다.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, queue_size: int, max_subscribers: int, channel: str = REDIS_CHANNEL):
+        super().__init__(queue_size, max_subscribers)
+        self.client = client
+        self.channel = channel
+        self._pubsub = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, event_type: str, data: Dict[str, Any], topics: List[str]):
+        message = json.dumps({"type": event_type, "data": data, "topics": topics})
+        try:
+            self.client.publish(self.channel, message)
+        except Exception:
+            # 이미 커밋된 쓰기 요청은 실패시키지 않음 (구독자는 GET /sync로 따라잡음)
+            logger.exception("Failed to publish event")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        self._thread = threading.Thread(target=self._run, name="event-broker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        self._pubsub.close()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                message = self._pubsub.get_message(timeout=1.0)
+            except Exception:
+                logger.exception("Failed to receive events")
+                self._stopped.wait(1.0)
+                continue
+            if message is None or message["type"] != "message":
+                continue
+            try:
+                event = json.loads(message["data"])
+                self._fan_out(event["topics"], encode(event["type"], event["data"]))
+            except Exception:
+                # 잘못된 메시지 하나 때문에 수신 스레드가 멈추지 않도록 건너뜀
+                logger.exception("Failed to dispatch event")
+
+def create_broker() -> EventBroker:
+    """설정에 맞는 이벤트 브로커 생성"""
+    if settings.event_broker == "redis":
+        import redis  # 선택 의존성
+
+        return RedisBroker(redis.Redis.from_url(settings.redis_url), settings.events_queue_size, settings.events_max_subscribers)
+    if settings.event_broker == "memory":
+        return MemoryBroker(settings.events_queue_size, settings.events_max_subscribers)
+    return NullBroker(settings.events_queue_size, settings.events_max_subscribers)
+
+broker: EventBroker = create_broker()
+
+def set_broker(backend: EventBroker):
+    """이벤트 브로커 교체 (예: 테스트에서 fakeredis 클라이언트를 사용하는 RedisBroker)"""
+    global broker
+    broker = backend
+
+def get_broker() -> EventBroker:
+    """현재 이벤트 브로커"""
+    return broker
+
+def publish_post(event_type: str, post_id: int, author_id: int):
+    """게시물 이벤트 (post_created, post_updated, post_deleted)"""
+    topics = [FEED, user_topic(author_id)]
+    if event_type != "post_created":
+        topics.append(post_topic(post_id))
+    broker.publish(event_type, {"post_id": post_id, "author_id": author_id}, topics)
+
+def publish_comment(event_type: str, comment_id: int, post_id: int, author_id: int):
+    """댓글 이벤트 (comment_created, comment_updated, comment_deleted)"""
+    broker.publish(
+        event_type,
+        {"comment_id": comment_id, "post_id": post_id, "author_id": author_id},
+        [post_topic(post_id), user_topic(author_id)]
+    )
+
+def publish_likes(post_id: int, likes_count: int):
+    """좋아요 수 변경 이벤트"""
+    broker.publish("likes", {"post_id": post_id, "likes_count": likes_count}, [post_topic(post_id)])
+
+async def stream(topics: List[str], heartbeat: float) -> AsyncIterator[bytes]:
+    """구독한 토픽의 SSE 스트림 (이벤트가 없으면 heartbeat초마다 주석 프레임)"""
+    subscription = broker.subscribe(topics)
+    try:
+        yield RETRY_FRAME
+        while True:
+            frames = await subscription.next(heartbeat)
+            yield frames
+            # 느린 구독자로 종료된 연결 (overflow가 마지막 프레임)
+            if frames.endswith(OVERFLOW_FRAME):
+                return
+    finally:
+        broker.unsubscribe(subscription)
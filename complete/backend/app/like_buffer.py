@@ -0,0 +1,177 @@
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+import atexit
+import logging
+import threading
+
+from app.config import settings
+
+# 좋아요 쓰기 지연(write-behind) 버퍼
+#
+# 인기 게시물에 좋아요가 몰리면 요청마다 커밋하면서 같은 행과 SQLite의 단일 쓰기 잠금을
+# 두고 경합합니다. 버퍼를 켜면 좋아요/취소 이벤트를 메모리에 모아 (게시물, 사용자)별
+# 마지막 상태만 남기고, 짧은 주기로 한 트랜잭션에 모아 반영합니다.
+#
+# - 읽기(likes_count, is_liked)는 아직 반영되지 않은 이벤트를 더해 보여 줍니다.
+# - 종료 시(lifespan 종료, 프로세스 정상 종료) 남은 이벤트를 모두 반영합니다.
+#   프로세스가 강제 종료되면 마지막 반영 이후의 이벤트는 사라질 수 있습니다.
+# - 버퍼는 프로세스마다 따로 있으므로, 다른 워커는 반영된 뒤에야 변경을 봅니다.
+
+logger = logging.getLogger(__name__)
+
+LikeKey = Tuple[int, int]  # (게시물 ID, 사용자 ID)
+
+class LikeBuffer:
+    """좋아요/취소 이벤트를 모아 주기적으로 일괄 반영하는 버퍼"""
+
+    def __init__(self, enabled: bool, interval: float, max_events: int):
+        self.enabled = enabled
+        self.interval = interval
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # 반영 스레드 시작/종료 (처음 좋아요가 여러 스레드에서 동시에 와도 스레드는 하나)
+        self._thread_lock = threading.Lock()
+        self._atexit_registered = False
+        # 아직 반영하지 않은 이벤트와, 반영 중인 이벤트 (반영이 끝날 때까지 읽기에 포함)
+        self._pending: Dict[LikeKey, bool] = {}
+        self._pending_deltas: Dict[int, int] = {}
+        self._flushing: Dict[LikeKey, bool] = {}
+        self._flushing_deltas: Dict[int, int] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushed_events = 0
+        self.flushes = 0
+
+    def _state_locked(self, key: LikeKey) -> Optional[bool]:
+        if key in self._pending:
+            return self._pending[key]
+        return self._flushing.get(key)
+
+    def state(self, post_id: int, user_id: int) -> Optional[bool]:
+        """반영되지 않은 좋아요 상태 (버퍼에 없으면 None)"""
+        with self._lock:
+            return self._state_locked((post_id, user_id))
+
+    def delta(self, post_id: int) -> int:
+        """반영되지 않은 좋아요 수 변화량"""
+        with self._lock:
+            return self._pending_deltas.get(post_id, 0) + self._flushing_deltas.get(post_id, 0)
+
+    def overlay_liked(self, user_id: int, post_ids: Iterable[int], liked: Set[int]) -> Set[int]:
+        """DB에서 조회한 좋아요 게시물 집합에 버퍼의 상태를 덮어씀"""
+        result = set(liked)
+        with self._lock:
+            for post_id in post_ids:
+                state = self._state_locked((post_id, user_id))
+                if state is True:
+                    result.add(post_id)
+                elif state is False:
+                    result.discard(post_id)
+        return result
+
+    def record(self, post_id: int, user_id: int, liked: bool, stored: bool) -> bool:
+        """좋아요 이벤트 기록 후 상태가 바뀌었는지 반환
+
+        stored는 DB에 반영된 상태이며, 버퍼에 같은 (게시물, 사용자) 이벤트가 있으면 그 상태를 우선합니다.
+        """
+        self.start()
+        key = (post_id, user_id)
+        with self._lock:
+            previous = self._state_locked(key)
+            if previous is None:
+                previous = stored
+            if previous == liked:
+                return False
+            self._pending[key] = liked
+            self._pending_deltas[post_id] = self._pending_deltas.get(post_id, 0) + (1 if liked else -1)
+            full = len(self._pending) >= self.max_events
+        if full:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """모아 둔 이벤트를 한 트랜잭션으로 반영하고 반영한 이벤트 수를 반환"""
+        from app.database import SessionLocal
+        from app.controllers import post_service
+
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._flushing, self._pending = self._pending, {}
+                self._flushing_deltas, self._pending_deltas = self._pending_deltas, {}
+                events = self._flushing
+
+            db = SessionLocal()
+            try:
+                changed = post_service.apply_like_events(db, events)
+            except Exception:
+                db.rollback()
+                # 실패한 이벤트는 버퍼로 되돌려 다음 주기에 다시 반영 (그 사이의 새 이벤트가 우선)
+                with self._lock:
+                    for key, liked in events.items():
+                        self._pending.setdefault(key, liked)
+                    for post_id, delta in self._flushing_deltas.items():
+                        self._pending_deltas[post_id] = self._pending_deltas.get(post_id, 0) + delta
+                    self._flushing, self._flushing_deltas = {}, {}
+                raise
+            finally:
+                db.close()
+
+            with self._lock:
+                for post_id in changed:
+                    post_service.invalidate_post(post_id)
+                self._flushing, self._flushing_deltas = {}, {}
+                self.flushes += 1
+                self.flushed_events += len(events)
+            return len(events)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered likes")
+
+    def start(self):
+        """반영 스레드 시작 (버퍼를 사용하지 않거나 이미 시작했으면 아무것도 하지 않음)"""
+        if not self.enabled or self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="like-buffer", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def stop(self):
+        """반영 스레드를 멈추고 남은 이벤트를 모두 반영"""
+        with self._thread_lock:
+            if self._thread is not None:
+                self._stopped.set()
+                self._wake.set()
+                self._thread.join()
+                self._thread = None
+        self.flush()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending) + len(self._flushing)
+        return {
+            "enabled": self.enabled,
+            "pending_events": pending,
+            "flushes": self.flushes,
+            "flushed_events": self.flushed_events,
+        }
+
+like_buffer = LikeBuffer(
+    settings.like_buffer_enabled,
+    settings.like_buffer_flush_interval,
+    settings.like_buffer_max_events
+)
@@ -0,0 +1,324 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청/데이터베이스 계측 (Prometheus 텍스트 형식)
+#
+# 외부 의존성 없이 카운터, 게이지, 히스토그램을 메모리에 모으고 GET /metrics 에서
+# Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 요청마다 하는 일은 시각 측정과
+# 히스토그램 버킷 몇 개를 잠금 안에서 더하는 것뿐이며, 캐시/좋아요 버퍼/커넥션 풀
+# 상태처럼 이미 집계된 값은 /metrics 요청 시점에 읽어 옵니다.
+#
+# - 요청 지연 시간, 요청 수, SQL 문 수, DB 시간은 라우트 경로 템플릿(예: /posts/{postId})
+#   별로 기록하여 라벨 수가 URL 수만큼 늘어나지 않게 합니다. 일치하는 라우트가 없는
+#   요청은 "unmatched" 로 기록합니다.
+# - 요청별 SQL 문 수와 DB 시간은 ContextVar로 현재 요청에 모읍니다. 동기 핸들러(스레드풀),
+#   비동기 모드(run_sync), 스트리밍 응답 모두 요청의 컨텍스트를 이어받습니다.
+# - 메트릭은 프로세스마다 따로 모이므로 여러 워커로 실행하면 워커별로 수집합니다.
+
+# 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 SQL 문 수 버킷
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    """라벨별 값을 가진 메트릭의 공통 부분"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._lock = threading.Lock()
+        # 라벨이 없는 메트릭은 관측 전에도 0으로 내보냄
+        self._values: Dict[LabelValues, Any] = {} if labels else {(): 0}
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+class Counter(Metric):
+    """증가만 하는 값"""
+
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+class Gauge(Metric):
+    """증가/감소하는 현재 값"""
+
+    kind = "gauge"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+class Histogram(Metric):
+    """버킷별 관측 수와 합계"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        self._values = {}
+
+    def observe(self, labels: LabelValues, value: float):
+        # 버킷별 관측 수(누적 아님, 마지막은 +Inf), 합계를 함께 갱신
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+        lines = self.header()
+        bucket_labels = self.labels + ("le",)
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels, labels + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}")
+        return lines
+
+class RequestStats:
+    """현재 요청(ASGI scope)에서 실행한 SQL 문 수와 DB 시간"""
+
+    __slots__ = ("scope", "statements", "db_time")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.statements = 0
+        self.db_time = 0.0
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def current_route() -> Optional[str]:
+    """현재 요청의 "메서드 경로 템플릿" (요청 밖이거나 메트릭을 끈 경우 None)"""
+    stats = _request_stats.get()
+    if stats is None:
+        return None
+    route = stats.scope.get("route")
+    return f'{stats.scope["method"]} {getattr(route, "path", stats.scope["path"])}'
+
+ROUTE_LABELS = ("method", "route")
+
+requests_total = Counter("http_requests_total", "HTTP requests by route and status code", ROUTE_LABELS + ("status",))
+request_duration = Histogram("http_request_duration_seconds", "HTTP request latency", ROUTE_LABELS)
+requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being processed")
+request_statements = Histogram("db_statements_per_request", "SQL statements executed per HTTP request", ROUTE_LABELS, STATEMENT_BUCKETS)
+request_db_time = Histogram("db_time_per_request_seconds", "Time spent executing SQL per HTTP request", ROUTE_LABELS)
+statements_total = Counter("db_statements_total", "SQL statements executed (including background work)")
+pool_checkout = Histogram("db_pool_checkout_seconds", "Time to check out a connection from the pool (including waiting)", ("engine",))
+
+METRICS: List[Metric] = [
+    requests_total, request_duration, requests_in_flight,
+    request_statements, request_db_time, statements_total, pool_checkout,
+]
+
+def observe_request(method: str, route: str, status: int, elapsed: float, stats: RequestStats):
+    """요청 하나의 메트릭 기록"""
+    labels = (method, route)
+    requests_total.inc(labels + (str(status),))
+    request_duration.observe(labels, elapsed)
+    request_statements.observe(labels, stats.statements)
+    request_db_time.observe(labels, stats.db_time)
+
+def instrument_engine(bind: Engine, name: str = "sync"):
+    """엔진의 SQL 실행 시간과 커넥션 풀 체크아웃 대기 시간 계측"""
+
+    @event.listens_for(bind, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(bind, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        statements_total.inc()
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time += time.perf_counter() - context._metrics_started
+
+    # 풀에는 체크아웃 전 이벤트가 없으므로 연결을 꺼내는 Engine.raw_connection()을 감싸
+    # 대기 시간을 측정 (engine.dispose()로 풀이 바뀌어도 유지됨)
+    raw_connection = bind.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            pool_checkout.observe((name,), time.perf_counter() - started)
+
+    bind.raw_connection = timed_raw_connection
+
+def _pool_lines(engines: Dict[str, Engine]) -> List[str]:
+    """커넥션 풀 상태 (크기를 알 수 있는 풀만)"""
+    samples = {"db_pool_size": [], "db_pool_checked_out": [], "db_pool_overflow": []}
+    for name, bind in engines.items():
+        pool = bind.pool
+        for metric, method in (("db_pool_size", "size"), ("db_pool_checked_out", "checkedout"), ("db_pool_overflow", "overflow")):
+            if hasattr(pool, method):
+                # QueuePool.overflow()는 풀이 다 차기 전에는 음수이므로 0으로 내보냄
+                samples[metric].append(f'{metric}{{engine="{name}"}} {max(getattr(pool, method)(), 0)}')
+    helps = {
+        "db_pool_size": "Configured connection pool size",
+        "db_pool_checked_out": "Connections currently checked out",
+        "db_pool_overflow": "Connections opened beyond the pool size",
+    }
+    lines = []
+    for metric, values in samples.items():
+        if values:
+            lines += [f"# HELP {metric} {helps[metric]}", f"# TYPE {metric} gauge"] + values
+    return lines
+
+def _cache_lines(caches: Dict[str, Dict[str, Any]]) -> List[str]:
+    """캐시별 적중/실패/제거 수와 적중률"""
+    lines = []
+    for metric, key, kind, help in (
+        ("cache_hits_total", "hits", "counter", "Cache lookups that found a value"),
+        ("cache_misses_total", "misses", "counter", "Cache lookups that found nothing"),
+        ("cache_evictions_total", "evictions", "counter", "Entries evicted to stay within the size limit"),
+        ("cache_hit_ratio", "hit_rate", "gauge", "Hits divided by lookups since start"),
+        ("cache_entries", "entries", "gauge", "Entries currently stored (in-process caches only)"),
+    ):
+        values = [f'{metric}{{cache="{name}"}} {_format_value(info[key])}' for name, info in caches.items() if key in info]
+        if values:
+            lines += [f"# HELP {metric} {help}", f"# TYPE {metric} {kind}"] + values
+    return lines
+
+def _like_buffer_lines(info: Dict[str, Any]) -> List[str]:
+    return [
+        "# HELP like_buffer_pending_events Buffered like events not yet written",
+        "# TYPE like_buffer_pending_events gauge",
+        f"like_buffer_pending_events {info['pending_events']}",
+        "# HELP like_buffer_flushes_total Buffer flushes written to the database",
+        "# TYPE like_buffer_flushes_total counter",
+        f"like_buffer_flushes_total {info['flushes']}",
+        "# HELP like_buffer_flushed_events_total Like events written by buffer flushes",
+        "# TYPE like_buffer_flushed_events_total counter",
+        f"like_buffer_flushed_events_total {info['flushed_events']}",
+    ]
+
+def _event_lines(info: Dict[str, Any]) -> List[str]:
+    return [
+        "# HELP events_subscribers Open event stream connections",
+        "# TYPE events_subscribers gauge",
+        f"events_subscribers {info['subscribers']}",
+        "# HELP events_published_total Events fanned out to this worker's subscribers",
+        "# TYPE events_published_total counter",
+        f"events_published_total {info['published']}",
+        "# HELP events_delivered_total Events queued for event stream connections",
+        "# TYPE events_delivered_total counter",
+        f"events_delivered_total {info['delivered']}",
+        "# HELP events_dropped_subscribers_total Slow event stream connections closed on queue overflow",
+        "# TYPE events_dropped_subscribers_total counter",
+        f"events_dropped_subscribers_total {info['dropped']}",
+    ]
+
+def render() -> str:
+    """모든 메트릭을 Prometheus 텍스트 형식으로 반환"""
+    from app import cache
+    from app.controllers import user_service
+    from app.database import engine, async_engine
+    from app.like_buffer import like_buffer
+    from app import events
+
+    lines: List[str] = []
+    for metric in METRICS:
+        lines += metric.render()
+
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    lines += _pool_lines(engines)
+    lines += _cache_lines({"read": cache.get_cache().info(), "user_id": user_service.user_id_cache.info()})
+    lines += _like_buffer_lines(like_buffer.info())
+    lines += _event_lines(events.get_broker().info())
+    return "\n".join(lines) + "\n"
+
+class MetricsMiddleware:
+    """요청 지연 시간, 진행 중인 요청 수, 요청별 SQL 문 수/DB 시간을 기록하는 ASGI 미들웨어
+
+    응답 본문을 모두 보낸 뒤 기록하므로 스트리밍 응답의 시간과 쿼리도 포함합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._endpoint_routes: Optional[Dict[Callable, str]] = None
+
+    def _route(self, scope) -> str:
+        """라우트 경로 템플릿 (scope에 route가 없는 Starlette 버전은 endpoint로 찾음)"""
+        route = scope.get("route")
+        if route is not None and hasattr(route, "path"):
+            return route.path
+        if self._endpoint_routes is None and "app" in scope:
+            self._endpoint_routes = {
+                route.endpoint: route.path
+                for route in scope["app"].routes if hasattr(route, "endpoint")
+            }
+        return (self._endpoint_routes or {}).get(scope.get("endpoint"), "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _request_stats.set(stats)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.dec()
+            _request_stats.reset(token)
+            observe_request(scope["method"], self._route(scope), status, elapsed, stats)
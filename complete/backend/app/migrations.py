@@ -0,0 +1,91 @@
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Callable, List, Tuple
+from app.database import engine, Base
+
+# Base.metadata.create_all 은 없는 테이블만 생성하고 기존 테이블에 컬럼이나
+# 인덱스를 추가하지 않습니다. 운영 중인 데이터베이스에 필요한 스키마 변경은
+# 아래 MIGRATIONS 에 버전 순서대로 추가하고, 적용된 버전은 schema_migrations
+# 테이블에 기록합니다.
+#
+# 여러 워커가 새 데이터베이스에서 동시에 시작해도 한 번만 적용되도록, 테이블 생성과
+# 모든 마이그레이션을 배타적 잠금(SQLite: BEGIN IMMEDIATE, PostgreSQL: 트랜잭션 advisory
+# 잠금)을 잡은 한 트랜잭션에서 실행하고, 잠금을 잡은 뒤 적용된 버전을 다시 읽습니다.
+# 늦게 잠금을 얻은 워커는 이미 적용된 버전을 건너뜁니다.
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow)
+)
+
+def _add_post_counters(conn: Connection):
+    """posts 테이블에 likes_count, comments_count 컬럼 추가 후 백필"""
+    from app.controllers import post_service
+
+    columns = {column["name"] for column in inspect(conn).get_columns("posts")}
+    for name in ("likes_count", "comments_count"):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE posts ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"))
+
+    post_service.recount_post_counters(Session(bind=conn))
+
+def _create_search_indexes(conn: Connection):
+    """사용자 이름/게시물 내용 검색 인덱스 생성"""
+    from app.controllers import search_service
+
+    search_service.create_search_indexes(conn)
+
+def _create_query_indexes(conn: Connection):
+    """피드/목록/카운트 쿼리용 복합 인덱스 생성 (모델에 선언된 인덱스 중 없는 것만)"""
+    from app.models import models
+
+    for table in (models.Post.__table__, models.Comment.__table__, models.post_likes):
+        existing = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+
+# 마이그레이션 직렬화용 PostgreSQL advisory 잠금 키 (임의의 고정 값)
+MIGRATION_LOCK = 0x7468726473636D61
+
+def _lock(conn: Connection):
+    """다른 프로세스의 마이그레이션과 겹치지 않도록 배타적 잠금 (트랜잭션이 끝날 때 풀림)"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        # 첫 쓰기가 아니라 트랜잭션 시작 시점에 쓰기 잠금을 잡음 (busy_timeout만큼 대기)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    elif dialect == "postgresql":
+        conn.execute(select(func.pg_advisory_xact_lock(MIGRATION_LOCK)))
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "add post counters", _add_post_counters),
+    (2, "create search indexes", _create_search_indexes),
+    (3, "create query indexes", _create_query_indexes),
+    (4, "create export indexes", _create_query_indexes),
+]
+
+def upgrade(bind: Engine = engine) -> List[int]:
+    """테이블을 생성하고 적용되지 않은 마이그레이션을 순서대로 적용한 뒤 적용한 버전 목록을 반환"""
+    from app.models import models  # noqa: F401  (Base.metadata에 모델 등록)
+
+    newly_applied = []
+    with bind.connect() as conn:
+        with conn.begin():
+            _lock(conn)
+            Base.metadata.create_all(conn)
+            schema_migrations.create(conn, checkfirst=True)
+            applied = set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+            for version, name, migrate in MIGRATIONS:
+                if version in applied:
+                    continue
+                migrate(conn)
+                conn.execute(schema_migrations.insert().values(version=version, name=name))
+                newly_applied.append(version)
+
+    return newly_applied
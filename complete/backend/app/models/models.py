@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -8,7 +8,9 @@ post_likes = Table(
     'post_likes',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
-    Column('post_id', Integer, ForeignKey('posts.id'), primary_key=True)
+    Column('post_id', Integer, ForeignKey('posts.id'), primary_key=True),
+    # 기본키는 (user_id, post_id) 순서이므로 게시물별 조회용 인덱스를 따로 둠
+    Index('ix_post_likes_post_id', 'post_id')
 )
 
 class User(Base):
@@ -27,10 +29,19 @@ class User(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 피드: (created_at, id) 내림차순 정렬 및 키셋 페이지네이션
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # 사용자 게시물 목록 및 게시물 수
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 비정규화 카운터 (좋아요/댓글 작성·삭제와 같은 트랜잭션에서 갱신)
+    likes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -41,6 +52,14 @@ class Post(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 게시물 댓글 목록 및 댓글 수
+        Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),
+        # 사용자 댓글 목록 및 댓글 수
+        Index("ix_comments_author_id_created_at_id", "author_id", "created_at", "id"),
+        # 전체 댓글 내보내기 (작성 순서)
+        Index("ix_comments_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
@@ -51,4 +70,18 @@ class Comment(Base):
 
     # 관계 정의
     post = relationship("Post", back_populates="comments")
-    author = relationship("User", back_populates="comments")
\ No newline at end of file
+    author = relationship("User", back_populates="comments")
+
+# 게시물/댓글 변경 기록 (GET /sync 증분 동기화용, 삭제된 항목의 표시도 보관)
+class Change(Base):
+    __tablename__ = "changes"
+    # 삭제된 마지막 번호를 다시 쓰지 않도록 AUTOINCREMENT 사용 (워터마크는 항상 증가)
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(16), nullable=False)  # post, comment
+    entity_id = Column(Integer, nullable=False)
+    # 댓글이 속한 게시물 (게시물 변경은 entity_id와 같음, 삭제 후에도 남도록 외래 키 없음)
+    post_id = Column(Integer, nullable=False)
+    op = Column(String(16), nullable=False)  # upsert, counts, delete
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
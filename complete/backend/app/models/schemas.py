@@ -14,6 +14,33 @@ class HealthCheckResponse(BaseModel):
     status: str = "ok"
     version: str
 
+class CacheStatsResponse(BaseModel):
+    backend: str
+    ttl: float
+    hits: int
+    misses: int
+    hit_rate: float
+    sets: int
+    deletes: int
+    evictions: int
+    entries: Optional[int] = None
+    max_entries: Optional[int] = None
+
+class SlowQuery(BaseModel):
+    duration_ms: float
+    statement: str
+    parameters: Any = None
+    executemany: bool
+    route: Optional[str] = None
+    plan: List[str]
+    recorded_at: datetime
+
+class SlowQueryList(BaseModel):
+    enabled: bool
+    threshold_ms: Optional[float] = None
+    recorded: int
+    items: List[SlowQuery]
+
 # 사용자 관련 스키마
 class UserLoginSimple(BaseModel):
     username: str = Field(..., description="Username for authentication")
@@ -36,6 +63,9 @@ class CommentCreate(BaseModel):
     content: str = Field(..., min_length=1, max_length=300, description="Text content of the comment")
     username: str = Field(..., description="Username of the comment author (from localStorage)")
 
+class CommentBatchItem(CommentCreate):
+    post_id: int = Field(..., description="ID of the post to comment on")
+
 class CommentUpdate(BaseModel):
     content: str = Field(..., min_length=1, max_length=300, description="Updated text content of the comment")
 
@@ -77,27 +107,36 @@ class LikeResponse(BaseModel):
     is_liked: bool
     likes_count: int
 
-# 페이지네이션 스키마
+class LikeStatus(LikeResponse):
+    comments_count: int
+
+class LikeStatusList(BaseModel):
+    items: List[LikeStatus]
+
+# 페이지네이션 스키마 (total/pages는 count=none이면 null, next_cursor는 다음 페이지가 없으면 null)
 class PostList(BaseModel):
     items: List[PostDetail]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class CommentList(BaseModel):
     items: List[Comment]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class UserList(BaseModel):
     items: List[UserBase]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 # 사용자 프로필 스키마
 class UserProfile(BaseModel):
@@ -105,8 +144,12 @@ class UserProfile(BaseModel):
     username: str
     profile_image_url: Optional[str] = None
     posts_count: int
+    comments_count: int
+    # 최근 게시물/댓글 일부만 포함하며, 나머지는 *_next_cursor로 별도 목록 API에서 조회
     posts: List[PostDetail]
     comments: List[Comment]
+    posts_next_cursor: Optional[str] = None
+    comments_next_cursor: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -120,4 +163,35 @@ class ValidationError(BaseModel):
     type: str
 
 class HTTPValidationError(BaseModel):
-    detail: List[ValidationError]
\ No newline at end of file
+    detail: List[ValidationError]
+
+# 일괄 작성 스키마 (항목은 작성 API의 요청 본문과 같은 형식이며, 항목별로 검증)
+class PostBatchCreate(BaseModel):
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=500, description="Posts to create ({content, username})")
+
+class CommentBatchCreate(BaseModel):
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=500, description="Comments to create ({post_id, content, username})")
+
+class BatchItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class BatchResult(BaseModel):
+    created: int
+    failed: int
+    items: List[BatchItemResult]
+
+# 증분 동기화 스키마 (likes는 좋아요/댓글 수만 바뀐 게시물, 삭제된 항목은 ID만)
+class DeletedComment(BaseModel):
+    id: int
+    post_id: int
+
+class SyncChanges(BaseModel):
+    watermark: int
+    has_more: bool
+    posts: List[PostDetail]
+    likes: List[LikeStatus]
+    comments: List[Comment]
+    deleted_posts: List[int]
+    deleted_comments: List[DeletedComment]
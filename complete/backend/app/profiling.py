@@ -0,0 +1,297 @@
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from urllib.parse import parse_qs
+
+from app.config import settings
+from app.admin_auth import ADMIN_TOKEN_HEADER, is_admin_token
+
+# 요청 단위 프로파일링 (PROFILING_ENABLED=true 일 때만 미들웨어를 등록)
+#
+# X-Profile 헤더 또는 profile 쿼리 파라미터가 있는 요청 하나만 샘플링 프로파일러로
+# 측정합니다. 동기 핸들러와 응답 검증은 스레드풀에서, 라우팅과 JSON 인코딩은 이벤트
+# 루프에서 실행되므로 한 스레드만 측정하는 cProfile 대신 모든 스레드의 스택을 주기적으로
+# 읽고 이 요청의 작업인 스택만 모읍니다.
+#
+# - 이벤트 루프: 이 요청을 처리하는 태스크가 실행 중이면 이 요청의 작업입니다
+#   (다른 요청의 태스크가 실행 중인 샘플은 제외).
+# - 스레드풀: anyio 워커가 실행 중인 컨텍스트에 이 요청의 프로파일러가 있으면
+#   이 요청의 작업입니다 (run_in_threadpool은 요청의 컨텍스트를 복사해 실행).
+#
+# 샘플마다 가장 안쪽 프레임부터 모듈을 보고 ORM/DB, 직렬화, 컨트롤러, 라우트 핸들러,
+# 프레임워크로 분류하여 구간별 시간을 계산합니다. 결과는 speedscope 형식
+# (https://www.speedscope.app)으로 PROFILING_DIR에 저장하거나 (profile=1),
+# 원래 응답 대신 요약을 JSON으로 반환합니다 (profile=inline).
+#
+# 프로파일링은 요청마다 샘플링 스레드를 띄우고 파일을 쓰므로, X-Admin-Token 헤더가
+# ADMIN_TOKEN과 같은 요청만 측정합니다 (그 외 요청의 프로파일링 요청은 무시). 저장한
+# 파일은 최근 PROFILING_MAX_FILES개만 남기고 오래된 것부터 지웁니다.
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+
+# 구간 분류 (가장 안쪽 프레임부터 처음 일치하는 모듈 접두사)
+CATEGORIES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("orm", ("sqlalchemy", "sqlite3", "aiosqlite", "asyncpg", "psycopg2", "psycopg")),
+    ("serialization", ("pydantic", "pydantic_core", "fastapi.encoders", "json", "orjson", "app.models.schemas")),
+    ("controller", ("app.controllers",)),
+    ("handler", ("app.routes",)),
+]
+
+# 측정할 최대 시간 (초, 이후 샘플은 버림)
+MAX_PROFILE_SECONDS = 60
+
+# 측정 중인 요청 수와 원래 GIL 전환 주기
+# (기본 5ms 주기로는 샘플링 스레드가 제때 실행되지 못하므로 측정하는 동안만 줄임)
+_running = 0
+_running_lock = threading.Lock()
+_switch_interval = sys.getswitchinterval()
+
+_active_profile: ContextVar[Optional["RequestProfiler"]] = ContextVar("active_profile", default=None)
+
+def _category(module: str) -> Optional[str]:
+    """모듈 이름이 속한 구간 (패키지 단위로 비교)"""
+    for name, prefixes in CATEGORIES:
+        for prefix in prefixes:
+            if module == prefix or module.startswith(prefix + "."):
+                return name
+    return None
+
+class RequestProfiler:
+    """요청 하나의 스택을 주기적으로 샘플링"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.loop_thread: Optional[int] = None  # 이벤트 루프 스레드
+        self.coroutine = None  # 이벤트 루프에서 이 요청을 처리하는 태스크의 코루틴
+        self.samples: List[Tuple[List[Tuple[str, str, int, str]], float]] = []
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _owns(self, thread_id: int, frame) -> bool:
+        """스레드의 현재 스택이 이 요청의 작업인지 확인"""
+        if thread_id == self.loop_thread:
+            # 요청을 처리하는 태스크가 실행 중이면 이 요청의 작업
+            # (비동기 모드의 ORM은 별도 greenlet 스택에서 실행되어 프레임으로는 연결되지 않음)
+            return getattr(self.coroutine, "cr_running", False)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == "run" and frame.f_globals.get("__name__", "").startswith("anyio"):
+                context = frame.f_locals.get("context")
+                return context is not None and context.get(_active_profile) is self
+            frame = frame.f_back
+        return False
+
+    def _run(self):
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        last = time.perf_counter()
+        deadline = last + MAX_PROFILE_SECONDS
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight, last = now - last, now
+            if now > deadline:
+                break
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or not self._owns(thread_id, frame):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_name, code.co_filename, frame.f_lineno, frame.f_globals.get("__name__", "")))
+                    frame = frame.f_back
+                if thread_id not in names:
+                    names = {thread.ident: thread.name for thread in threading.enumerate()}
+                stack.append((f"[{names.get(thread_id, thread_id)}]", "", 0, ""))
+                stack.reverse()
+                self.samples.append((stack, weight))
+
+    def start(self):
+        global _running, _switch_interval
+        with _running_lock:
+            if _running == 0:
+                _switch_interval = sys.getswitchinterval()
+                sys.setswitchinterval(min(_switch_interval, self.interval / 10))
+            _running += 1
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        global _running
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+        with _running_lock:
+            _running -= 1
+            if _running == 0:
+                sys.setswitchinterval(_switch_interval)
+
+    def breakdown(self) -> Dict[str, float]:
+        """구간별 시간 (밀리초, 샘플 기준)"""
+        totals = {name: 0.0 for name, _ in CATEGORIES}
+        totals["framework"] = 0.0
+        for stack, weight in self.samples:
+            category = next((c for c in (_category(module) for *_, module in reversed(stack)) if c), "framework")
+            totals[category] += weight * 1000
+        return {name: round(value, 3) for name, value in totals.items()}
+
+    def top_functions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """자체 시간(가장 안쪽 프레임 기준)이 긴 함수"""
+        totals: Dict[Tuple[str, str, int], float] = {}
+        for stack, weight in self.samples:
+            name, filename, line, _ = stack[-1]
+            key = (name, filename, line)
+            totals[key] = totals.get(key, 0.0) + weight
+        ranked = sorted(totals.items(), key=lambda item: -item[1])[:limit]
+        return [
+            {"function": name, "file": filename, "line": line, "self_ms": round(weight * 1000, 3)}
+            for (name, filename, line), weight in ranked
+        ]
+
+    def speedscope(self, name: str) -> Dict[str, Any]:
+        """speedscope 파일 형식 (sampled 프로파일 하나, 단위 밀리초)"""
+        frames: List[Dict[str, Any]] = []
+        indexes: Dict[Tuple[str, str, int], int] = {}
+        samples, weights = [], []
+        for stack, weight in self.samples:
+            sample = []
+            for frame_name, filename, line, _ in stack:
+                key = (frame_name, filename, line)
+                if key not in indexes:
+                    indexes[key] = len(frames)
+                    frames.append({"name": frame_name, "file": filename, "line": line})
+                sample.append(indexes[key])
+            samples.append(sample)
+            weights.append(weight * 1000)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "threads-backend",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        return {
+            "request": name,
+            "duration_ms": round(self.duration * 1000, 3),
+            "samples": len(self.samples),
+            "interval_ms": self.interval * 1000,
+            "breakdown_ms": self.breakdown(),
+            "top_functions": self.top_functions(),
+        }
+
+def _requested_mode(scope) -> Optional[str]:
+    """요청한 프로파일링 방식 (file, inline 또는 None, 관리 토큰이 없는 요청은 None)"""
+    value = token = None
+    for header, header_value in scope.get("headers", []):
+        if header == PROFILE_HEADER:
+            value = header_value.decode()
+        elif header == ADMIN_TOKEN_HEADER:
+            token = header_value.decode()
+    if not is_admin_token(token):
+        return None
+    if value is None and scope.get("query_string"):
+        values = parse_qs(scope["query_string"].decode()).get("profile")
+        value = values[0] if values else None
+    if value is None or value.lower() in ("", "0", "false"):
+        return None
+    return "inline" if value.lower() == "inline" else "file"
+
+def _file_name(scope) -> str:
+    path = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-") or "root"
+    return f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{scope['method']}-{path}.speedscope.json"
+
+def _rotate(directory: str, keep: int):
+    """저장한 프로파일 파일 중 최근 keep개만 남김 (파일 이름이 작성 시각 순)"""
+    files = sorted(name for name in os.listdir(directory) if name.endswith(".speedscope.json"))
+    for name in files[:max(len(files) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+class ProfilingMiddleware:
+    """X-Profile 헤더 또는 profile 쿼리 파라미터가 있는 요청을 프로파일링하는 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app,
+        directory: str = settings.profiling_dir,
+        interval_ms: float = settings.profiling_interval_ms,
+        max_files: int = settings.profiling_max_files
+    ):
+        self.app = app
+        self.directory = directory
+        self.interval = interval_ms / 1000
+        self.max_files = max_files
+
+    async def __call__(self, scope, receive, send):
+        mode = _requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        profiler = RequestProfiler(self.interval)
+        profiler.loop_thread = threading.get_ident()
+        profiler.coroutine = asyncio.current_task().get_coro()
+        token = _active_profile.set(profiler)
+        name = f"{scope['method']} {scope['path']}"
+        path = os.path.join(self.directory, _file_name(scope))
+
+        if mode == "inline":
+            # 원래 응답은 버리고 요약을 반환
+            status = 500
+
+            async def discard(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+            profiler.start()
+            try:
+                await self.app(scope, receive, discard)
+            finally:
+                profiler.stop()
+                _active_profile.reset(token)
+            body = json.dumps({**profiler.summary(name), "status": status}).encode()
+            await send({"type": "http.response.start", "status": 200, "headers": [
+                (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())
+            ]})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + [(b"x-profile-file", path.encode())]}
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            profiler.stop()
+            _active_profile.reset(token)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w") as file:
+                json.dump(profiler.speedscope(name), file)
+            _rotate(self.directory, self.max_files)
+            logger.warning("Profiled %s in %.1f ms: %s -> %s", name, profiler.duration * 1000, profiler.breakdown(), path)
@@ -0,0 +1,125 @@
+from typing import Any, Callable, Dict, List
+from fastapi.responses import Response
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # 설치되어 있지 않으면 FastAPI 기본 직렬화 사용
+    orjson = None
+
+# 목록 응답 빠른 직렬화 (FAST_JSON_RESPONSES, 기본 사용)
+#
+# 라우트가 dict를 반환하면 FastAPI는 response_model로 한 번 더 검증해 모델 객체를 만든 뒤
+# JSON으로 직렬화합니다. 목록 응답은 라우트가 이미 컨트롤러 결과에서 만든 데이터이므로
+# 검증을 건너뛰고, 아래 함수로 응답 스키마의 필드 순서대로 정리한 뒤 orjson으로 바로
+# 인코딩한 Response를 반환합니다.
+#
+# - 출력은 FastAPI 기본 경로(pydantic dump_json)와 바이트 단위로 같습니다
+#   (필드 순서, 기본값, 한글 그대로 출력, datetime ISO 형식, UTC는 Z).
+#   python -m benchmarks.serialization 으로 확인합니다.
+# - response_model은 그대로 두므로 OpenAPI 문서는 바뀌지 않습니다.
+# - 스키마에 필드를 추가하면 아래 함수에도 같은 순서로 추가해야 합니다.
+
+def author(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.Author / schemas.UserBase"""
+    return {
+        "id": data["id"],
+        "username": data["username"],
+        "profile_image_url": data.get("profile_image_url")
+    }
+
+def post_detail(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.PostDetail"""
+    return {
+        "id": data["id"],
+        "content": data["content"],
+        "author": author(data["author"]),
+        "likes_count": data["likes_count"],
+        "comments_count": data["comments_count"],
+        "is_liked": data.get("is_liked", False),
+        "created_at": data["created_at"],
+        "updated_at": data.get("updated_at")
+    }
+
+def comment(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.Comment"""
+    return {
+        "id": data["id"],
+        "content": data["content"],
+        "post_id": data["post_id"],
+        "author": author(data["author"]),
+        "created_at": data["created_at"],
+        "updated_at": data.get("updated_at")
+    }
+
+def _page(item: Callable[[Dict[str, Any]], Dict[str, Any]], data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.PostList / CommentList / UserList"""
+    return {
+        "items": [item(value) for value in data["items"]],
+        "total": data.get("total"),
+        "page": data["page"],
+        "size": data["size"],
+        "pages": data.get("pages"),
+        "next_cursor": data.get("next_cursor")
+    }
+
+def post_list(data: Dict[str, Any]) -> Dict[str, Any]:
+    return _page(post_detail, data)
+
+def comment_list(data: Dict[str, Any]) -> Dict[str, Any]:
+    return _page(comment, data)
+
+def user_list(data: Dict[str, Any]) -> Dict[str, Any]:
+    return _page(author, data)
+
+def user_profile(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.UserProfile"""
+    return {
+        "id": data["id"],
+        "username": data["username"],
+        "profile_image_url": data.get("profile_image_url"),
+        "posts_count": data["posts_count"],
+        "comments_count": data["comments_count"],
+        "posts": [post_detail(post) for post in data["posts"]],
+        "comments": [comment(value) for value in data["comments"]],
+        "posts_next_cursor": data.get("posts_next_cursor"),
+        "comments_next_cursor": data.get("comments_next_cursor"),
+        "created_at": data["created_at"],
+        "updated_at": data.get("updated_at")
+    }
+
+def like_status(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.LikeStatus"""
+    return {
+        "post_id": data["post_id"],
+        "is_liked": data["is_liked"],
+        "likes_count": data["likes_count"],
+        "comments_count": data["comments_count"]
+    }
+
+def sync_changes(data: Dict[str, Any]) -> Dict[str, Any]:
+    """schemas.SyncChanges"""
+    return {
+        "watermark": data["watermark"],
+        "has_more": data["has_more"],
+        "posts": [post_detail(post) for post in data["posts"]],
+        "likes": [like_status(value) for value in data["likes"]],
+        "comments": [comment(value) for value in data["comments"]],
+        "deleted_posts": data["deleted_posts"],
+        "deleted_comments": [{"id": value["id"], "post_id": value["post_id"]} for value in data["deleted_comments"]]
+    }
+
+class FastJSONResponse(Response):
+    """orjson으로 인코딩하는 JSON 응답 (pydantic JSON 출력과 같은 형식)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+def fast_json(data: Dict[str, Any], shape: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Any:
+    """빠른 직렬화를 사용하면 스키마 순서로 정리한 FastJSONResponse, 아니면 data 그대로 반환"""
+    if not settings.fast_json_responses or orjson is None:
+        return data
+    return FastJSONResponse(shape(data))
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException
+from app.models import schemas
+from app.slow_query_log import slow_query_log
+from app.admin_auth import require_admin
+
+# 모든 관리 엔드포인트는 X-Admin-Token 헤더가 ADMIN_TOKEN과 같아야 함
+router = APIRouter(tags=["Admin"], dependencies=[Depends(require_admin)])
+
+def _require_slow_query_log():
+    if not slow_query_log.enabled:
+        raise HTTPException(status_code=404, detail="Slow query log is disabled")
+
+@router.get("/admin/slow-queries", response_model=schemas.SlowQueryList)
+def get_slow_queries():
+    """
+    느린 쿼리 기록 조회 (최신순)
+    
+    SLOW_QUERY_THRESHOLD_MS를 넘은 SQL 문과 파라미터, 요청한 라우트, 실행 계획을
+    최근 SLOW_QUERY_LOG_SIZE개까지 반환합니다. 기록은 프로세스(워커)별로 보관됩니다.
+    X-Admin-Token 헤더가 필요합니다.
+    """
+    _require_slow_query_log()
+    return slow_query_log.info()
+
+@router.delete("/admin/slow-queries", response_model=schemas.SuccessResponse)
+def clear_slow_queries():
+    """
+    느린 쿼리 기록 비우기
+    """
+    _require_slow_query_log()
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
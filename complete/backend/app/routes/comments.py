@@ -1,16 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Request, Response
 from sqlalchemy.orm import Session
 from app.models import schemas
-from app.controllers import comment_service
+from app.controllers import comment_service, pagination, batch_service
 from app.database import get_db
+from app import responses, conditional
+from typing import Optional
 
 router = APIRouter(tags=["Comments"])
 
+def _comments_etag(post_id, comments, total, page, limit, pages, next_cursor) -> str:
+    """댓글 목록 ETag (comment_rows와 comment_versions의 결과에서 같은 값)"""
+    return conditional.etag(
+        "post-comments", post_id, total, page, limit, pages, next_cursor,
+        [(comment.id, comment.updated_at) for comment in comments]
+    )
+
+def _comments_last_modified(comments):
+    return conditional.latest(*(comment.updated_at for comment in comments))
+
 @router.get("/posts/{postId}/comments", response_model=schemas.CommentList)
 def get_post_comments(
     postId: int,
+    request: Request,
+    response: Response,
     page: int = Query(1, description="페이지 번호", ge=1),
     limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
     db: Session = Depends(get_db)
 ):
     """
@@ -19,8 +35,21 @@ def get_post_comments(
     - **postId**: 댓글을 조회할 게시물 ID
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    
+    ETag/Last-Modified 헤더를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
     """
-    comments, total, page, limit, pages = comment_service.get_comments_for_post(db, postId, page, limit)
+    # If-None-Match가 있으면 내용/작성자 없이 버전만 조회해 먼저 비교
+    if conditional.is_conditional(request):
+        versions = comment_service.get_comments_for_post(
+            db, postId, page, limit, cursor, count, rows=comment_service.comment_versions
+        )
+        tag = _comments_etag(postId, *versions)
+        if conditional.matches(request, tag):
+            return conditional.not_modified(tag, _comments_last_modified(versions[0]))
+    
+    comments, total, page, limit, pages, next_cursor = comment_service.get_comments_for_post(db, postId, page, limit, cursor, count)
     
     # 응답 구성
     result = {
@@ -28,7 +57,8 @@ def get_post_comments(
         "total": total,
         "page": page,
         "size": limit,
-        "pages": pages
+        "pages": pages,
+        "next_cursor": next_cursor
     }
     
     # 댓글 정보 변환
@@ -38,16 +68,35 @@ def get_post_comments(
             "content": comment.content,
             "post_id": comment.post_id,
             "author": {
-                "id": comment.author.id,
-                "username": comment.author.username,
-                "profile_image_url": comment.author.profile_image_url
+                "id": comment.author_id,
+                "username": comment.author_username,
+                "profile_image_url": comment.author_profile_image_url
             },
             "created_at": comment.created_at,
             "updated_at": comment.updated_at
         }
         result["items"].append(comment_data)
     
-    return result
+    return conditional.with_validators(
+        responses.fast_json(result, responses.comment_list), response,
+        _comments_etag(postId, comments, total, page, limit, pages, next_cursor),
+        _comments_last_modified(comments)
+    )
+
+@router.post("/comments/batch", response_model=schemas.BatchResult)
+def create_comments_batch(
+    batch: schemas.CommentBatchCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    댓글 일괄 작성
+    
+    - **items**: 작성할 댓글 목록 (각 항목은 post_id, content, username, 최대 500개)
+    
+    게시물과 작성자는 한 번에 확인/생성하고 댓글은 한 트랜잭션에서 함께 삽입합니다.
+    결과의 items는 요청 순서대로 작성된 댓글 ID 또는 실패 이유(error)를 담습니다.
+    """
+    return batch_service.create_comments(db, batch.items)
 
 @router.post("/posts/{postId}/comments", response_model=schemas.Comment, status_code=status.HTTP_201_CREATED)
 def create_comment(
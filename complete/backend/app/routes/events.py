@@ -0,0 +1,46 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.config import settings
+from app import events
+from typing import List
+
+router = APIRouter(tags=["Events"])
+
+# 이벤트 스트림 핸들러는 db 의존성을 받지 않으며, 연결이 유지되는 동안 이벤트 루프에서
+# 대기합니다 (연결마다 스레드를 쓰지 않음)
+
+@router.get("/events", response_class=StreamingResponse)
+def stream_events(
+    feed: bool = Query(False, description="새 게시물, 게시물 수정/삭제 구독"),
+    post_id: List[int] = Query([], description="구독할 게시물 ID (예: ?post_id=1&post_id=2)", max_length=100),
+    user_id: List[int] = Query([], description="구독할 사용자 ID (사용자가 작성/수정/삭제한 게시물과 댓글)", max_length=100),
+):
+    """
+    실시간 이벤트 구독 (Server-Sent Events)
+    
+    - **feed**: true이면 post_created, post_updated, post_deleted 이벤트 수신
+    - **post_id**: 게시물의 post_updated, post_deleted, comment_*, likes(좋아요 수) 이벤트 수신
+    - **user_id**: 사용자가 작성/수정/삭제한 게시물과 댓글 이벤트 수신
+    
+    이벤트가 없으면 EVENTS_HEARTBEAT초마다 주석 프레임을 보냅니다. 이벤트를 제때 읽지 않아
+    EVENTS_QUEUE_SIZE개가 쌓이면 overflow 이벤트를 보낸 뒤 연결을 끊으므로, 다시 연결하고
+    GET /sync로 놓친 변경을 받아야 합니다.
+    """
+    broker = events.get_broker()
+    if not broker.enabled:
+        raise HTTPException(status_code=404, detail="Events are disabled")
+    
+    topics = [events.FEED] if feed else []
+    topics += [events.post_topic(value) for value in post_id]
+    topics += [events.user_topic(value) for value in user_id]
+    if not topics:
+        raise HTTPException(status_code=400, detail="No topics to subscribe")
+    if broker.full():
+        raise HTTPException(status_code=503, detail="Too many event subscribers")
+    
+    return StreamingResponse(
+        events.stream(topics, settings.events_heartbeat),
+        media_type="text/event-stream",
+        # 프록시가 스트림을 버퍼링하거나 캐시하지 않도록 함
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
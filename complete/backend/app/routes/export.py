@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from app.controllers import export_service
+from datetime import datetime
+from typing import Optional
+
+router = APIRouter(tags=["Export"])
+
+# 내보내기 핸들러는 db 의존성을 받지 않고 스트림 안에서 전용 세션을 엽니다
+# (요청 세션은 응답 본문을 보내기 전에 닫히므로 스트림에서 사용할 수 없음)
+
+@router.get("/export/posts", response_class=StreamingResponse)
+def export_posts(
+    since: Optional[datetime] = Query(None, description="이 시각 이후(포함)에 작성된 게시물만 (ISO 8601)")
+):
+    """
+    게시물 전체 내보내기 (NDJSON 스트림)
+    
+    - **since**: 이 시각 이후(포함)에 작성된 게시물만 내보냄 (선택 사항)
+    
+    한 줄에 게시물 하나씩 작성 순서((created_at, id) 오름차순)로 내보냅니다.
+    """
+    return StreamingResponse(export_service.export_posts(since), media_type=export_service.NDJSON_MEDIA_TYPE)
+
+@router.get("/export/comments", response_class=StreamingResponse)
+def export_comments(
+    since: Optional[datetime] = Query(None, description="이 시각 이후(포함)에 작성된 댓글만 (ISO 8601)"),
+    post_id: Optional[int] = Query(None, description="게시물 ID (선택 사항, 지정하면 해당 게시물의 댓글만)"),
+):
+    """
+    댓글 전체 내보내기 (NDJSON 스트림)
+    
+    - **since**: 이 시각 이후(포함)에 작성된 댓글만 내보냄 (선택 사항)
+    - **post_id**: 지정하면 해당 게시물의 댓글만 내보냄 (선택 사항)
+    
+    한 줄에 댓글 하나씩 작성 순서((created_at, id) 오름차순)로 내보냅니다.
+    """
+    return StreamingResponse(export_service.export_comments(since, post_id), media_type=export_service.NDJSON_MEDIA_TYPE)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Request, Response
 from sqlalchemy.orm import Session
 from app.models import schemas
-from app.controllers import post_service, user_service
+from app.controllers import post_service, user_service, pagination, batch_service
 from app.database import get_db
-from typing import Optional
+from app import responses, conditional
+from typing import List, Optional
 
 router = APIRouter(tags=["Posts"])
 
@@ -11,6 +12,9 @@ router = APIRouter(tags=["Posts"])
 def get_posts_list(
     page: int = Query(1, description="페이지 번호", ge=1),
     limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항, 지정하면 is_liked 확인)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -18,43 +22,41 @@ def get_posts_list(
     
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    - **username**: 사용자 이름 (선택 사항, 지정하면 각 게시물의 is_liked를 확인)
     """
-    posts, total, page, limit, pages = post_service.get_posts_list(db, page, limit)
+    # 읽기 캐시를 거쳐 조회 (게시물 작성/삭제, 좋아요, 댓글 작성 시 무효화)
+    return responses.fast_json(post_service.get_feed(db, page, limit, cursor, count, username), responses.post_list)
+
+@router.post("/posts/batch", response_model=schemas.BatchResult)
+def create_posts_batch(
+    batch: schemas.PostBatchCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    게시물 일괄 작성
     
-    # 응답 구성
-    result = {
-        "items": [],
-        "total": total,
-        "page": page,
-        "size": limit,
-        "pages": pages
-    }
+    - **items**: 작성할 게시물 목록 (각 항목은 content, username, 최대 500개)
     
-    # 게시물 정보 변환
-    for post in posts:
-        # 좋아요 수 계산
-        likes_count = len(post.liked_by)
-        
-        # 댓글 수 계산
-        comments_count = len(post.comments)
-        
-        post_detail = {
-            "id": post.id,
-            "content": post.content,
-            "author": {
-                "id": post.author.id,
-                "username": post.author.username,
-                "profile_image_url": post.author.profile_image_url
-            },
-            "likes_count": likes_count,
-            "comments_count": comments_count,
-            "is_liked": False,  # 기본값
-            "created_at": post.created_at,
-            "updated_at": post.updated_at
-        }
-        result["items"].append(post_detail)
+    작성자는 한 번에 조회/생성하고 게시물은 한 트랜잭션에서 함께 삽입합니다.
+    결과의 items는 요청 순서대로 작성된 게시물 ID 또는 실패 이유(error)를 담습니다.
+    """
+    return batch_service.create_posts(db, batch.items)
+
+@router.get("/posts/likes", response_model=schemas.LikeStatusList)
+def get_like_status(
+    ids: List[int] = Query(..., description="게시물 ID 목록 (예: ?ids=1&ids=2)", min_length=1, max_length=100),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항)"),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 게시물의 좋아요 여부와 좋아요/댓글 수 조회
     
-    return result
+    - **ids**: 게시물 ID 목록 (최대 100개, 존재하지 않는 게시물은 결과에서 제외)
+    - **username**: 사용자 이름 (지정하지 않으면 is_liked는 모두 false)
+    """
+    return {"items": post_service.get_like_status(db, ids, username)}
 
 @router.post("/posts", response_model=schemas.PostDetail, status_code=status.HTTP_201_CREATED)
 def create_post(
@@ -88,6 +90,8 @@ def create_post(
 @router.get("/posts/{postId}", response_model=schemas.PostDetail)
 def get_post_detail(
     postId: int,
+    request: Request,
+    response: Response,
     username: Optional[str] = Query(None, description="사용자 이름 (선택 사항)"),
     db: Session = Depends(get_db)
 ):
@@ -96,24 +100,20 @@ def get_post_detail(
     
     - **postId**: 게시물 ID
     - **username**: 사용자 이름 (선택 사항)
+    
+    ETag/Last-Modified 헤더를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
     """
-    post, likes_count, comments_count, is_liked = post_service.get_post_detail(db, postId, username)
+    # 게시물 정보는 읽기 캐시를 거쳐 조회하고 is_liked만 사용자별로 확인
+    post = post_service.get_post_detail(db, postId, username)
     
-    # 게시물 상세 정보 구성
-    return {
-        "id": post.id,
-        "content": post.content,
-        "author": {
-            "id": post.author.id,
-            "username": post.author.username,
-            "profile_image_url": post.author.profile_image_url
-        },
-        "likes_count": likes_count,
-        "comments_count": comments_count,
-        "is_liked": is_liked,
-        "created_at": post.created_at,
-        "updated_at": post.updated_at
-    }
+    # 캐시된 게시물 정보가 곧 버전이므로 별도 조회 없이 ETag 계산
+    tag = conditional.etag(
+        "post", post["id"], post["updated_at"], post["likes_count"], post["comments_count"], post["is_liked"]
+    )
+    private = username is not None
+    if conditional.matches(request, tag):
+        return conditional.not_modified(tag, post["updated_at"], private)
+    return conditional.with_validators(post, response, tag, post["updated_at"], private)
 
 @router.put("/posts/{postId}", response_model=schemas.PostDetail)
 def update_post(
@@ -131,13 +131,8 @@ def update_post(
     """
     post = post_service.update_post(db, postId, post_update, username)
     
-    # 좋아요 수와 댓글 수 계산
-    likes_count = len(post.liked_by)
-    comments_count = len(post.comments)
-    
     # 현재 사용자의 좋아요 여부 확인
-    user = user_service.get_user_by_username(db, username)
-    is_liked = user in post.liked_by
+    is_liked = post.id in post_service.liked_post_ids(db, [post.id], username)
     
     # 게시물 상세 정보 구성
     return {
@@ -148,8 +143,8 @@ def update_post(
             "username": post.author.username,
             "profile_image_url": post.author.profile_image_url
         },
-        "likes_count": likes_count,
-        "comments_count": comments_count,
+        "likes_count": post_service.buffered_likes_count(post.id, post.likes_count),
+        "comments_count": post.comments_count,
         "is_liked": is_liked,
         "created_at": post.created_at,
         "updated_at": post.updated_at
@@ -173,6 +168,7 @@ def delete_post(
 def like_post(
     postId: int,
     username: str = Query(..., description="사용자 이름"),
+    idempotent: bool = Query(False, description="이미 좋아요 한 경우에도 성공으로 처리"),
     db: Session = Depends(get_db)
 ):
     """
@@ -180,13 +176,15 @@ def like_post(
     
     - **postId**: 좋아요 할 게시물 ID
     - **username**: 사용자 이름
+    - **idempotent**: true이면 이미 좋아요 한 경우 400 대신 현재 상태를 반환
     """
-    return post_service.like_post(db, postId, username)
+    return post_service.like_post(db, postId, username, idempotent)
 
 @router.delete("/posts/{postId}/like", response_model=schemas.LikeResponse)
 def unlike_post(
     postId: int,
     username: str = Query(..., description="사용자 이름"),
+    idempotent: bool = Query(False, description="좋아요 하지 않은 경우에도 성공으로 처리"),
     db: Session = Depends(get_db)
 ):
     """
@@ -194,5 +192,6 @@ def unlike_post(
     
     - **postId**: 좋아요 취소할 게시물 ID
     - **username**: 사용자 이름
+    - **idempotent**: true이면 좋아요 하지 않은 경우 400 대신 현재 상태를 반환
     """
-    return post_service.unlike_post(db, postId, username)
\ No newline at end of file
+    return post_service.unlike_post(db, postId, username, idempotent)
\ No newline at end of file
@@ -0,0 +1,84 @@
+import inspect
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from app.database import get_async_db, DATABASE_ASYNC
+
+# 라우트 핸들러와 컨트롤러는 동기 Session 기준으로 한 번만 작성하고,
+# 애플리케이션에 등록할 때 데이터베이스 모드에 맞게 핸들러를 감쌉니다.
+#
+# - 동기 모드: 핸들러가 끝나면 같은 스레드에서 바로 세션을 닫아 커넥션을 반납합니다.
+#   FastAPI는 동기 핸들러의 응답 검증과 get_db 정리도 스레드풀에서 실행하므로,
+#   세션을 그때까지 열어 두면 동시 요청 수가 커넥션 풀 크기를 넘을 때 스레드와
+#   커넥션을 서로 기다리는 교착 상태가 생길 수 있습니다.
+# - 비동기 모드(DATABASE_ASYNC=true): db 파라미터를 AsyncSession으로 바꾼 async
+#   핸들러로 감싸고 본문을 AsyncSession.run_sync로 실행합니다. 지연 로딩을 포함한
+#   모든 DB I/O가 이벤트 루프에서 비동기 드라이버로 처리되어 스레드풀을 점유하지 않습니다.
+#   단, 본문은 이벤트 루프 스레드의 greenlet에서 실행되므로 컨트롤러의 동기 I/O(redis
+#   캐시 조회/무효화, redis 이벤트 발행)는 그동안 이벤트 루프 전체를 멈춥니다. 비동기
+#   모드에서는 CACHE_BACKEND=memory, EVENT_BROKER=memory를 사용해야 합니다.
+
+def _copy_metadata(wrapper, endpoint, signature):
+    """FastAPI가 참조하는 핸들러 정보 복사
+
+    functools.wraps는 __wrapped__를 설정하여 FastAPI가 원래 함수를 기준으로
+    동기/비동기 여부를 판단하게 되므로 사용하지 않습니다.
+    """
+    wrapper.__name__ = endpoint.__name__
+    wrapper.__qualname__ = endpoint.__qualname__
+    wrapper.__doc__ = endpoint.__doc__
+    wrapper.__module__ = endpoint.__module__
+    wrapper.__signature__ = signature
+    return wrapper
+
+def make_sync_endpoint(endpoint):
+    """핸들러 종료 직후 세션을 닫는 동기 핸들러 생성"""
+    def sync_endpoint(**kwargs):
+        try:
+            return endpoint(**kwargs)
+        finally:
+            kwargs["db"].close()
+
+    return _copy_metadata(sync_endpoint, endpoint, inspect.signature(endpoint))
+
+def make_async_endpoint(endpoint):
+    """db 의존성을 AsyncSession으로 바꾼 async 핸들러 생성"""
+    signature = inspect.signature(endpoint)
+    parameters = [
+        parameter.replace(default=Depends(get_async_db)) if parameter.name == "db" else parameter
+        for parameter in signature.parameters.values()
+    ]
+
+    async def async_endpoint(**kwargs):
+        db = kwargs.pop("db")
+        return await db.run_sync(lambda session: endpoint(db=session, **kwargs))
+
+    return _copy_metadata(async_endpoint, endpoint, signature.replace(parameters=parameters))
+
+def build_router(router: APIRouter, use_async: bool = DATABASE_ASYNC) -> APIRouter:
+    """db 의존성을 사용하는 라우트를 데이터베이스 모드에 맞게 감싼 라우터 생성"""
+    make_endpoint = make_async_endpoint if use_async else make_sync_endpoint
+    built = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute) or "db" not in inspect.signature(route.endpoint).parameters:
+            built.routes.append(route)
+            continue
+
+        built.add_api_route(
+            route.path,
+            make_endpoint(route.endpoint),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            methods=route.methods,
+            operation_id=route.operation_id,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+            name=route.name
+        )
+    return built
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from app.models import schemas
-from app.controllers import user_service
+from app.controllers import user_service, post_service, pagination, search_service
 from app.database import get_db
-import math
+from app import responses
+from typing import Optional
 
 router = APIRouter(tags=["Search"])
 
@@ -12,6 +13,9 @@ def search_users(
     username: str = Query(..., description="검색할 사용자 이름"),
     page: int = Query(1, description="페이지 번호", ge=1),
     limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
+    sort: str = Query("recent", description="정렬 방식 (recent, relevance)", pattern=search_service.SORT_PATTERN),
     db: Session = Depends(get_db)
 ):
     """
@@ -20,11 +24,14 @@ def search_users(
     - **username**: 검색할 사용자 이름 (부분 일치)
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    - **sort**: 정렬 방식 (recent: 최신순, relevance: 최근 일치 항목 200개 중 관련도 순, total/pages 생략)
     """
-    users, total = user_service.search_users(db, username, page, limit)
+    users, total, next_cursor = user_service.search_users(db, username, page, limit, cursor, count, sort)
     
     # 총 페이지 수 계산
-    pages = math.ceil(total / limit) if total > 0 else 0
+    pages = pagination.page_count(total, limit)
     
     # 응답 구성
     result = {
@@ -32,7 +39,8 @@ def search_users(
         "total": total,
         "page": page,
         "size": limit,
-        "pages": pages
+        "pages": pages,
+        "next_cursor": next_cursor
     }
     
     # 검색 결과 사용자 정보 변환
@@ -44,4 +52,59 @@ def search_users(
         }
         result["items"].append(user_data)
     
-    return result
\ No newline at end of file
+    return responses.fast_json(result, responses.user_list)
+
+@router.get("/search/posts", response_model=schemas.PostList)
+def search_posts(
+    q: str = Query(..., description="검색할 게시물 내용", min_length=1),
+    page: int = Query(1, description="페이지 번호", ge=1),
+    limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
+    sort: str = Query("recent", description="정렬 방식 (recent, relevance)", pattern=search_service.SORT_PATTERN),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항, 지정하면 is_liked 확인)"),
+    db: Session = Depends(get_db)
+):
+    """
+    게시물 내용으로 검색
+    
+    - **q**: 검색할 게시물 내용 (부분 일치)
+    - **page**: 페이지 번호 (1부터 시작)
+    - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    - **sort**: 정렬 방식 (recent: 최신순, relevance: 최근 일치 항목 200개 중 관련도 순, total/pages 생략)
+    - **username**: 사용자 이름 (선택 사항, 지정하면 각 게시물의 is_liked를 확인)
+    """
+    posts, total, page, limit, pages, next_cursor = post_service.search_posts(db, q, page, limit, cursor, count, sort)
+    liked = post_service.liked_post_ids(db, [post.id for post in posts], username)
+    
+    # 응답 구성
+    result = {
+        "items": [],
+        "total": total,
+        "page": page,
+        "size": limit,
+        "pages": pages,
+        "next_cursor": next_cursor
+    }
+    
+    # 검색 결과 게시물 정보 변환
+    for post in posts:
+        post_detail = {
+            "id": post.id,
+            "content": post.content,
+            "author": {
+                "id": post.author_id,
+                "username": post.author_username,
+                "profile_image_url": post.author_profile_image_url
+            },
+            "likes_count": post_service.buffered_likes_count(post.id, post.likes_count),
+            "comments_count": post.comments_count,
+            "is_liked": post.id in liked,
+            "created_at": post.created_at,
+            "updated_at": post.updated_at
+        }
+        result["items"].append(post_detail)
+    
+    return responses.fast_json(result, responses.post_list)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.models import schemas
+from app.controllers import sync_service
+from app.database import get_db
+from app import responses
+from typing import Optional
+
+router = APIRouter(tags=["Sync"])
+
+@router.get("/sync", response_model=schemas.SyncChanges)
+def get_changes(
+    since: Optional[int] = Query(None, description="마지막으로 받은 워터마크 (생략하면 현재 워터마크만 반환)", ge=0),
+    limit: int = Query(500, description="한 번에 읽을 최대 변경 기록 수", ge=1, le=1000),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항, 지정하면 is_liked 확인)"),
+    db: Session = Depends(get_db)
+):
+    """
+    증분 동기화 (워터마크 이후의 변경만 조회)
+    
+    - **since**: 이전 응답의 watermark (생략하면 변경 없이 현재 watermark만 반환)
+    - **limit**: 한 번에 읽을 최대 변경 기록 수 (has_more가 true이면 새 watermark로 바로 다시 요청)
+    - **username**: 사용자 이름 (선택 사항, 지정하면 is_liked를 확인)
+    
+    작성/수정된 게시물과 댓글은 전체 항목을, 좋아요/댓글 수만 바뀐 게시물은 likes에 수만,
+    삭제된 게시물과 댓글은 ID만 반환합니다 (게시물 삭제는 그 게시물의 댓글 삭제도 뜻함).
+    since가 보관 기간보다 오래된 워터마크이면 410을 반환하며, 처음부터 다시 불러와야 합니다.
+    """
+    return responses.fast_json(sync_service.get_changes(db, since, limit, username), responses.sync_changes)
@@ -1,6 +1,9 @@
 import os
-from fastapi import APIRouter
-from app.models.schemas import HealthCheckResponse
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.models.schemas import HealthCheckResponse, CacheStatsResponse
+from app.config import settings
+from app import cache, metrics
 
 router = APIRouter(tags=["System"])
 
@@ -15,4 +18,23 @@ def root():
     return {
         "status": "ok",
         "version": api_version
-    }
\ No newline at end of file
+    }
+
+@router.get("/cache/stats", response_model=CacheStatsResponse)
+def cache_stats():
+    """
+    읽기 캐시 통계 (프로세스별 적중/실패 수, 캐시 크기 조정에 사용)
+    """
+    return cache.get_cache().info()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Prometheus 메트릭 (텍스트 형식)
+    
+    라우트별 요청 지연 시간/요청 수, 진행 중인 요청 수, 요청별 SQL 문 수와 DB 시간,
+    커넥션 풀 체크아웃 대기 시간과 상태, 캐시 적중률, 좋아요 버퍼 상태를 내보냅니다.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,68 +1,208 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.models import schemas
-from app.controllers import user_service
+from app.controllers import user_service, post_service, comment_service, pagination
 from app.database import get_db
-from typing import List
+from app import responses, conditional
+from typing import List, Optional
 
 router = APIRouter(tags=["Users"])
 
+def _post_detail(post, user, liked):
+    """사용자 게시물 정보 변환 (liked: 조회하는 사용자가 좋아요 한 게시물 ID 집합)"""
+    return {
+        "id": post.id,
+        "content": post.content,
+        "author": {
+            "id": user.id,
+            "username": user.username,
+            "profile_image_url": user.profile_image_url
+        },
+        "likes_count": post_service.buffered_likes_count(post.id, post.likes_count),
+        "comments_count": post.comments_count,
+        "is_liked": post.id in liked,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at
+    }
+
+def _comment_data(comment, user):
+    """사용자 댓글 정보 변환"""
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "post_id": comment.post_id,
+        "author": {
+            "id": user.id,
+            "username": user.username,
+            "profile_image_url": user.profile_image_url
+        },
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at
+    }
+
+def _profile_items(db, user_id, posts_limit, comments_limit, username, post_rows, comment_rows):
+    """프로필에 포함할 최근 게시물/댓글과 다음 커서, 좋아요 한 게시물 ID 집합 조회
+
+    post_rows/comment_rows에 버전 조회(post_service.post_versions 등)를 주면 ETag 계산용으로 조회합니다.
+    """
+    posts, posts_next_cursor = [], None
+    if posts_limit:
+        posts, _, _, _, _, posts_next_cursor = post_service.get_posts_list(
+            db, 1, posts_limit, count="none", author_id=user_id, rows=post_rows
+        )
+    liked = post_service.liked_post_ids(db, [post.id for post in posts], username)
+
+    comments, comments_next_cursor = [], None
+    if comments_limit:
+        comments, _, _, _, _, comments_next_cursor = comment_service.get_comments_by_author(
+            db, user_id, 1, comments_limit, count="none", rows=comment_rows
+        )
+    return posts, posts_next_cursor, liked, comments, comments_next_cursor
+
+def _profile_etag(user, posts_count, comments_count, posts, posts_next_cursor, liked, comments, comments_next_cursor) -> str:
+    """프로필 ETag (전체 조회와 버전 조회의 결과에서 같은 값)"""
+    return conditional.etag(
+        "user-profile", user.id, user.updated_at, posts_count, comments_count, posts_next_cursor, comments_next_cursor,
+        [
+            (post.id, post.updated_at, post_service.buffered_likes_count(post.id, post.likes_count),
+             post.comments_count, post.id in liked)
+            for post in posts
+        ],
+        [(comment.id, comment.updated_at) for comment in comments]
+    )
+
+def _profile_last_modified(user, posts, comments):
+    return conditional.latest(
+        user.updated_at, *(post.updated_at for post in posts), *(comment.updated_at for comment in comments)
+    )
+
 @router.get("/users/{userId}", response_model=schemas.UserProfile)
-def get_user_profile(userId: int, db: Session = Depends(get_db)):
+def get_user_profile(
+    userId: int,
+    request: Request,
+    response: Response,
+    posts_limit: int = Query(10, description="포함할 최근 게시물 수", ge=0, le=100),
+    comments_limit: int = Query(10, description="포함할 최근 댓글 수", ge=0, le=100),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항, 지정하면 is_liked 확인)"),
+    db: Session = Depends(get_db)
+):
     """
     사용자 프로필 조회
-    
+
     - **userId**: 사용자 ID
+    - **posts_limit**: 포함할 최근 게시물 수 (나머지는 /users/{userId}/posts에서 조회)
+    - **comments_limit**: 포함할 최근 댓글 수 (나머지는 /users/{userId}/comments에서 조회)
+    - **username**: 사용자 이름 (선택 사항, 지정하면 각 게시물의 is_liked를 확인)
+
+    ETag/Last-Modified 헤더를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
     """
-    user, posts_count = user_service.get_user_profile(db, userId)
-    
+    user, posts_count, comments_count = user_service.get_user_profile(db, userId)
+
+    # If-None-Match가 있으면 게시물/댓글의 내용 없이 버전만 조회해 먼저 비교
+    if conditional.is_conditional(request):
+        posts, posts_next_cursor, liked, comments, comments_next_cursor = _profile_items(
+            db, userId, posts_limit, comments_limit, username,
+            post_service.post_versions, comment_service.comment_versions
+        )
+        tag = _profile_etag(user, posts_count, comments_count, posts, posts_next_cursor, liked, comments, comments_next_cursor)
+        if conditional.matches(request, tag):
+            return conditional.not_modified(tag, _profile_last_modified(user, posts, comments), username is not None)
+
+    # 최근 게시물 및 댓글 일부만 조회 (총 개수는 위의 집계 쿼리 결과 사용)
+    posts, posts_next_cursor, liked, comments, comments_next_cursor = _profile_items(
+        db, userId, posts_limit, comments_limit, username,
+        post_service.post_rows, comment_service.comment_rows
+    )
+
     # 사용자의 게시물 및 댓글 목록 변환
-    user_profile = {
+    result = responses.fast_json({
         "id": user.id,
         "username": user.username,
         "profile_image_url": user.profile_image_url,
         "posts_count": posts_count,
-        "posts": [],
-        "comments": [],
+        "comments_count": comments_count,
+        "posts": [_post_detail(post, user, liked) for post in posts],
+        "comments": [_comment_data(comment, user) for comment in comments],
+        "posts_next_cursor": posts_next_cursor,
+        "comments_next_cursor": comments_next_cursor,
         "created_at": user.created_at,
         "updated_at": user.updated_at
-    }
-    
-    # 사용자 게시물 정보 추가
-    for post in user.posts:
-        likes_count = len(post.liked_by)
-        comments_count = len(post.comments)
-        
-        post_detail = {
-            "id": post.id,
-            "content": post.content,
-            "author": {
-                "id": user.id,
-                "username": user.username,
-                "profile_image_url": user.profile_image_url
-            },
-            "likes_count": likes_count,
-            "comments_count": comments_count,
-            "is_liked": False,  # 기본값
-            "created_at": post.created_at,
-            "updated_at": post.updated_at
-        }
-        user_profile["posts"].append(post_detail)
-    
-    # 사용자 댓글 정보 추가
-    for comment in user.comments:
-        comment_data = {
-            "id": comment.id,
-            "content": comment.content,
-            "post_id": comment.post_id,
-            "author": {
-                "id": user.id,
-                "username": user.username,
-                "profile_image_url": user.profile_image_url
-            },
-            "created_at": comment.created_at,
-            "updated_at": comment.updated_at
-        }
-        user_profile["comments"].append(comment_data)
-    
-    return user_profile
\ No newline at end of file
+    }, responses.user_profile)
+    return conditional.with_validators(
+        result, response,
+        _profile_etag(user, posts_count, comments_count, posts, posts_next_cursor, liked, comments, comments_next_cursor),
+        _profile_last_modified(user, posts, comments), username is not None
+    )
+
+@router.get("/users/{userId}/posts", response_model=schemas.PostList)
+def get_user_posts(
+    userId: int,
+    page: int = Query(1, description="페이지 번호", ge=1),
+    limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
+    username: Optional[str] = Query(None, description="사용자 이름 (선택 사항, 지정하면 is_liked 확인)"),
+    db: Session = Depends(get_db)
+):
+    """
+    사용자 게시물 목록 조회
+
+    - **userId**: 사용자 ID
+    - **page**: 페이지 번호 (1부터 시작)
+    - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    - **username**: 사용자 이름 (선택 사항, 지정하면 각 게시물의 is_liked를 확인)
+    """
+    user = user_service.get_user_by_id(db, userId)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    posts, total, page, limit, pages, next_cursor = post_service.get_posts_list(
+        db, page, limit, cursor, count, author_id=userId
+    )
+    liked = post_service.liked_post_ids(db, [post.id for post in posts], username)
+
+    return responses.fast_json({
+        "items": [_post_detail(post, user, liked) for post in posts],
+        "total": total,
+        "page": page,
+        "size": limit,
+        "pages": pages,
+        "next_cursor": next_cursor
+    }, responses.post_list)
+
+@router.get("/users/{userId}/comments", response_model=schemas.CommentList)
+def get_user_comments(
+    userId: int,
+    page: int = Query(1, description="페이지 번호", ge=1),
+    limit: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    count: str = Query("exact", description="총 개수 계산 방식 (exact, estimate, none)", pattern=pagination.COUNT_MODE_PATTERN),
+    db: Session = Depends(get_db)
+):
+    """
+    사용자 댓글 목록 조회
+
+    - **userId**: 사용자 ID
+    - **page**: 페이지 번호 (1부터 시작)
+    - **limit**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (지정하면 page 대신 사용)
+    - **count**: 총 개수 계산 방식 (exact: 정확히, estimate: 추정, none: 생략)
+    """
+    user = user_service.get_user_by_id(db, userId)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    comments, total, page, limit, pages, next_cursor = comment_service.get_comments_by_author(
+        db, userId, page, limit, cursor, count
+    )
+
+    return responses.fast_json({
+        "items": [_comment_data(comment, user) for comment in comments],
+        "total": total,
+        "page": page,
+        "size": limit,
+        "pages": pages,
+        "next_cursor": next_cursor
+    }, responses.comment_list)
@@ -0,0 +1,139 @@
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app import metrics
+
+# 느린 쿼리 기록 (SLOW_QUERY_THRESHOLD_MS를 지정하면 사용)
+#
+# 실행 시간이 기준을 넘은 SQL 문을 파라미터, 요청한 라우트, 실행 계획과 함께 로그로
+# 남기고 최근 SLOW_QUERY_LOG_SIZE개를 메모리의 링 버퍼에 보관합니다.
+# GET /admin/slow-queries 에서 조회하여 실제 트래픽에서 인덱스가 없는 쿼리를 찾습니다.
+#
+# - 실행 계획은 같은 연결에서 바로 구합니다 (SQLite: EXPLAIN QUERY PLAN, PostgreSQL: EXPLAIN).
+#   EXPLAIN은 쿼리를 다시 실행하지 않으며, 기준을 넘은 문에만 실행합니다.
+# - 라우트는 메트릭 미들웨어(METRICS_ENABLED)가 기록한 현재 요청에서 가져오며,
+#   요청 밖(좋아요 버퍼 반영 등)에서 실행된 문은 null 입니다.
+# - 기록에는 파라미터(게시물 내용 등)가 포함되므로 필요할 때만 켜세요.
+
+logger = logging.getLogger(__name__)
+
+# 실행 계획을 구할 문 (그 외 PRAGMA, SAVEPOINT 등은 계획 없이 기록)
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+def _json_parameters(parameters: Any) -> Any:
+    """DBAPI 파라미터(튜플/딕셔너리)를 JSON으로 보낼 수 있는 값으로 변환"""
+    if isinstance(parameters, dict):
+        return {key: _json_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_json_value(value) for value in parameters]
+    return _json_value(parameters)
+
+def _explain(dbapi_connection, dialect: str, statement: str, parameters: Any) -> List[str]:
+    """같은 연결에서 실행 계획 조회 (실패하면 오류 메시지 한 줄)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        if dialect == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        if dialect == "postgresql":
+            # EXPLAIN이 실패해도 진행 중인 트랜잭션이 중단되지 않도록 세이브포인트 안에서 실행
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute("EXPLAIN " + statement, parameters)
+                plan = [row[0] for row in cursor.fetchall()]
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        return []
+    except Exception as error:
+        return [f"EXPLAIN failed: {error}"]
+    finally:
+        cursor.close()
+
+class SlowQueryLog:
+    """기준 시간을 넘은 SQL 문을 보관하는 링 버퍼"""
+
+    def __init__(self, threshold_ms: Optional[float], size: int):
+        self.threshold_ms = threshold_ms
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms is not None
+
+    def record(self, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """최근 기록 (최신순)"""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def install(self, bind: Engine):
+        """엔진에 실행 시간 측정 이벤트 등록 (사용하지 않으면 아무것도 하지 않음)"""
+        if not self.enabled:
+            return
+        dialect = bind.dialect.name
+
+        @event.listens_for(bind, "before_cursor_execute")
+        def start_timer(conn, cursor, statement, parameters, context, executemany):
+            context._slow_query_started = time.perf_counter()
+
+        @event.listens_for(bind, "after_cursor_execute")
+        def check_duration(conn, cursor, statement, parameters, context, executemany):
+            duration_ms = (time.perf_counter() - context._slow_query_started) * 1000
+            if duration_ms < self.threshold_ms:
+                return
+
+            # executemany는 첫 번째 파라미터로 실행 계획을 구함
+            explain_parameters = parameters[0] if executemany and parameters else parameters
+            plan = []
+            if statement.lstrip()[:6].upper().startswith(EXPLAINABLE):
+                plan = _explain(conn.connection.dbapi_connection, dialect, statement, explain_parameters)
+            route = metrics.current_route()
+            self.record({
+                "duration_ms": round(duration_ms, 3),
+                "statement": statement,
+                "parameters": _json_parameters(explain_parameters),
+                "executemany": executemany,
+                "route": route,
+                "plan": plan,
+                "recorded_at": datetime.utcnow(),
+            })
+            logger.warning(
+                "Slow query (%.1f ms) on %s: %s %r plan=%s",
+                duration_ms, route or "-", " ".join(statement.split()), explain_parameters, " / ".join(plan)
+            )
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self.threshold_ms,
+            "recorded": self.recorded,
+            "items": self.entries(),
+        }
+
+slow_query_log = SlowQueryLog(settings.slow_query_threshold_ms, settings.slow_query_log_size)
@@ -0,0 +1,104 @@
+"""동기/비동기 데이터베이스 모드 동시성 벤치마크
+
+같은 데이터베이스에 대해 DATABASE_ASYNC=false/true 로 앱을 각각 띄우고
+(별도 프로세스, httpx ASGI 트랜스포트로 인프로세스 호출), 동시 요청 수를
+늘려가며 처리량과 지연 시간을 비교합니다. 동기 모드의 핸들러는 스레드풀
+(--threads, 기본 40)에서 실행되고, 비동기 모드는 이벤트 루프에서 실행됩니다.
+
+    python -m benchmarks.async_concurrency [--requests 2000] [--threads 40]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ENDPOINTS = ["/posts?limit=20", "/posts/{post_id}", "/posts/{post_id}/comments", "/search?username=user1"]
+CONCURRENCY = [1, 10, 50, 200]
+
+
+async def _drive(total_requests: int, concurrency: int, threads: int, posts: int):
+    import anyio.to_thread
+    import httpx
+    from main import app
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+    rng = random.Random(42)
+    paths = [
+        rng.choice(ENDPOINTS).format(post_id=rng.randint(1, posts))
+        for _ in range(total_requests)
+    ]
+    latencies = []
+    queue = iter(paths)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            for path in queue:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total_requests / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p95": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+async def _drive_all(args):
+    # 비동기 엔진의 커넥션 풀은 이벤트 루프에 묶이므로 하나의 루프에서 모두 측정
+    return {
+        concurrency: await _drive(args.requests, concurrency, args.threads, args.posts)
+        for concurrency in CONCURRENCY
+    }
+
+
+def _worker(args):
+    """DATABASE_ASYNC 환경 변수가 설정된 하위 프로세스에서 측정"""
+    print(json.dumps(asyncio.run(_drive_all(args))))
+
+
+def run(args):
+    from benchmarks.common import reset_database, seed_uniform
+
+    reset_database()
+    seed_uniform(args.posts, likes_per_post=10, comments_per_post=5)
+
+    results = {}
+    for mode in ("false", "true"):
+        env = dict(os.environ, DATABASE_ASYNC=mode)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.async_concurrency", "--worker",
+             "--requests", str(args.requests), "--threads", str(args.threads), "--posts", str(args.posts)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'concurrency':>11} {'mode':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for concurrency in CONCURRENCY:
+        for mode, label in (("false", "sync"), ("true", "async")):
+            row = results[mode][str(concurrency)]
+            print(f"{concurrency:>11} {label:>6} {row['rps']:>8.0f} {row['p50']:>8.1f} {row['p95']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+    if args.worker:
+        _worker(args)
+    else:
+        sys.exit(run(args))
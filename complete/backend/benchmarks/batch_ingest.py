@@ -0,0 +1,57 @@
+"""일괄 작성 벤치마크
+
+같은 수의 게시물과 댓글을 항목별 요청(POST /posts, POST /posts/{postId}/comments)과
+일괄 요청(POST /posts/batch, POST /comments/batch)으로 각각 작성하여
+처리량과 SQL 문 수를 비교합니다.
+
+    python -m benchmarks.batch_ingest [항목 수] [배치 크기]
+"""
+import sys
+import time
+
+from benchmarks.common import QueryCounter, reset_database
+from fastapi.testclient import TestClient
+from main import app
+
+AUTHORS = 20
+
+
+def _single(client: TestClient, items: int):
+    for i in range(items):
+        client.post("/posts", json={"content": f"post {i}", "username": f"writer{i % AUTHORS}"})
+    for i in range(items):
+        client.post(f"/posts/{i % items + 1}/comments", json={"content": f"comment {i}", "username": f"writer{i % AUTHORS}"})
+
+
+def _batch(client: TestClient, items: int, batch_size: int):
+    for start in range(0, items, batch_size):
+        chunk = range(start, min(start + batch_size, items))
+        client.post("/posts/batch", json={"items": [
+            {"content": f"post {i}", "username": f"writer{i % AUTHORS}"} for i in chunk
+        ]})
+    for start in range(0, items, batch_size):
+        chunk = range(start, min(start + batch_size, items))
+        client.post("/comments/batch", json={"items": [
+            {"post_id": i % items + 1, "content": f"comment {i}", "username": f"writer{i % AUTHORS}"} for i in chunk
+        ]})
+
+
+def run(items: int = 1000, batch_size: int = 100):
+    client = TestClient(app)
+    print(f"{'mode':>7} {'items/s':>9} {'statements':>11} {'posts':>6} {'comments':>9}")
+    for name, workload in (("single", lambda: _single(client, items)),
+                           ("batch", lambda: _batch(client, items, batch_size))):
+        reset_database()
+        with QueryCounter() as counter:
+            started = time.perf_counter()
+            workload()
+            elapsed = time.perf_counter() - started
+        posts = client.get("/posts", params={"limit": 1}).json()["total"]
+        comments = sum(client.get(f"/posts/{post_id}").json()["comments_count"] for post_id in range(1, items + 1))
+        print(f"{name:>7} {items * 2 / elapsed:>9.0f} {counter.count:>11} {posts:>6} {comments:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(run(int(args[0]) if args else 1000, int(args[1]) if len(args) > 1 else 100))
@@ -0,0 +1,96 @@
+"""벤치마크 공용 유틸리티
+
+벤치마크는 임시 디렉터리의 SQLite 파일을 사용하므로 실행 환경의
+threads_app.db 에는 영향을 주지 않습니다. app 패키지를 import 하기 전에
+이 모듈을 먼저 import 해야 합니다.
+"""
+import os
+import tempfile
+
+_BENCH_DIR = tempfile.mkdtemp(prefix="threads-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_BENCH_DIR}/bench.db")
+
+from sqlalchemy import event, insert
+from app.database import engine, Base, SessionLocal
+from app.models import models
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수를 세는 컨텍스트 매니저"""
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self.count = 0
+        self.statements = []
+        self.parameters = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._before_cursor_execute)
+        return False
+
+
+def reset_database():
+    """데이터베이스 파일을 지우고 테이블 생성 및 마이그레이션(검색 인덱스 등)을 다시 적용"""
+    from app import cache, migrations
+    from app.controllers import user_service
+
+    cache.get_cache().clear()
+    user_service.user_id_cache.clear()
+    engine.dispose()
+    database = engine.url.database
+    for suffix in ("", "-wal", "-shm"):
+        if database and os.path.exists(database + suffix):
+            os.remove(database + suffix)
+    Base.metadata.create_all(bind=engine)
+    migrations.upgrade(engine)
+
+
+def seed_uniform(posts: int, likes_per_post: int, comments_per_post: int):
+    """게시물마다 같은 수의 좋아요와 댓글을 가진 데이터셋 생성"""
+    users = max(likes_per_post, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            {"username": f"user{i}", "profile_image_url": None} for i in range(users)
+        ])
+        conn.execute(insert(models.Post), [
+            {"content": f"post {i}", "author_id": (i % users) + 1} for i in range(posts)
+        ])
+        if likes_per_post:
+            conn.execute(insert(models.post_likes), [
+                {"post_id": p + 1, "user_id": u + 1}
+                for p in range(posts) for u in range(likes_per_post)
+            ])
+        if comments_per_post:
+            conn.execute(insert(models.Comment), [
+                {"content": "x" * 200, "post_id": p + 1, "author_id": (c % users) + 1}
+                for p in range(posts) for c in range(comments_per_post)
+            ])
+
+
+def seed_posts(posts: int, authors: int = 100, batch: int = 10000):
+    """좋아요/댓글 없이 게시물만 대량 생성 (created_at은 1초 간격으로 증가)"""
+    from datetime import datetime, timedelta
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            {"username": f"user{i}", "profile_image_url": None} for i in range(authors)
+        ])
+        for offset in range(0, posts, batch):
+            conn.execute(insert(models.Post), [
+                {
+                    "content": f"post {i}",
+                    "author_id": (i % authors) + 1,
+                    "created_at": start + timedelta(seconds=i),
+                    "updated_at": start + timedelta(seconds=i)
+                }
+                for i in range(offset, min(offset + batch, posts))
+            ])
@@ -0,0 +1,52 @@
+"""조건부 GET 벤치마크
+
+변경이 없는 게시물 상세, 게시물 댓글 목록(100개), 사용자 프로필을 반복해서 조회하는
+클라이언트를 흉내 내어, 매번 전체 응답을 받는 경우와 이전 ETag를 If-None-Match로 보내
+304를 받는 경우의 요청당 처리 시간과 응답 크기를 비교합니다.
+
+    python -m benchmarks.conditional_get [요청 수]
+"""
+import sys
+import time
+
+from benchmarks.common import reset_database, seed_uniform
+from fastapi.testclient import TestClient
+
+from main import app
+
+PATHS = [
+    "/posts/1?username=user0",
+    "/posts/1/comments?limit=100",
+    "/users/1?posts_limit=20&comments_limit=20&username=user0",
+]
+
+
+def _poll(client: TestClient, path: str, requests: int, conditional: bool):
+    """(요청당 ms, 응답 본문 바이트)"""
+    tag = client.get(path).headers["etag"]
+    headers = {"If-None-Match": tag} if conditional else {}
+    expected = 304 if conditional else 200
+    size = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path, headers=headers)
+        assert response.status_code == expected, (path, response.status_code)
+        size = len(response.content)
+    return (time.perf_counter() - started) / requests * 1000, size
+
+
+def run(requests: int = 500) -> int:
+    reset_database()
+    seed_uniform(200, likes_per_post=20, comments_per_post=100)
+    client = TestClient(app)
+
+    print(f"{'path':>58} {'200 ms':>7} {'304 ms':>7} {'200 bytes':>10} {'304 bytes':>10}")
+    for path in PATHS:
+        full_ms, full_size = _poll(client, path, requests, conditional=False)
+        cached_ms, cached_size = _poll(client, path, requests, conditional=True)
+        print(f"{path:>58} {full_ms:>7.2f} {cached_ms:>7.2f} {full_size:>10} {cached_size:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
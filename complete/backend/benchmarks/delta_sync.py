@@ -0,0 +1,181 @@
+"""증분 동기화(GET /sync) 확인 및 폴링 비용 벤치마크
+
+1. 정확성: 워터마크를 받은 뒤 내보내기(/export/posts, /export/comments)로 만든 사본에
+   임의의 작성/수정/삭제, 좋아요/취소, 일괄 작성 중간중간 작은 limit로 받은 변경을
+   적용하고, 마지막에 새로 내보낸 데이터와 같은지 확인합니다. 다르면 실패합니다.
+2. 폴링 비용: 변경이 없을 때와 좋아요 10번, 댓글 1개가 생긴 뒤 /sync 한 번의 처리 시간,
+   응답 크기, SQL 문 수를 피드 첫 페이지(100개)를 다시 받는 경우와 비교합니다.
+
+    python -m benchmarks.delta_sync [폴링 수]
+"""
+import json
+import random
+import sys
+import time
+
+from benchmarks.common import QueryCounter, reset_database, seed_uniform
+from fastapi.testclient import TestClient
+
+from main import app
+
+USERS = 20
+
+
+def _export(client: TestClient):
+    """(게시물 ID -> 비교할 필드, 댓글 ID -> 비교할 필드)"""
+    posts = {}
+    for line in client.get("/export/posts").text.splitlines():
+        post = json.loads(line)
+        posts[post["id"]] = (post["content"], post["author"]["id"], post["likes_count"], post["comments_count"])
+    comments = {}
+    for line in client.get("/export/comments").text.splitlines():
+        comment = json.loads(line)
+        comments[comment["id"]] = (comment["content"], comment["post_id"], comment["author"]["id"])
+    return posts, comments
+
+
+def _sync(client: TestClient, watermark: int, posts, comments, limit: int) -> int:
+    """has_more가 false가 될 때까지 변경을 받아 사본에 적용하고 새 워터마크 반환"""
+    while True:
+        response = client.get("/sync", params={"since": watermark, "limit": limit})
+        assert response.status_code == 200, response.text
+        changes = response.json()
+        for post in changes["posts"]:
+            posts[post["id"]] = (post["content"], post["author"]["id"], post["likes_count"], post["comments_count"])
+        for status in changes["likes"]:
+            content, author_id, _, _ = posts[status["post_id"]]
+            posts[status["post_id"]] = (content, author_id, status["likes_count"], status["comments_count"])
+        for comment in changes["comments"]:
+            comments[comment["id"]] = (comment["content"], comment["post_id"], comment["author"]["id"])
+        for post_id in changes["deleted_posts"]:
+            posts.pop(post_id, None)
+            for comment_id in [key for key, value in comments.items() if value[1] == post_id]:
+                del comments[comment_id]
+        for comment in changes["deleted_comments"]:
+            comments.pop(comment["id"], None)
+        watermark = changes["watermark"]
+        if not changes["has_more"]:
+            return watermark
+
+
+def _mutate(client: TestClient, rng: random.Random, posts, comments):
+    """현재 데이터에 임의의 쓰기 요청 하나"""
+    username = f"user{rng.randrange(USERS)}"
+    post_id = rng.choice(list(posts))
+    action = rng.randrange(9)
+    if action == 0:
+        client.post("/posts", json={"content": f"new {rng.random()}", "username": username})
+    elif action == 1:
+        client.put(f"/posts/{post_id}", params={"username": f"user{posts[post_id][1] - 1}"}, json={"content": f"edit {rng.random()}"})
+    elif action == 2 and len(posts) > 10:
+        client.delete(f"/posts/{post_id}", params={"username": f"user{posts[post_id][1] - 1}"})
+    elif action in (3, 4):
+        method = client.post if action == 3 else client.delete
+        method(f"/posts/{post_id}/like", params={"username": username})
+    elif action == 5:
+        client.post(f"/posts/{post_id}/comments", json={"content": f"comment {rng.random()}", "username": username})
+    elif action == 6 and comments:
+        comment_id = rng.choice(list(comments))
+        author = f"user{comments[comment_id][2] - 1}"
+        if rng.random() < 0.5:
+            client.put(f"/comments/{comment_id}", params={"username": author}, json={"content": f"edit {rng.random()}"})
+        else:
+            client.delete(f"/comments/{comment_id}", params={"username": author})
+    elif action == 7:
+        client.post("/posts/batch", json={"items": [{"content": f"batch {i}", "username": username} for i in range(3)]})
+    elif action == 8:
+        client.post("/comments/batch", json={"items": [
+            {"post_id": rng.choice(list(posts)), "content": "batch", "username": username} for _ in range(3)
+        ] + [{"post_id": 10 ** 9, "content": "missing", "username": username}]})
+
+
+def check(rounds: int = 40) -> bool:
+    reset_database()
+    seed_uniform(50, likes_per_post=USERS, comments_per_post=2)
+    client = TestClient(app)
+    rng = random.Random(7)
+
+    # 워터마크를 먼저 받고 전체 데이터를 불러옴
+    watermark = client.get("/sync").json()["watermark"]
+    posts, comments = _export(client)
+    for round in range(rounds):
+        for _ in range(rng.randrange(1, 8)):
+            current, current_comments = _export(client)
+            _mutate(client, rng, current, current_comments)
+        if round % 3 == 0:
+            watermark = _sync(client, watermark, posts, comments, limit=rng.choice([1, 3, 7, 500]))
+
+    watermark = _sync(client, watermark, posts, comments, limit=5)
+    expected = _export(client)
+    ok = (posts, comments) == expected
+    print(f"replica: {len(posts)} posts, {len(comments)} comments, watermark {watermark}: {'same' if ok else 'DIFFERENT'}")
+    if not ok:
+        for name, actual, wanted in (("posts", posts, expected[0]), ("comments", comments, expected[1])):
+            differs = sorted(key for key in set(actual) | set(wanted) if actual.get(key) != wanted.get(key))
+            print(f"  {name} differ: {differs[:20]}")
+
+    stale = client.get("/sync", params={"since": watermark + 1})
+    ok &= stale.status_code == 410
+    print(f"watermark ahead of the server: {stale.status_code}")
+    return ok
+
+
+def _timed(client: TestClient, path: str, params):
+    """(응답, ms, SQL 문 수)"""
+    with QueryCounter() as counter:
+        started = time.perf_counter()
+        response = client.get(path, params=params)
+        elapsed = (time.perf_counter() - started) * 1000
+    assert response.status_code == 200, response.text
+    return response, elapsed, counter.count
+
+
+def _changes(client: TestClient, rng: random.Random):
+    """좋아요/취소 10번씩, 댓글 1개"""
+    for _ in range(10):
+        post_id = rng.randrange(1, 2001)
+        client.post(f"/posts/{post_id}/like", params={"username": "fan"})
+        client.delete(f"/posts/{post_id}/like", params={"username": "fan"})
+    client.post(f"/posts/{rng.randrange(1, 2001)}/comments", json={"content": "new", "username": "fan"})
+
+
+def measure(polls: int):
+    reset_database()
+    seed_uniform(2000, likes_per_post=USERS, comments_per_post=5)
+    client = TestClient(app)
+    client.post("/login", json={"username": "fan"})
+    rng = random.Random(7)
+    watermark = client.get("/sync").json()["watermark"]
+
+    print(f"\n{'poll':>28} {'ms':>7} {'bytes':>8} {'SQL':>5}")
+    results = {name: [0.0, 0, 0] for name in ("feed page (100 posts)", "sync, no changes", "sync, 20 likes + 1 comment")}
+    for _ in range(polls):
+        _changes(client, rng)
+        polled = [
+            ("sync, 20 likes + 1 comment", "/sync", {"since": watermark, "username": "user0"}),
+            ("sync, no changes", "/sync", None),
+            ("feed page (100 posts)", "/posts", {"limit": 100, "count": "none", "username": "user0"}),
+        ]
+        for name, path, params in polled:
+            response, elapsed, statements = _timed(client, path, params or {"since": watermark, "username": "user0"})
+            if path == "/sync":
+                watermark = response.json()["watermark"]
+            total = results[name]
+            total[0] += elapsed
+            total[1] = len(response.content)
+            total[2] += statements
+    for name, (elapsed, size, statements) in results.items():
+        print(f"{name:>28} {elapsed / polls:>7.2f} {size:>8} {statements / polls:>5.1f}")
+
+
+def run(polls: int = 200) -> int:
+    ok = check()
+    measure(polls)
+    if not ok:
+        print("\nSynced replica differs from the current data")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,162 @@
+"""실시간 이벤트(GET /events) 구독자 부하 테스트
+
+임시 데이터베이스로 uvicorn 서버(워커 1개)를 별도 프로세스로 띄우고, 구독자 수를
+늘려 가며 유휴 SSE 연결을 엽니다. 구독자 수마다 다음을 보고합니다.
+
+- 서버 프로세스 메모리(RSS)와 구독자 하나당 증가량
+- 게시물 하나를 작성했을 때 feed를 구독한 모든 연결이 post_created를 받기까지의
+  지연 시간 (p50/p99/최대)
+- 유휴 구독자가 있는 동안의 GET /posts/{id} 평균 지연 시간
+
+구독자 수만큼 파일 디스크립터가 필요합니다 (ulimit -n).
+
+    python -m benchmarks.event_fanout [최대 구독자 수]
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.common import reset_database, seed_uniform
+
+HOST = "127.0.0.1"
+CONNECT_BATCH = 200
+READS = 200
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+class Subscriber:
+    """SSE 연결 하나 (받은 이벤트 이름과 시각 기록)"""
+
+    def __init__(self):
+        self.received = {}
+        self.reader = None
+        self.writer = None
+
+    async def open(self, port: int, query: str):
+        self.reader, self.writer = await asyncio.open_connection(HOST, port)
+        self.writer.write(f"GET /events?{query} HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode())
+        await self.writer.drain()
+        status = await self.reader.readline()
+        assert b" 200 " in status, status
+        await self.reader.readuntil(b"\r\n\r\n")
+
+    async def read(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    return
+                if b"event: " in line:
+                    self.received.setdefault(line.split(b"event: ", 1)[1].strip().decode(), time.perf_counter())
+        except (ConnectionError, asyncio.CancelledError):
+            return
+
+    def close(self):
+        self.writer.close()
+
+
+async def _wait_for(subscribers, event: str, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if all(event in subscriber.received for subscriber in subscribers):
+            return True
+        await asyncio.sleep(0.005)
+    return False
+
+
+def _percentile(values, ratio: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * ratio), len(values) - 1)] if values else 0.0
+
+
+async def _run(port: int, pid: int, counts):
+    async with httpx.AsyncClient(base_url=f"http://{HOST}:{port}") as client:
+        await client.post("/login", json={"username": "writer"})
+        subscribers, readers = [], []
+        base_rss = _rss_kb(pid)
+        print(f"{'subscribers':>11} {'RSS MB':>7} {'KB/sub':>7} {'fan-out p50 ms':>15} {'p99 ms':>7} {'max ms':>7} {'GET ms':>7}")
+        for count in counts:
+            while len(subscribers) < count:
+                batch = [Subscriber() for _ in range(min(CONNECT_BATCH, count - len(subscribers)))]
+                await asyncio.gather(*(
+                    subscriber.open(port, f"feed=true&post_id={(len(subscribers) + i) % 100 + 1}")
+                    for i, subscriber in enumerate(batch)
+                ))
+                readers += [asyncio.create_task(subscriber.read()) for subscriber in batch]
+                subscribers += batch
+            await asyncio.sleep(0.5)
+            rss = _rss_kb(pid)
+
+            fan_out = []
+            if subscribers:
+                for subscriber in subscribers:
+                    subscriber.received.clear()
+                started = time.perf_counter()
+                response = await client.post("/posts", json={"content": "live", "username": "writer"})
+                assert response.status_code == 201, response.text
+                if not await _wait_for(subscribers, "post_created"):
+                    print(f"FAIL: {sum('post_created' not in s.received for s in subscribers)} subscribers missed the event")
+                    return False
+                fan_out = [(subscriber.received["post_created"] - started) * 1000 for subscriber in subscribers]
+
+            started = time.perf_counter()
+            for i in range(READS):
+                await client.get(f"/posts/{i % 100 + 1}")
+            get_ms = (time.perf_counter() - started) / READS * 1000
+
+            per_subscriber = (rss - base_rss) / count if count else 0.0
+            print(f"{count:>11} {rss / 1024:>7.1f} {per_subscriber:>7.1f} {_percentile(fan_out, 0.5):>15.1f} "
+                  f"{_percentile(fan_out, 0.99):>7.1f} {max(fan_out, default=0.0):>7.1f} {get_ms:>7.2f}")
+
+        for subscriber in subscribers:
+            subscriber.close()
+        for reader in readers:
+            reader.cancel()
+        return True
+
+
+def run(max_subscribers: int = 5000) -> int:
+    reset_database()
+    seed_uniform(100, likes_per_post=1, comments_per_post=1)
+    port = _free_port()
+    env = dict(os.environ, CACHE_BACKEND="memory", EVENT_BROKER="memory", EVENTS_MAX_SUBSCRIBERS=str(max_subscribers + 10))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", HOST, "--port", str(port),
+         "--log-level", "warning", "--timeout-graceful-shutdown", "1"],
+        env=env
+    )
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"http://{HOST}:{port}/")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        counts = [0] + [count for count in (100, 1000, 2000, 5000, 10000) if count <= max_subscribers]
+        ok = asyncio.run(_run(port, server.pid, counts))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
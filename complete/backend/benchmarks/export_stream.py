@@ -0,0 +1,67 @@
+"""내보내기 스트리밍 벤치마크
+
+게시물 수를 늘려 가며 NDJSON 내보내기(export_service.export_posts)와, 같은 데이터를
+목록 API의 컨트롤러(post_service.get_feed, 커서 방식, 페이지당 100개)로 끝까지 넘겨
+받는 경우의 처리량과 파이썬 메모리 최대 사용량(tracemalloc)을 비교합니다.
+HTTP 클라이언트의 버퍼링이 측정에 섞이지 않도록 서비스 함수를 직접 호출합니다.
+내보내기의 최대 메모리는 게시물 수와 관계없이 일정해야 합니다.
+
+    python -m benchmarks.export_stream [최대 게시물 수]
+"""
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import SessionLocal, reset_database, seed_posts
+from app.controllers import export_service, post_service
+
+
+def _export():
+    return sum(chunk.count("\n") for chunk in export_service.export_posts())
+
+
+def _paginate():
+    db = SessionLocal()
+    try:
+        rows, cursor = 0, None
+        while True:
+            page = post_service.get_feed(db, 1, 100, cursor, "none")
+            rows += len(page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return rows
+    finally:
+        db.close()
+
+
+def _measure(workload):
+    """(행 수, 초당 행 수, 최대 메모리 MB) - 처리량은 tracemalloc 없이 따로 측정"""
+    started = time.perf_counter()
+    rows = workload()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    workload()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, rows / elapsed, peak / 2 ** 20
+
+
+def run(max_posts: int = 100000):
+    print(f"{'posts':>8} {'export rows/s':>14} {'export peak MB':>15} {'paginate rows/s':>16} {'paginate peak MB':>17}")
+    for posts in [size for size in (max_posts // 10, max_posts // 2, max_posts) if size]:
+        reset_database()
+        seed_posts(posts)
+
+        exported, export_rate, export_peak = _measure(_export)
+        paginated, paginate_rate, paginate_peak = _measure(_paginate)
+        if exported != posts or paginated != posts:
+            print(f"FAIL: expected {posts} rows, exported {exported}, paginated {paginated}")
+            return 1
+        print(f"{posts:>8} {export_rate:>14.0f} {export_peak:>15.1f} {paginate_rate:>16.0f} {paginate_peak:>17.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(run(int(args[0]) if args else 100000))
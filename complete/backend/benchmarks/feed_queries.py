@@ -0,0 +1,47 @@
+"""GET /posts 쿼리 수 벤치마크
+
+좋아요와 댓글 수가 늘어나도 피드 한 페이지를 만드는 데 실행되는
+SQL 문 수가 일정하게 유지되는지 확인합니다.
+
+    python -m benchmarks.feed_queries
+"""
+import sys
+import time
+
+from benchmarks.common import QueryCounter, reset_database, seed_uniform
+from fastapi.testclient import TestClient
+from main import app
+
+SCALES = [
+    # (게시물 수, 게시물당 좋아요 수, 게시물당 댓글 수)
+    (100, 0, 0),
+    (100, 5, 2),
+    (100, 50, 20),
+    (100, 200, 50),
+]
+
+
+def run():
+    client = TestClient(app)
+    counts = set()
+    print(f"{'posts':>6} {'likes/post':>10} {'comments/post':>13} {'queries':>8} {'ms':>8}")
+    for posts, likes, comments in SCALES:
+        reset_database()
+        seed_uniform(posts, likes, comments)
+        with QueryCounter() as counter:
+            started = time.perf_counter()
+            response = client.get("/posts", params={"page": 1, "limit": 100})
+            elapsed = (time.perf_counter() - started) * 1000
+        response.raise_for_status()
+        counts.add(counter.count)
+        print(f"{posts:>6} {likes:>10} {comments:>13} {counter.count:>8} {elapsed:>8.1f}")
+
+    if len(counts) != 1:
+        print("FAIL: query count grows with likes/comments")
+        return 1
+    print("OK: query count is constant")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,205 @@
+"""HTTP 부하 테스트
+
+피드, 게시물 상세, 댓글 목록, 프로필, 검색 조회와 좋아요/취소, 댓글/게시물 작성을
+섞은 요청을 동시에 보내고 엔드포인트별 처리량과 p50/p95/p99 지연 시간을 보고합니다.
+게시물은 Zipf 분포로 골라 최신 게시물 일부에 요청이 몰리게 합니다.
+
+- 기본: 임시 SQLite 데이터베이스에 benchmarks.seed 로 데이터를 만들고 앱을
+  인프로세스(httpx ASGI 트랜스포트)로 호출합니다.
+- --url: 실행 중인 서버(예: uvicorn main:app)에 요청합니다. 서버의 데이터베이스는
+  미리 채워 두어야 합니다 (python -m benchmarks.seed).
+
+--output 으로 결과를 JSON으로 저장하고, 이후 --baseline 으로 그 결과와 비교하면
+p95가 --tolerance 이상 느려진 엔드포인트가 있을 때 실패합니다.
+
+    python -m benchmarks.load_test [--requests 5000] [--concurrency 20] [--url http://localhost:8000]
+                                   [--users 1000] [--posts 10000] [--output result.json]
+                                   [--baseline result.json] [--tolerance 0.2]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.seed import Zipf
+
+# 요청 종류별 비율 (합이 100이 아니어도 됨)
+WORKLOAD = {
+    "GET /posts": 35,
+    "GET /posts/{id}": 25,
+    "GET /posts/{id}/comments": 10,
+    "GET /users/{id}": 10,
+    "GET /search/posts": 5,
+    "POST /posts/{id}/like": 8,
+    "POST /posts/{id}/comments": 4,
+    "POST /posts": 3,
+}
+
+# 쓰기 요청에 사용할 사용자 수 (loadtest{번호})
+WRITERS = 200
+
+# 기준 결과와 비교할 최소 요청 수 (적으면 p95가 불안정)
+MIN_COMPARE_REQUESTS = 20
+
+SEARCH_TERMS = ["lorem", "ipsum", "post 1", "comment", "hello"]
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * ratio), len(values) - 1)] * 1000
+
+
+async def _prepare(client: httpx.AsyncClient):
+    """쓰기 사용자 로그인 후 최신 게시물 ID 범위와 작성자 ID 목록 조회"""
+    for writer in range(WRITERS):
+        (await client.post("/login", json={"username": f"loadtest{writer}"})).raise_for_status()
+    page = (await client.get("/posts", params={"limit": 100})).json()
+    if not page["items"]:
+        raise SystemExit("No posts found; seed the database first (python -m benchmarks.seed)")
+    newest = page["items"][0]["id"]
+    post_ids = list(range(newest, max(newest - page["total"], 0), -1))
+    user_ids = sorted({item["author"]["id"] for item in page["items"]})
+    return post_ids, user_ids
+
+
+def _request(label: str, rng: random.Random, posts: Zipf, post_ids, user_ids, liked):
+    """요청 종류에 맞는 (메서드, 경로, 파라미터, 본문, 보고용 이름) 생성"""
+    post_id = post_ids[min(posts.sample(), len(post_ids) - 1)]
+    username = f"loadtest{rng.randrange(WRITERS)}"
+    if label == "GET /posts":
+        return "GET", "/posts", {"limit": 20, "username": username}, None, label
+    if label == "GET /posts/{id}":
+        return "GET", f"/posts/{post_id}", {"username": username}, None, label
+    if label == "GET /posts/{id}/comments":
+        return "GET", f"/posts/{post_id}/comments", {"limit": 20}, None, label
+    if label == "GET /users/{id}":
+        return "GET", f"/users/{rng.choice(user_ids)}", {"username": username}, None, label
+    if label == "GET /search/posts":
+        return "GET", "/search/posts", {"q": rng.choice(SEARCH_TERMS), "limit": 20}, None, label
+    if label == "POST /posts/{id}/like":
+        # 이미 좋아요 한 게시물이면 취소
+        key = (username, post_id)
+        if key in liked:
+            liked.discard(key)
+            return "DELETE", f"/posts/{post_id}/like", {"username": username, "idempotent": "true"}, None, "DELETE /posts/{id}/like"
+        liked.add(key)
+        return "POST", f"/posts/{post_id}/like", {"username": username, "idempotent": "true"}, None, label
+    if label == "POST /posts/{id}/comments":
+        return "POST", f"/posts/{post_id}/comments", None, {"content": "load test comment", "username": username}, label
+    return "POST", "/posts", None, {"content": "load test post", "username": username}, label
+
+
+async def _drive(client: httpx.AsyncClient, args) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(args.seed)
+    post_ids, user_ids = await _prepare(client)
+    posts = Zipf(len(post_ids), args.skew, rng)
+    labels, weights = list(WORKLOAD), list(WORKLOAD.values())
+    liked = set()
+    requests = iter([
+        _request(label, rng, posts, post_ids, user_ids, liked)
+        for label in rng.choices(labels, weights, k=args.requests)
+    ])
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    async def worker():
+        for method, path, params, body, label in requests:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, params=params, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[label].append(time.perf_counter() - started)
+            if failed:
+                errors[label] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    results = {}
+    for label in sorted(latencies, key=lambda name: -len(latencies[name])) + ["total"]:
+        values = sorted(latencies[label]) if label != "total" else sorted(v for vs in latencies.values() for v in vs)
+        results[label] = {
+            "requests": len(values),
+            "errors": errors[label] if label != "total" else sum(errors.values()),
+            "rps": len(values) / elapsed,
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+        }
+    return results
+
+
+async def _run_in_process(args):
+    from benchmarks.common import engine, reset_database
+    from benchmarks.seed import seed
+    from main import app
+
+    reset_database()
+    seed(engine, args.users, args.posts, args.likes_per_post, args.comments_per_post)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load-test") as client:
+        return await _drive(client, args)
+
+
+async def _run_remote(args):
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        return await _drive(client, args)
+
+
+def _report(results, baseline, tolerance: float) -> bool:
+    """결과 표 출력, 기준 결과보다 p95가 허용치 이상 느려진 엔드포인트가 있으면 False"""
+    print(f"{'endpoint':>27} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    ok = True
+    for label, row in results.items():
+        note = ""
+        if baseline and label in baseline and row["requests"] >= MIN_COMPARE_REQUESTS:
+            limit = baseline[label]["p95"] * (1 + tolerance)
+            if row["p95"] > limit:
+                ok = False
+                note = f"  REGRESSED (baseline p95 {baseline[label]['p95']:.1f} ms)"
+        print(f"{label:>27} {row['requests']:>9} {row['errors']:>7} {row['rps']:>8.0f} "
+              f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f}{note}")
+    return ok
+
+
+def run(args):
+    results = asyncio.run(_run_remote(args) if args.url else _run_in_process(args))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    ok = _report(results, baseline, args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--url", help="실행 중인 서버 주소 (지정하지 않으면 인프로세스로 실행)")
+    parser.add_argument("--users", type=int, default=1000, help="인프로세스 실행 시 생성할 사용자 수")
+    parser.add_argument("--posts", type=int, default=10000, help="인프로세스 실행 시 생성할 게시물 수")
+    parser.add_argument("--likes-per-post", type=float, default=20)
+    parser.add_argument("--comments-per-post", type=float, default=3)
+    parser.add_argument("--skew", type=float, default=1.1, help="게시물 선택 Zipf 지수 (클수록 최신 게시물에 집중)")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 p95 증가 비율")
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,62 @@
+"""메트릭 수집 오버헤드 벤치마크
+
+METRICS_ENABLED=false/true 로 앱을 각각 별도 프로세스에서 띄우고 같은 읽기 요청
+(피드, 게시물 상세)을 순서대로 보내 요청당 처리 시간을 비교합니다. 측정 편차를 줄이기
+위해 두 모드를 번갈아 ROUNDS번 실행하고 가장 빠른 결과를 사용합니다.
+
+    python -m benchmarks.metrics_overhead [요청 수]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+POSTS = 500
+ROUNDS = 3
+
+
+def _worker(requests: int):
+    from benchmarks.common import reset_database, seed_uniform
+    from fastapi.testclient import TestClient
+    from main import app
+
+    reset_database()
+    seed_uniform(POSTS, likes_per_post=5, comments_per_post=2)
+    client = TestClient(app)
+    paths = [f"/posts/{i % POSTS + 1}" if i % 2 else "/posts?limit=20" for i in range(requests)]
+    for path in paths[:200]:
+        client.get(path)
+
+    started = time.perf_counter()
+    for path in paths:
+        client.get(path)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"us_per_request": elapsed / requests * 1e6}))
+
+
+def run(requests: int = 5000):
+    results = {}
+    for _ in range(ROUNDS):
+        for mode in ("false", "true"):
+            env = dict(os.environ, METRICS_ENABLED=mode)
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.metrics_overhead", "--worker", str(requests)],
+                env=env, check=True, capture_output=True, text=True
+            ).stdout
+            elapsed = json.loads(output.strip().splitlines()[-1])["us_per_request"]
+            results[mode] = min(results.get(mode, elapsed), elapsed)
+
+    print(f"{'metrics':>8} {'us/request':>11}")
+    for mode, label in (("false", "off"), ("true", "on")):
+        print(f"{label:>8} {results[mode]:>11.0f}")
+    print(f"overhead: {results['true'] - results['false']:.0f} us/request ({results['true'] / results['false'] - 1:+.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "--worker":
+        _worker(int(args[1]))
+    else:
+        sys.exit(run(int(args[0]) if args else 5000))
@@ -0,0 +1,54 @@
+"""게시물 목록 페이지 깊이별 지연 시간 벤치마크
+
+같은 깊이의 페이지를 OFFSET 방식과 커서(키셋) 방식으로 조회하여
+페이지가 깊어질 때 지연 시간이 어떻게 변하는지 비교합니다.
+
+    python -m benchmarks.pagination_depth [게시물 수]
+"""
+import sys
+import time
+
+from benchmarks.common import SessionLocal, reset_database, seed_posts
+from app.controllers import post_service, pagination
+from app.models import models
+
+LIMIT = 20
+REPEAT = 5
+
+
+def _timed(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(total_posts: int = 100000):
+    reset_database()
+    seed_posts(total_posts)
+    db = SessionLocal()
+    try:
+        depths = [1, 10, 100, 1000, total_posts // LIMIT]
+        print(f"{'page':>8} {'offset ms':>10} {'cursor ms':>10} {'cursor+none ms':>15}")
+        for page in depths:
+            # 해당 깊이의 커서는 직전 행의 (created_at, id)로 만든다
+            cursor = None
+            if page > 1:
+                previous = db.query(models.Post).order_by(
+                    models.Post.created_at.desc(), models.Post.id.desc()
+                ).offset((page - 1) * LIMIT - 1).first()
+                cursor = pagination.encode_cursor(previous.created_at, previous.id)
+
+            offset_ms = _timed(lambda: post_service.get_posts_list(db, page, LIMIT))
+            cursor_ms = _timed(lambda: post_service.get_posts_list(db, page, LIMIT, cursor))
+            none_ms = _timed(lambda: post_service.get_posts_list(db, page, LIMIT, cursor, "none"))
+            print(f"{page:>8} {offset_ms:>10.2f} {cursor_ms:>10.2f} {none_ms:>15.2f}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,155 @@
+"""엔드포인트별 쿼리 수 예산 점검
+
+app/routes 의 모든 엔드포인트에 요청 하나당 실행할 수 있는 SQL 문 수(예산)를 선언하고,
+좋아요/댓글 수가 다른 여러 규모의 데이터에서 요청마다 실행된 SQL 문 수를 셉니다.
+예산을 넘거나, 데이터 규모에 따라 SQL 문 수가 달라지거나(N+1), 예산이 선언되지 않은
+엔드포인트가 있으면 실패합니다.
+
+캐시에 가려지지 않도록 읽기 캐시를 끄고 사용자 이름 -> ID 캐시를 요청마다 비운 상태
+(가장 많은 쿼리를 실행하는 경우)로 측정합니다. 엔드포인트를 추가하거나 쿼리 수가 바뀌는
+변경을 하면 BUDGETS 를 함께 수정하세요.
+
+    python -m benchmarks.query_budgets
+
+같은 점검을 pytest(tests/test_query_budgets.py)로도 실행합니다.
+"""
+import sys
+
+from benchmarks.common import QueryCounter, reset_database, seed_uniform
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from app import cache
+from app.config import settings
+from app.controllers import user_service
+from main import app
+
+SCALES = [
+    # (게시물 수, 게시물당 좋아요 수, 게시물당 댓글 수)
+    (30, 0, 0),
+    (30, 10, 5),
+    (30, 100, 30),
+]
+
+# 시드 데이터: user0(ID 1)이 게시물 1과 그 첫 댓글(ID 1)의 작성자
+# (좋아요 요청은 로그인 요청에서 새로 만든 budget-fan 사용자로 보냄)
+USERNAME = "user0"
+
+# (메서드, 경로) -> (요청 하나당 최대 SQL 문 수, 요청 파라미터, status: 예상되는 오류 응답 코드)
+# 쓰기 요청은 아래 순서대로 실행되므로 앞의 요청 결과(예: 좋아요)를 전제로 합니다.
+# 쓰기 요청에는 변경 기록(GET /sync) 추가 한 번이 포함됩니다.
+BUDGETS = {
+    ("GET", "/"): (0, {}),
+    ("GET", "/cache/stats"): (0, {}),
+    ("GET", "/metrics"): (0, {}),
+    # 관리 토큰(ADMIN_TOKEN)이 기본적으로 없어 403
+    ("GET", "/admin/slow-queries"): (0, {"status": 403}),
+    ("DELETE", "/admin/slow-queries"): (0, {"status": 403}),
+    ("POST", "/login"): (3, {"json": {"username": "budget-fan"}}),
+    ("GET", "/users/{userId}"): (7, {"path": {"userId": 1}, "params": {"username": USERNAME}}),
+    ("GET", "/users/{userId}/posts"): (5, {"path": {"userId": 1}, "params": {"username": USERNAME, "limit": 20}}),
+    ("GET", "/users/{userId}/comments"): (3, {"path": {"userId": 1}, "params": {"limit": 20}}),
+    ("GET", "/search"): (2, {"params": {"username": "user", "limit": 20}}),
+    ("GET", "/search/posts"): (4, {"params": {"q": "post", "limit": 20, "username": USERNAME}}),
+    ("GET", "/posts"): (4, {"params": {"limit": 20, "username": USERNAME}}),
+    ("GET", "/posts/likes"): (3, {"params": {"ids": list(range(1, 21)), "username": USERNAME}}),
+    ("GET", "/posts/{postId}"): (3, {"path": {"postId": 1}, "params": {"username": USERNAME}}),
+    ("GET", "/posts/{postId}/comments"): (3, {"path": {"postId": 1}, "params": {"limit": 20}}),
+    # 이벤트 스트림은 끝나지 않으므로 구독할 토픽 없이 요청해 400
+    ("GET", "/events"): (0, {"status": 400}),
+    ("GET", "/export/posts"): (1, {}),
+    ("GET", "/export/comments"): (1, {}),
+    ("POST", "/posts"): (5, {"json": {"content": "budget", "username": USERNAME}}),
+    ("POST", "/posts/batch"): (24, {"json": {"items": [{"content": f"batch {i}", "username": f"writer{i % 3}"} for i in range(20)]}}),
+    ("PUT", "/posts/{postId}"): (7, {"path": {"postId": 1}, "params": {"username": USERNAME}, "json": {"content": "edited"}}),
+    ("POST", "/posts/{postId}/like"): (4, {"path": {"postId": 2}, "params": {"username": "budget-fan"}}),
+    ("DELETE", "/posts/{postId}/like"): (4, {"path": {"postId": 2}, "params": {"username": "budget-fan"}}),
+    ("POST", "/posts/{postId}/comments"): (7, {"path": {"postId": 1}, "json": {"content": "budget", "username": USERNAME}}),
+    ("POST", "/comments/batch"): (28, {"json": {"items": [{"post_id": 1 + i % 5, "content": "batch", "username": f"writer{i % 3}"} for i in range(20)]}}),
+    ("PUT", "/comments/{commentId}"): (6, {"path": {"commentId": 1}, "params": {"username": USERNAME}, "json": {"content": "edited"}}),
+    ("DELETE", "/comments/{commentId}"): (5, {"path": {"commentId": 1}, "params": {"username": USERNAME}}),
+    ("DELETE", "/posts/{postId}"): (6, {"path": {"postId": 1}, "params": {"username": USERNAME}}),
+    # 위 쓰기 요청들의 변경 전체 (게시물, 좋아요 수, 댓글, 삭제 표시)
+    ("GET", "/sync"): (7, {"params": {"since": 0, "username": USERNAME}}),
+}
+
+
+def _routes():
+    """애플리케이션에 등록된 (메서드, 경로) 목록"""
+    return {
+        (method, route.path)
+        for route in app.routes if isinstance(route, APIRoute)
+        for method in route.methods if method not in ("HEAD", "OPTIONS")
+    }
+
+
+def _measure(client: TestClient):
+    """현재 데이터에서 BUDGETS 순서대로 요청하고 (메서드, 경로) -> SQL 문 수 반환"""
+    counts = {}
+    for (method, path), (_, request) in BUDGETS.items():
+        user_service.user_id_cache.clear()
+        with QueryCounter() as counter:
+            response = client.request(
+                method, path.format(**request.get("path", {})),
+                params=request.get("params"), json=request.get("json")
+            )
+        if response.status_code >= 400 and response.status_code != request.get("status"):
+            raise RuntimeError(f"{method} {path} failed: {response.status_code} {response.text}")
+        counts[(method, path)] = counter.count
+    return counts
+
+
+def missing_budgets():
+    """예산이 선언되지 않은 (메서드, 경로) 목록"""
+    return sorted(_routes() - set(BUDGETS))
+
+
+def measure_scales():
+    """SCALES 의 데이터 규모마다 측정한 (메서드, 경로) -> SQL 문 수 목록 (읽기 캐시 끔)"""
+    previous = cache.get_cache()
+    cache.set_cache(cache.NullCache(settings.cache_ttl))
+    try:
+        client = TestClient(app)
+        results = []
+        for posts, likes, comments in SCALES:
+            reset_database()
+            seed_uniform(posts, likes, comments)
+            results.append(_measure(client))
+    finally:
+        cache.set_cache(previous)
+    return results
+
+
+def problems(budget: int, counts):
+    """규모별 SQL 문 수에서 찾은 문제 (예산 초과, 데이터 규모에 따른 증가)"""
+    found = []
+    if max(counts) > budget:
+        found.append("over budget")
+    if len(set(counts)) > 1:
+        found.append("grows with data")
+    return found
+
+
+def run():
+    missing = missing_budgets()
+    if missing:
+        print("FAIL: no query budget declared for " + ", ".join(f"{method} {path}" for method, path in missing))
+        return 1
+
+    results = measure_scales()
+
+    failed = False
+    scale_labels = [f"{likes}/{comments}" for _, likes, comments in SCALES]
+    print(f"{'endpoint':>34} {'budget':>6} " + " ".join(f"{label:>7}" for label in scale_labels))
+    for key, (budget, _) in BUDGETS.items():
+        counts = [result[key] for result in results]
+        found = problems(budget, counts)
+        failed = failed or bool(found)
+        print(f"{key[0] + ' ' + key[1]:>34} {budget:>6} " + " ".join(f"{count:>7}" for count in counts)
+              + (f"  FAIL: {', '.join(found)}" if found else ""))
+
+    print("FAIL: some endpoints exceed their query budget" if failed else "OK: all endpoints are within their query budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,143 @@
+"""서비스 쿼리 실행 계획 점검
+
+피드, 목록, 카운트 등 자주 실행되는 서비스 함수를 실행하면서 SQL 문을 수집하고,
+각 문의 EXPLAIN QUERY PLAN에서 인덱스 없이 테이블 전체를 읽거나(SCAN <테이블>)
+정렬을 위해 임시 B-트리를 만드는(USE TEMP B-TREE) 경우가 있으면 실패합니다.
+count=exact의 전체 개수처럼 커버링 인덱스 전체를 읽는 것은 허용합니다.
+
+경우마다 기대하는 접근 경로(예: 검색의 FTS5 MATCH, 피드의 ix_posts_created_at_id)를
+선언하며, 어느 SQL 문의 실행 계획에도 나타나지 않으면 실패합니다. 관련도 순 검색의 상위
+후보 정렬처럼 크기가 제한된 정렬이나, 3글자 미만 검색어의 ILIKE처럼 기본키 순서로 읽다
+LIMIT에서 멈추는 읽기는 경우별로 허용합니다.
+
+    python -m benchmarks.query_plans
+
+같은 점검을 pytest(tests/test_query_plans.py)로도 실행합니다.
+"""
+import re
+import sys
+
+from benchmarks.common import QueryCounter, SessionLocal, engine, reset_database, seed_uniform
+from app import cache
+from app.config import settings
+from app.controllers import post_service, comment_service, user_service, pagination, export_service, change_log, sync_service
+
+FULL_SCAN = re.compile(r"^SCAN \w+$")
+
+# 경우별로 허용하는 문제 (scan: 전체 스캔, sort: 임시 B-트리 정렬)
+SCAN = "scan"
+SORT = "sort"
+
+
+def _cases(db):
+    cursor = pagination.encode_cursor(post_service.get_post(db, 50).created_at, 50)
+    since = post_service.get_post(db, 150).created_at
+    change_log.record(db, [
+        change_log.post_change(1, change_log.UPSERT),
+        change_log.post_change(2, change_log.COUNTS),
+        change_log.comment_change(1, 1, change_log.UPSERT),
+        change_log.post_change(3, change_log.DELETE),
+    ])
+    id_cursor = pagination.encode_id_cursor(100)
+    cases = [
+        ("feed", lambda: post_service.get_posts_list(db, 1, 20)),
+        ("feed (cursor)", lambda: post_service.get_posts_list(db, 1, 20, cursor)),
+        ("feed (estimate)", lambda: post_service.get_posts_list(db, 1, 20, count="estimate")),
+        ("user posts", lambda: post_service.get_posts_list(db, 1, 20, author_id=1)),
+        ("user posts (cursor)", lambda: post_service.get_posts_list(db, 1, 20, cursor, author_id=1)),
+        ("post comments", lambda: comment_service.get_comments_for_post(db, 1, 1, 20)),
+        ("user comments", lambda: comment_service.get_comments_by_author(db, 1, 1, 20)),
+        ("user profile counts", lambda: user_service.get_user_profile(db, 1)),
+        ("like check", lambda: post_service.is_liked_by(db, 1, 1)),
+        ("user id by name", lambda: user_service.get_user_id(db, "user1")),
+        ("recount counters", lambda: post_service.recount_post_counters(db, [1, 2, 3])),
+        ("export posts", lambda: list(export_service.export_posts())),
+        ("export posts (since)", lambda: list(export_service.export_posts(since))),
+        ("export comments", lambda: list(export_service.export_comments())),
+        ("export comments (since)", lambda: list(export_service.export_comments(since))),
+        ("sync", lambda: sync_service.get_changes(db, 0, username="user1")),
+    ]
+    # (이름, 호출, 기대하는 실행 계획 문자열, 허용하는 문제)
+    cases = [(name, call, None, ()) for name, call in cases]
+    cases += [
+        ("feed page (get_feed)", lambda: post_service.get_feed(db, 1, 20, username="user1"), "USING INDEX ix_posts_created_at_id", ()),
+        ("feed page (get_feed, cursor)", lambda: post_service.get_feed(db, 1, 20, cursor), "USING INDEX ix_posts_created_at_id", ()),
+        ("post detail", lambda: post_service.get_post_detail(db, 5, "user1"), "SEARCH posts USING INTEGER PRIMARY KEY", ()),
+        ("search users (fts)", lambda: user_service.search_users(db, "user", 1, 10), "SCAN users_fts VIRTUAL TABLE INDEX", ()),
+        ("search users (fts, cursor)", lambda: user_service.search_users(db, "user", 1, 10, id_cursor), "SCAN users_fts VIRTUAL TABLE INDEX", ()),
+        # 관련도 순은 최신 RELEVANCE_CANDIDATES개 후보를 임시 테이블로 만들어 읽고 정렬
+        ("search users (fts, relevance)", lambda: user_service.search_users(db, "user", 1, 10, sort="relevance"), "SCAN users_fts VIRTUAL TABLE INDEX", (SCAN, SORT)),
+        # 3글자 미만 검색어는 기본키 역순으로 읽다가 LIMIT에서 멈춤 (정렬 없음)
+        ("search users (ilike)", lambda: user_service.search_users(db, "us", 1, 10, count="none"), "SCAN users", (SCAN,)),
+        ("search users (ilike, cursor)", lambda: user_service.search_users(db, "us", 1, 10, id_cursor, count="none"), "SEARCH users USING INTEGER PRIMARY KEY (rowid<?)", ()),
+        ("search users (ilike, relevance)", lambda: user_service.search_users(db, "us", 1, 10, sort="relevance"), "SCAN users", (SCAN, SORT)),
+        ("search posts (fts)", lambda: post_service.search_posts(db, "post", 1, 10), "SCAN posts_fts VIRTUAL TABLE INDEX", ()),
+        ("search posts (fts, cursor)", lambda: post_service.search_posts(db, "post", 1, 10, id_cursor), "SCAN posts_fts VIRTUAL TABLE INDEX", ()),
+        ("search posts (fts, relevance)", lambda: post_service.search_posts(db, "post", 1, 10, sort="relevance"), "SCAN posts_fts VIRTUAL TABLE INDEX", (SCAN, SORT)),
+        ("search posts (ilike)", lambda: post_service.search_posts(db, "po", 1, 10, count="none"), "SCAN posts", (SCAN,)),
+        ("search posts (ilike, cursor)", lambda: post_service.search_posts(db, "po", 1, 10, id_cursor, count="none"), "SEARCH posts USING INTEGER PRIMARY KEY (rowid<?)", ()),
+    ]
+    return cases
+
+
+def _problems(db, statement, parameters, allowed=()):
+    plan = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    details = [row[-1] for row in plan]
+    problems = [d for d in details if "TEMP B-TREE" in d] if SORT not in allowed else []
+    problems += [d for d in details if FULL_SCAN.match(d)] if SCAN not in allowed else []
+    return problems, details
+
+
+def check_plans():
+    """시드 데이터에서 각 경우의 SQL 문 실행 계획을 점검해 (이름, 문제, 계획) 목록 반환
+
+    SQLite가 아니면 빈 목록을 반환합니다.
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    reset_database()
+    seed_uniform(posts=200, likes_per_post=5, comments_per_post=3)
+
+    results = []
+    # 캐시에 가려지지 않도록 읽기 캐시를 끄고 측정
+    previous = cache.get_cache()
+    cache.set_cache(cache.NullCache(settings.cache_ttl))
+    db = SessionLocal()
+    try:
+        for name, call, expected, allowed in _cases(db):
+            with QueryCounter() as counter:
+                call()
+            plans = []
+            for statement, parameters in zip(counter.statements, counter.parameters):
+                if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                    continue
+                problems, details = _problems(db, statement, parameters, allowed)
+                plans += details
+                results.append((name, problems, details))
+            if expected and not any(expected in detail for detail in plans):
+                results.append((name, [f"expected plan: {expected}"], plans))
+    finally:
+        db.rollback()
+        db.close()
+        cache.set_cache(previous)
+    return results
+
+
+def run():
+    if engine.dialect.name != "sqlite":
+        print("SKIP: EXPLAIN QUERY PLAN 점검은 SQLite에서만 실행합니다")
+        return 0
+
+    failed = False
+    for name, problems, details in check_plans():
+        status = "FAIL" if problems else "ok"
+        failed = failed or bool(problems)
+        print(f"[{status:>4}] {name}: {' / '.join(details)}")
+
+    print("FAIL: some queries scan or sort without an index" if failed else "OK: all queries use an index")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,72 @@
+"""읽기 캐시 벤치마크
+
+읽기가 대부분인 요청 흐름(피드 첫 페이지, 게시물 상세, 가끔 좋아요/댓글)을
+캐시 백엔드별로 실행하여 처리량, 요청당 SQL 문 수, 캐시 적중률을 비교합니다.
+fakeredis가 설치되어 있으면 RedisCache도 함께 측정합니다.
+
+    python -m benchmarks.read_cache [요청 수] [쓰기 비율]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import QueryCounter, reset_database, seed_posts
+from fastapi.testclient import TestClient
+from app import cache
+from app.config import settings
+from main import app
+
+POSTS = 2000
+HOT_POSTS = 100
+
+
+def _backends():
+    backends = [
+        ("none", cache.NullCache(settings.cache_ttl)),
+        ("memory", cache.MemoryCache(settings.cache_ttl, settings.cache_max_entries)),
+    ]
+    try:
+        import fakeredis
+        backends.append(("fakeredis", cache.RedisCache(fakeredis.FakeRedis(), settings.cache_ttl)))
+    except ImportError:
+        pass
+    return backends
+
+
+def _workload(client: TestClient, requests: int, write_ratio: float):
+    rng = random.Random(11)
+    for i in range(requests):
+        post_id = POSTS - rng.randrange(HOT_POSTS)
+        roll = rng.random()
+        if roll < write_ratio / 2:
+            client.post(f"/posts/{post_id}/like", params={"username": f"reader{i}"})
+        elif roll < write_ratio:
+            client.post(f"/posts/{post_id}/comments", json={"content": "hi", "username": f"reader{i % 50}"})
+        elif roll < 0.5:
+            client.get("/posts", params={"limit": 20})
+        else:
+            client.get(f"/posts/{post_id}")
+
+
+def run(requests: int = 2000, write_ratio: float = 0.02):
+    client = TestClient(app)
+    print(f"{'backend':>10} {'req/s':>8} {'queries/req':>12} {'hit rate':>9}")
+    for name, backend in _backends():
+        cache.set_cache(backend)
+        reset_database()
+        seed_posts(POSTS)
+        for i in range(requests):
+            client.post("/login", json={"username": f"reader{i}"})
+
+        with QueryCounter() as counter:
+            started = time.perf_counter()
+            _workload(client, requests, write_ratio)
+            elapsed = time.perf_counter() - started
+        stats = backend.info()
+        print(f"{name:>10} {requests / elapsed:>8.0f} {counter.count / requests:>12.2f} {stats['hit_rate']:>9.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(run(int(args[0]) if args else 2000, float(args[1]) if len(args) > 1 else 0.02))
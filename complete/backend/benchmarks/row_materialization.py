@@ -0,0 +1,158 @@
+"""읽기 전용 목록 조회의 행 구성 비용 벤치마크
+
+피드, 게시물 댓글, 사용자 검색 한 페이지(100개)를 조회해 응답 dict로 바꾸는 과정을
+두 방식으로 비교합니다.
+
+- entity: ORM 엔티티와 작성자 관계(joinedload)를 읽는 이전 방식
+- rows: 응답에 필요한 컬럼만 Row로 읽는 현재 서비스 함수
+  (post_service.post_rows, comment_service.comment_rows)
+
+요청마다 새 세션을 사용하며, 페이지당 처리 시간, 파이썬 메모리 최대 사용량과 응답 dict를
+만든 뒤 남아 있는 메모리(tracemalloc), 생성된 ORM 객체 수(identity map 등록, 변경 추적
+대상)를 보고합니다.
+
+    python -m benchmarks.row_materialization [반복 수]
+"""
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import joinedload
+
+from benchmarks.common import Base, SessionLocal, engine, reset_database
+from app.models import models
+from app.controllers import pagination, search_service, post_service, comment_service, user_service
+
+LIMIT = 100
+USERS = 300
+POSTS = 2000
+COMMENTS = 300  # 1번 게시물의 댓글 수
+
+
+def _seed():
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            {"username": f"user{i}", "profile_image_url": f"https://i.pravatar.cc/150?u=user{i}"} for i in range(USERS)
+        ])
+        conn.execute(insert(models.Post), [
+            {"content": f"post {i} " + "lorem ipsum " * 20, "author_id": i % USERS + 1} for i in range(POSTS)
+        ])
+        conn.execute(insert(models.Comment), [
+            {"content": f"comment {i} " + "dolor sit amet " * 10, "post_id": 1, "author_id": i % USERS + 1}
+            for i in range(COMMENTS)
+        ])
+
+
+def _author(user):
+    return {"id": user.id, "username": user.username, "profile_image_url": user.profile_image_url}
+
+
+def _row_author(row):
+    return {"id": row.author_id, "username": row.author_username, "profile_image_url": row.author_profile_image_url}
+
+
+def feed_entity(db):
+    query = db.query(models.Post).options(joinedload(models.Post.author))
+    posts, _ = pagination.keyset_page(query, models.Post.created_at, models.Post.id, 1, LIMIT)
+    return [
+        {"id": post.id, "content": post.content, "author": _author(post.author), "likes_count": post.likes_count,
+         "comments_count": post.comments_count, "created_at": post.created_at, "updated_at": post.updated_at}
+        for post in posts
+    ]
+
+
+def feed_rows(db):
+    posts = post_service.get_posts_list(db, 1, LIMIT, count="none")[0]
+    return [post_service.post_to_dict(post) for post in posts]
+
+
+def comments_entity(db):
+    query = db.query(models.Comment).options(joinedload(models.Comment.author)).filter(models.Comment.post_id == 1)
+    comments, _ = pagination.keyset_page(query, models.Comment.created_at, models.Comment.id, 1, LIMIT)
+    return [
+        {"id": comment.id, "content": comment.content, "post_id": comment.post_id, "author": _author(comment.author),
+         "created_at": comment.created_at, "updated_at": comment.updated_at}
+        for comment in comments
+    ]
+
+
+def comments_rows(db):
+    comments = comment_service.get_comments_for_post(db, 1, 1, LIMIT, count="none")[0]
+    return [
+        {"id": comment.id, "content": comment.content, "post_id": comment.post_id, "author": _row_author(comment),
+         "created_at": comment.created_at, "updated_at": comment.updated_at}
+        for comment in comments
+    ]
+
+
+def search_entity(db):
+    query = search_service.apply_text_search(db, db.query(models.User), models.User, "users_fts", "user", "relevance")
+    users, _ = pagination.offset_page(query, 1, LIMIT)
+    return [_author(user) for user in users]
+
+
+def search_rows(db):
+    users = user_service.search_users(db, "user", 1, LIMIT, count="none")[0]
+    return [_author(user) for user in users]
+
+
+WORKLOADS = [
+    ("feed", feed_entity, feed_rows),
+    ("post comments", comments_entity, comments_rows),
+    ("user search", search_entity, search_rows),
+]
+
+
+def _request(workload):
+    db = SessionLocal()
+    try:
+        return workload(db)
+    finally:
+        db.close()
+
+
+def _measure(workload, repeat: int):
+    """(페이지당 ms, 최대 KB, 응답 dict를 만든 뒤 남은 KB, 생성된 ORM 객체 수)"""
+    for _ in range(20):
+        _request(workload)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        _request(workload)
+    elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+
+    loaded = []
+    count_load = lambda target, context: loaded.append(1)
+    event.listen(Base, "load", count_load, propagate=True)
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        result = workload(db)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(result) == LIMIT, len(result)
+    finally:
+        db.close()
+        event.remove(Base, "load", count_load)
+    return elapsed_ms, (peak - before) / 1024, (retained - before) / 1024, len(loaded)
+
+
+def run(repeat: int = 200) -> int:
+    reset_database()
+    _seed()
+
+    ok = True
+    print(f"{'query':>14} {'mode':>7} {'ms/page':>8} {'peak KB':>8} {'retained KB':>12} {'ORM objects':>12}")
+    for name, entity, rows in WORKLOADS:
+        if _request(entity) != _request(rows):
+            print(f"FAIL: {name} rows differ from the entity version")
+            ok = False
+        for mode, workload in (("entity", entity), ("rows", rows)):
+            elapsed_ms, peak, retained, objects = _measure(workload, repeat)
+            print(f"{name:>14} {mode:>7} {elapsed_ms:>8.2f} {peak:>8.0f} {retained:>12.0f} {objects:>12}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,72 @@
+"""검색 지연 시간 벤치마크
+
+사용자와 게시물을 대량으로 만든 뒤, 검색 인덱스를 사용하는 검색(관련도 순,
+최신순)과 인덱스 없이 전체 테이블을 훑는 ILIKE 검색의 지연 시간을 비교합니다.
+
+    python -m benchmarks.search_latency [사용자 수] [게시물 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import SessionLocal, engine, reset_database
+from sqlalchemy import insert
+from app.controllers import user_service, post_service
+from app.models import models
+
+WORDS = ["coffee", "river", "planet", "guitar", "window", "sunset", "python", "garden", "rocket", "winter"]
+TERMS = ["user12345", "ser99", "rocket", "sunset gar", "zzzz"]
+REPEAT = 5
+
+
+def _seed(users: int, posts: int, batch: int = 20000):
+    rng = random.Random(7)
+    with engine.begin() as conn:
+        for offset in range(0, users, batch):
+            conn.execute(insert(models.User), [
+                {"username": f"user{i}"} for i in range(offset, min(offset + batch, users))
+            ])
+        for offset in range(0, posts, batch):
+            conn.execute(insert(models.Post), [
+                {"content": " ".join(rng.choices(WORDS, k=8)), "author_id": rng.randint(1, users)}
+                for _ in range(offset, min(offset + batch, posts))
+            ])
+
+
+def _timed(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(users: int = 200000, posts: int = 200000):
+    reset_database()
+    started = time.perf_counter()
+    _seed(users, posts)
+    print(f"seeded {users} users, {posts} posts in {time.perf_counter() - started:.1f}s")
+
+    db = SessionLocal()
+    try:
+        print(f"{'term':>12} {'users rel ms':>13} {'users scan ms':>14} "
+              f"{'posts rel ms':>13} {'posts recent ms':>16} {'posts scan ms':>14}")
+        for term in TERMS:
+            pattern = f"%{term}%"
+            users_index = _timed(lambda: user_service.search_users(db, term, 1, 10, count="none", sort="relevance"))
+            users_scan = _timed(lambda: db.query(models.User).filter(
+                models.User.username.ilike(pattern)).order_by(models.User.id.desc()).limit(10).all())
+            posts_relevance = _timed(lambda: post_service.search_posts(db, term, 1, 10, count="none", sort="relevance"))
+            posts_recent = _timed(lambda: post_service.search_posts(db, term, 1, 10, count="none", sort="recent"))
+            posts_scan = _timed(lambda: db.query(models.Post).filter(
+                models.Post.content.ilike(pattern)).order_by(models.Post.id.desc()).limit(10).all())
+            print(f"{term:>12} {users_index:>13.2f} {users_scan:>14.2f} "
+                  f"{posts_relevance:>13.2f} {posts_recent:>16.2f} {posts_scan:>14.2f}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,172 @@
+"""합성 데이터 생성 도구
+
+users, posts, comments, post_likes 를 지정한 규모로 채웁니다. 실제 서비스처럼
+분포가 치우치도록 만듭니다.
+
+- 작성자: 소수의 인기 작성자가 대부분의 게시물/댓글을 작성 (Zipf 분포)
+- 좋아요/댓글 수: 게시물마다 멱법칙(파레토 분포)을 따라 소수의 게시물에 몰림
+- 작성 시각: 게시물은 --days 기간에 걸쳐 ID 순서대로, 댓글은 게시물 작성 이후
+
+게시물의 likes_count, comments_count 는 생성한 행 수와 일치하게 기록합니다.
+다른 벤치마크와 달리 명령줄에서 실행하면 설정된 데이터베이스(DATABASE_URL, .env)에
+데이터를 추가하므로, 로컬 uvicorn 서버에 대한 부하 테스트(benchmarks.load_test --url)
+준비에 사용할 수 있습니다. 같은 접두사의 사용자가 이미 있으면 실행하지 않습니다.
+
+    python -m benchmarks.seed [--users 1000] [--posts 10000] [--likes-per-post 20]
+                              [--comments-per-post 3] [--days 30] [--prefix seed] [--seed 1]
+"""
+import argparse
+import bisect
+import itertools
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+
+# 한 번에 삽입할 행 수
+BATCH_SIZE = 10000
+
+# 작성자 Zipf 지수 (클수록 소수의 작성자에게 집중)
+AUTHOR_SKEW = 1.1
+
+# 좋아요/댓글 수 파레토 지수 (작을수록 꼬리가 두꺼움)
+POPULARITY_ALPHA = 1.3
+
+
+class Zipf:
+    """1위부터 n위까지의 순위를 Zipf 분포로 뽑는 표본기"""
+
+    def __init__(self, n: int, skew: float, rng: random.Random):
+        self.rng = rng
+        self.cumulative = list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, n + 1)))
+
+    def sample(self) -> int:
+        """0부터 시작하는 순위"""
+        return bisect.bisect_left(self.cumulative, self.rng.random() * self.cumulative[-1])
+
+
+def _popularity(count: int, mean: float, limit: int, rng: random.Random) -> List[int]:
+    """평균이 mean에 가깝고 멱법칙을 따르는 게시물별 개수 (각각 limit 이하)"""
+    if mean <= 0:
+        return [0] * count
+    # 파레토 분포의 평균은 alpha / (alpha - 1) 이므로 그만큼 나누어 평균을 맞춤
+    scale = mean * (POPULARITY_ALPHA - 1) / POPULARITY_ALPHA
+    return [min(limit, int(rng.paretovariate(POPULARITY_ALPHA) * scale)) for _ in range(count)]
+
+
+def _insert(conn, table, rows: List[Dict]) -> int:
+    for offset in range(0, len(rows), BATCH_SIZE):
+        conn.execute(insert(table), rows[offset:offset + BATCH_SIZE])
+    return len(rows)
+
+
+def seed(
+    bind: Engine,
+    users: int = 1000,
+    posts: int = 10000,
+    likes_per_post: float = 20,
+    comments_per_post: float = 3,
+    days: int = 30,
+    prefix: str = "seed",
+    random_seed: int = 1
+) -> Dict[str, int]:
+    """합성 데이터를 생성하고 테이블별 생성한 행 수를 반환
+
+    사용자 이름은 {prefix}{번호}이며, 좋아요를 누른 사용자는 게시물마다 중복 없이 뽑습니다.
+    """
+    from app.models import models
+
+    rng = random.Random(random_seed)
+    authors = Zipf(users, AUTHOR_SKEW, rng)
+    now = datetime.utcnow()
+    start = now - timedelta(days=days)
+    step = timedelta(days=days) / max(posts, 1)
+
+    with bind.begin() as conn:
+        created = {"users": _insert(conn, models.User, [
+            {"username": f"{prefix}{i}", "profile_image_url": f"https://i.pravatar.cc/150?u={prefix}{i}",
+             "created_at": start, "updated_at": start}
+            for i in range(users)
+        ])}
+        user_ids = list(conn.execute(
+            select(models.User.id).where(models.User.username.like(f"{prefix}%")).order_by(models.User.id)
+        ).scalars())[-users:]
+
+        likes = _popularity(posts, likes_per_post, users, rng)
+        comments = _popularity(posts, comments_per_post, 10 * max(comments_per_post, 1), rng)
+        post_rows = []
+        for i in range(posts):
+            created_at = start + step * i
+            post_rows.append({
+                "content": f"post {i} " + "lorem ipsum " * rng.randint(1, 20),
+                "author_id": user_ids[authors.sample()],
+                "likes_count": likes[i],
+                "comments_count": comments[i],
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+        created["posts"] = _insert(conn, models.Post, post_rows)
+        first_post_id = conn.execute(select(func.max(models.Post.id))).scalar() - posts + 1
+
+        like_rows, comment_rows = [], []
+        for i in range(posts):
+            post_id = first_post_id + i
+            for user_index in rng.sample(range(users), likes[i]):
+                like_rows.append({"post_id": post_id, "user_id": user_ids[user_index]})
+            created_at = post_rows[i]["created_at"]
+            for c in range(comments[i]):
+                commented_at = created_at + (now - created_at) * rng.random()
+                comment_rows.append({
+                    "content": f"comment {c} on post {post_id}",
+                    "post_id": post_id,
+                    "author_id": user_ids[authors.sample()],
+                    "created_at": commented_at,
+                    "updated_at": commented_at,
+                })
+            # 메모리 사용량을 제한하기 위해 중간중간 삽입
+            if len(like_rows) >= BATCH_SIZE:
+                created["post_likes"] = created.get("post_likes", 0) + _insert(conn, models.post_likes, like_rows)
+                like_rows = []
+            if len(comment_rows) >= BATCH_SIZE:
+                created["comments"] = created.get("comments", 0) + _insert(conn, models.Comment, comment_rows)
+                comment_rows = []
+        created["post_likes"] = created.get("post_likes", 0) + _insert(conn, models.post_likes, like_rows)
+        created["comments"] = created.get("comments", 0) + _insert(conn, models.Comment, comment_rows)
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 데이터 생성 (설정된 데이터베이스에 추가)")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--likes-per-post", type=float, default=20, help="게시물당 평균 좋아요 수")
+    parser.add_argument("--comments-per-post", type=float, default=3, help="게시물당 평균 댓글 수")
+    parser.add_argument("--days", type=int, default=30, help="게시물 작성 기간 (일)")
+    parser.add_argument("--prefix", default="seed", help="생성할 사용자 이름 접두사")
+    parser.add_argument("--seed", type=int, default=1, help="난수 시드")
+    args = parser.parse_args()
+
+    from app.database import engine, Base
+    from app.models import models
+    from app import migrations
+
+    Base.metadata.create_all(bind=engine)
+    migrations.upgrade(engine)
+    with engine.connect() as conn:
+        if conn.execute(select(models.User.id).where(models.User.username.like(f"{args.prefix}%")).limit(1)).first():
+            print(f"Users with prefix '{args.prefix}' already exist; use another --prefix")
+            return 1
+
+    started = time.perf_counter()
+    created = seed(engine, args.users, args.posts, args.likes_per_post, args.comments_per_post,
+                   args.days, args.prefix, args.seed)
+    print(f"Seeded {created} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
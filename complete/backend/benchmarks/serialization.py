@@ -0,0 +1,184 @@
+"""목록 응답 직렬화 벤치마크
+
+목록 응답을 FastAPI 기본 경로(response_model 검증 후 pydantic dump_json)와 빠른 경로
+(app.responses: 스키마 순서로 정리 후 orjson)로 각각 만들어 봅니다.
+
+1. 출력 비교: 경계값(한글/이모지/제어 문자, null, 마이크로초 유무, UTC/다른 시간대)을
+   담은 데이터와 실제 목록 엔드포인트 응답이 두 경로에서 바이트 단위로 같은지 확인합니다.
+   다르면 실패합니다.
+2. 항목당 비용: 페이지 크기별로 항목 하나를 직렬화하는 데 걸리는 시간을 비교합니다.
+
+    python -m benchmarks.serialization [반복 수]
+"""
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import reset_database, seed_uniform
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.models import schemas
+from app import responses
+from main import app
+
+PAGE_SIZES = [1, 10, 100]
+
+NAIVE = datetime(2026, 1, 2, 3, 4, 5, 123456)
+
+
+def _post(i: int, created_at: datetime, **overrides):
+    data = {
+        "id": i,
+        "content": ["hello", "안녕하세요 👋", 'quote " back \\ slash', "tab\tnew\nline\x01 "][i % 4],
+        "author": {"id": i % 7, "username": f"user{i % 7}", "profile_image_url": None if i % 2 else f"https://i.pravatar.cc/150?u={i}"},
+        "likes_count": i * 3,
+        "comments_count": i % 5,
+        "created_at": created_at,
+        "updated_at": None if i % 3 else created_at,
+        "is_liked": bool(i % 2)
+    }
+    data.update(overrides)
+    return data
+
+
+def _comment(i: int, created_at: datetime):
+    post = _post(i, created_at)
+    return {key: post[key] for key in ("id", "content", "author", "created_at", "updated_at")} | {"post_id": i + 100}
+
+
+def _samples():
+    """(이름, 응답 모델, 빠른 경로 함수, 데이터)"""
+    times = [
+        NAIVE,
+        NAIVE.replace(microsecond=0),
+        NAIVE.replace(tzinfo=timezone.utc),
+        NAIVE.replace(tzinfo=timezone(timedelta(hours=9))),
+    ]
+    posts = [_post(i, times[i % len(times)]) for i in range(12)]
+    # 피드 캐시 데이터처럼 키 순서가 다른 항목, is_liked/updated_at이 없는 항목
+    posts.append({**_post(12, NAIVE), "likes_count": 1, "is_liked": True})
+    posts.append({key: value for key, value in _post(13, NAIVE).items() if key not in ("is_liked", "updated_at")})
+    comments = [_comment(i, times[i % len(times)]) for i in range(8)]
+    page = {"total": 30, "page": 1, "size": 20, "pages": 2, "next_cursor": "eyJpZCI6IDF9"}
+    empty = {"items": [], "total": None, "page": 1, "size": 10, "pages": None, "next_cursor": None}
+    profile = {
+        "id": 1, "username": "사용자", "profile_image_url": None, "posts_count": 2, "comments_count": 3,
+        "posts": posts[:3], "comments": comments[:3], "posts_next_cursor": "abc",
+        "created_at": NAIVE, "updated_at": None,
+    }
+    changes = {
+        "watermark": 42, "has_more": True, "posts": posts[:4],
+        "likes": [{"post_id": 3, "is_liked": True, "likes_count": 7, "comments_count": 0}],
+        "comments": comments[:2], "deleted_posts": [5, 6], "deleted_comments": [{"id": 9, "post_id": 5}],
+    }
+    return [
+        ("PostList", schemas.PostList, responses.post_list, {**page, "items": posts}),
+        ("PostList (empty)", schemas.PostList, responses.post_list, empty),
+        ("CommentList", schemas.CommentList, responses.comment_list, {**page, "items": comments}),
+        ("UserList", schemas.UserList, responses.user_list, {**page, "items": [post["author"] for post in posts]}),
+        ("UserProfile", schemas.UserProfile, responses.user_profile, profile),
+        ("SyncChanges", schemas.SyncChanges, responses.sync_changes, changes),
+    ]
+
+
+def _default_json(model, data) -> bytes:
+    """FastAPI 기본 경로와 같은 출력 (검증 후 dump_json)"""
+    adapter = TypeAdapter(model)
+    return adapter.dump_json(adapter.validate_python(data))
+
+
+def _fast_json(shape, data) -> bytes:
+    return responses.FastJSONResponse(shape(data)).body
+
+
+def check_samples() -> bool:
+    ok = True
+    for name, model, shape, data in _samples():
+        expected, actual = _default_json(model, data), _fast_json(shape, data)
+        same = expected == actual
+        ok &= same
+        print(f"{name:>18}: {'same' if same else 'DIFFERENT'} ({len(actual)} bytes)")
+        if not same:
+            print(f"  expected: {expected[:300]!r}\n  actual:   {actual[:300]!r}")
+    return ok
+
+
+def check_endpoints() -> bool:
+    reset_database()
+    seed_uniform(60, likes_per_post=3, comments_per_post=2)
+    client = TestClient(app)
+    client.post("/login", json={"username": "user0"})
+    client.post("/posts/1/like", params={"username": "user0"})
+    client.post("/posts/2/comments", json={"content": "동기화 💬", "username": "user0"})
+    paths = [
+        "/posts?limit=50",
+        "/posts?limit=5&count=none&username=user0",
+        "/posts?limit=5&cursor=" + client.get("/posts?limit=5").json()["next_cursor"],
+        "/posts/1/comments",
+        "/users/1",
+        "/users/1?posts_limit=0&comments_limit=0",
+        "/users/1/posts?username=user1",
+        "/users/1/comments?count=estimate",
+        "/search?username=user",
+        "/search/posts?q=post&username=user1",
+        "/sync?since=0&username=user0",
+    ]
+    ok = True
+    original = settings.fast_json_responses
+    try:
+        for path in paths:
+            bodies = []
+            for enabled in (False, True):
+                settings.fast_json_responses = enabled
+                response = client.get(path)
+                bodies.append((response.status_code, response.headers["content-type"], response.content))
+            same = bodies[0] == bodies[1]
+            ok &= same
+            print(f"{path:>45}: {'same' if same else 'DIFFERENT'} ({len(bodies[1][2])} bytes)")
+            if not same:
+                print(f"  default: {bodies[0]!r:.300}\n  fast:    {bodies[1]!r:.300}")
+    finally:
+        settings.fast_json_responses = original
+    return ok
+
+
+def _time(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - started
+
+
+def measure(repeat: int):
+    print(f"\n{'items':>6} {'default us/item':>16} {'fast us/item':>13} {'speedup':>8}")
+    adapter = TypeAdapter(schemas.PostList)
+    for size in PAGE_SIZES:
+        data = {
+            "items": [_post(i, NAIVE) for i in range(size)],
+            "total": 1000, "page": 1, "size": size, "pages": 1000 // size, "next_cursor": "eyJpZCI6IDF9",
+        }
+        count = max(repeat // size, 10)
+        default = min(_time(lambda: adapter.dump_json(adapter.validate_python(data)), count) for _ in range(3))
+        fast = min(_time(lambda: responses.FastJSONResponse(responses.post_list(data)).body, count) for _ in range(3))
+        per_item = lambda elapsed: elapsed / count / size * 1e6
+        print(f"{size:>6} {per_item(default):>16.2f} {per_item(fast):>13.2f} {default / fast:>7.1f}x")
+
+
+def run(repeat: int = 20000) -> int:
+    if responses.orjson is None:
+        print("orjson is not installed; fast JSON responses are disabled")
+        return 1
+    ok = check_samples()
+    print()
+    ok &= check_endpoints()
+    measure(repeat)
+    if not ok:
+        print("\nFast JSON output differs from the default response serialization")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,150 @@
+"""SQLite PRAGMA 설정별 읽기/쓰기 혼합 부하 벤치마크
+
+SQLite 기본값(rollback journal, synchronous=FULL, mmap 없음)과 애플리케이션
+기본 설정(WAL, synchronous=NORMAL, mmap, busy_timeout)을 각각 별도 프로세스에서
+같은 데이터와 같은 부하로 측정합니다. 읽기 스레드는 피드와 게시물 상세를,
+쓰기 스레드는 댓글 작성과 좋아요/좋아요 취소를 반복합니다.
+
+    python -m benchmarks.sqlite_tuning [--seconds 5] [--readers 8] [--writers 2]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PROFILES = {
+    "sqlite-default": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": "0",
+    },
+    "tuned": {},
+}
+
+
+def _percentile(values, ratio):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * ratio), len(values) - 1)] * 1000
+
+
+def _worker(args):
+    """환경 변수로 PRAGMA가 설정된 하위 프로세스에서 측정"""
+    from benchmarks.common import SessionLocal, reset_database, seed_uniform
+    from app.controllers import post_service, comment_service, user_service
+    from app.models import schemas
+    from fastapi import HTTPException
+    from sqlalchemy.exc import OperationalError
+
+    reset_database()
+    seed_uniform(args.posts, likes_per_post=0, comments_per_post=2)
+
+    stop = time.perf_counter() + args.seconds
+    stats = {"reads": [], "writes": [], "errors": 0}
+    lock = threading.Lock()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        db = SessionLocal()
+        try:
+            while time.perf_counter() < stop:
+                started = time.perf_counter()
+                try:
+                    if rng.random() < 0.5:
+                        post_service.get_posts_list(db, rng.randint(1, 10), 20)
+                    else:
+                        post_service.get_post_detail(db, rng.randint(1, args.posts))
+                    db.rollback()
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        stats["errors"] += 1
+                    continue
+                with lock:
+                    stats["reads"].append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+    def writer(seed):
+        rng = random.Random(seed)
+        db = SessionLocal()
+        username = f"writer{seed}"
+        try:
+            user_service.login_user(db, username)
+            while time.perf_counter() < stop:
+                post_id = rng.randint(1, args.posts)
+                started = time.perf_counter()
+                try:
+                    if rng.random() < 0.5:
+                        comment_service.create_comment(
+                            db, post_id, schemas.CommentCreate(content="bench", username=username)
+                        )
+                    else:
+                        try:
+                            post_service.like_post(db, post_id, username)
+                        except HTTPException:
+                            post_service.unlike_post(db, post_id, username)
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        stats["errors"] += 1
+                    continue
+                with lock:
+                    stats["writes"].append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(json.dumps({
+        "reads_per_s": len(stats["reads"]) / args.seconds,
+        "writes_per_s": len(stats["writes"]) / args.seconds,
+        "read_p95": _percentile(stats["reads"], 0.95),
+        "write_p95": _percentile(stats["writes"], 0.95),
+        "errors": stats["errors"],
+    }))
+
+
+def run(args):
+    results = {}
+    for name, pragmas in PROFILES.items():
+        directory = tempfile.mkdtemp(prefix="threads-bench-")
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{directory}/bench.db", **pragmas)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.sqlite_tuning", "--worker",
+             "--seconds", str(args.seconds), "--readers", str(args.readers),
+             "--writers", str(args.writers), "--posts", str(args.posts)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        results[name] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'profile':>15} {'reads/s':>8} {'writes/s':>9} {'read p95 ms':>12} {'write p95 ms':>13} {'errors':>7}")
+    for name, row in results.items():
+        print(f"{name:>15} {row['reads_per_s']:>8.0f} {row['writes_per_s']:>9.0f} "
+              f"{row['read_p95']:>12.1f} {row['write_p95']:>13.1f} {row['errors']:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+    if args.worker:
+        _worker(args)
+    else:
+        sys.exit(run(args))
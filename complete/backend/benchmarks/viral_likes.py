@@ -0,0 +1,149 @@
+"""인기 게시물 좋아요 집중 벤치마크
+
+한 게시물에 좋아요/취소가 몰리는 상황을 즉시 반영(direct)과 쓰기 지연 버퍼(buffered)
+모드로 각각 별도 프로세스에서 측정합니다. 쓰기 스레드는 같은 게시물에 서로 다른 사용자로
+좋아요/취소를 반복하고, 읽기 스레드는 같은 게시물의 상세 정보를 조회합니다.
+측정이 끝나면 버퍼를 비운 뒤 likes_count가 실제 좋아요 행 수와 같은지 확인합니다.
+
+    python -m benchmarks.viral_likes [--seconds 5] [--writers 8] [--readers 4]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+MODES = {
+    "direct": {"LIKE_BUFFER_ENABLED": "false"},
+    "buffered": {"LIKE_BUFFER_ENABLED": "true"},
+}
+USERS_PER_WRITER = 50
+
+
+def _percentile(values, ratio):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * ratio), len(values) - 1)] * 1000
+
+
+def _worker(args):
+    """환경 변수로 버퍼 사용 여부가 설정된 하위 프로세스에서 측정"""
+    from benchmarks.common import SessionLocal, reset_database, seed_uniform
+    from app.controllers import post_service, user_service
+    from app.like_buffer import like_buffer
+    from app.models import models
+    from fastapi import HTTPException
+    from sqlalchemy import func
+    from sqlalchemy.exc import OperationalError
+
+    reset_database()
+    seed_uniform(100, likes_per_post=0, comments_per_post=0)
+    db = SessionLocal()
+    for writer in range(args.writers):
+        for user in range(USERS_PER_WRITER):
+            user_service.get_or_create_user_id(db, f"fan{writer}-{user}")
+    db.close()
+
+    stop = time.perf_counter() + args.seconds
+    stats = {"likes": [], "reads": [], "errors": 0}
+    lock = threading.Lock()
+
+    def writer(seed):
+        rng = random.Random(seed)
+        db = SessionLocal()
+        try:
+            while time.perf_counter() < stop:
+                username = f"fan{seed}-{rng.randrange(USERS_PER_WRITER)}"
+                started = time.perf_counter()
+                try:
+                    try:
+                        post_service.like_post(db, 1, username)
+                    except HTTPException:
+                        post_service.unlike_post(db, 1, username)
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        stats["errors"] += 1
+                    continue
+                with lock:
+                    stats["likes"].append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+    def reader(seed):
+        db = SessionLocal()
+        try:
+            while time.perf_counter() < stop:
+                started = time.perf_counter()
+                try:
+                    post_service.get_post_detail(db, 1, f"fan0-{seed}")
+                    db.rollback()
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        stats["errors"] += 1
+                    continue
+                with lock:
+                    stats["reads"].append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    like_buffer.stop()
+
+    db = SessionLocal()
+    stored = db.get(models.Post, 1).likes_count
+    actual = db.query(func.count()).select_from(models.post_likes).filter(models.post_likes.c.post_id == 1).scalar()
+    db.close()
+
+    print(json.dumps({
+        "likes_per_s": len(stats["likes"]) / args.seconds,
+        "reads_per_s": len(stats["reads"]) / args.seconds,
+        "like_p95": _percentile(stats["likes"], 0.95),
+        "read_p95": _percentile(stats["reads"], 0.95),
+        "errors": stats["errors"],
+        "consistent": stored == actual,
+    }))
+
+
+def run(args):
+    results = {}
+    for name, env_vars in MODES.items():
+        directory = tempfile.mkdtemp(prefix="threads-bench-")
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{directory}/bench.db", **env_vars)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.viral_likes", "--worker",
+             "--seconds", str(args.seconds), "--writers", str(args.writers),
+             "--readers", str(args.readers)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        results[name] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'mode':>9} {'likes/s':>8} {'reads/s':>8} {'like p95 ms':>12} {'read p95 ms':>12} {'errors':>7} {'consistent':>11}")
+    for name, row in results.items():
+        print(f"{name:>9} {row['likes_per_s']:>8.0f} {row['reads_per_s']:>8.0f} {row['like_p95']:>12.1f} "
+              f"{row['read_p95']:>12.1f} {row['errors']:>7} {str(row['consistent']):>11}")
+    return 0 if all(row["consistent"] for row in results.values()) else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--worker", action="store_true")
+    args = parser.parse_args()
+    if args.worker:
+        _worker(args)
+    else:
+        sys.exit(run(args))
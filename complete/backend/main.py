@@ -1,7 +1,16 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import auth, system, users, posts, search, comments
-from app.database import engine, Base
+from app.routes import auth, system, users, posts, search, comments, export, admin, sync, events
+from app.database import engine, async_engine
+from app.config import settings
+from app import migrations, metrics
+from app.events import get_broker as get_event_broker
+from app.profiling import ProfilingMiddleware
+from app.slow_query_log import slow_query_log
+from app.like_buffer import like_buffer
+from app.routes.router_factory import build_router
+from contextlib import asynccontextmanager
+import logging
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -9,14 +18,35 @@ from dotenv import load_dotenv
 # 환경 변수 로드
 load_dotenv()
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+# 데이터베이스 테이블 생성 및 스키마 마이그레이션 적용 (여러 워커가 동시에 시작해도 한 번만 적용)
+migrations.upgrade(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 처리"""
+    # 비동기 모드의 핸들러는 이벤트 루프에서 실행되므로 redis 캐시/브로커의 동기 호출이
+    # 응답을 기다리는 동안 모든 연결(SSE 포함)이 멈춤
+    if settings.database_async and "redis" in (settings.cache_backend, settings.event_broker):
+        logger.warning(
+            "DATABASE_ASYNC=true with CACHE_BACKEND=%s, EVENT_BROKER=%s: redis calls block the event loop, "
+            "use the memory backends in async mode", settings.cache_backend, settings.event_broker
+        )
+    # 좋아요 쓰기 지연 버퍼 시작 (사용 설정 시), 종료 시 남은 좋아요를 모두 반영
+    like_buffer.start()
+    # 이벤트 브로커 시작 (redis 브로커는 다른 워커의 이벤트 수신 시작)
+    get_event_broker().start()
+    yield
+    get_event_broker().stop()
+    like_buffer.stop()
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
     title="Threads-like Application API",
     description="This is a Threads-like application backend API that allows users to set a username, post content, follow other users, and interact via comments and likes.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -41,13 +71,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 라우트 등록
-app.include_router(system.router)
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(search.router)
-app.include_router(posts.router)
-app.include_router(comments.router)
+# 요청/DB 메트릭 수집 (GET /metrics)
+if settings.metrics_enabled:
+    metrics.instrument_engine(engine)
+    if async_engine is not None:
+        metrics.instrument_engine(async_engine.sync_engine, "async")
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# 요청 단위 프로파일링 (PROFILING_ENABLED=true 일 때만 등록, 끄면 비용 없음)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+
+# 느린 쿼리 기록 (SLOW_QUERY_THRESHOLD_MS 지정 시)
+slow_query_log.install(engine)
+if async_engine is not None:
+    slow_query_log.install(async_engine.sync_engine)
+
+# 라우트 등록 (데이터베이스 모드에 맞게 핸들러를 감싸서 등록)
+for module in (system, auth, users, search, posts, comments, sync, events, export, admin):
+    app.include_router(build_router(module.router))
 
 # 애플리케이션 실행
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+import argparse
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from app.database import engine, SessionLocal
+from app import migrations
+from app.controllers import post_service, change_log
+from datetime import datetime, timedelta
+
+def migrate(args):
+    """테이블 생성 및 스키마 마이그레이션 적용"""
+    applied = migrations.upgrade(engine)
+    print(f"Applied migrations: {applied or 'none'}")
+
+def recount_counters(args):
+    """게시물 좋아요/댓글 카운터 재계산"""
+    db = SessionLocal()
+    try:
+        updated = post_service.recount_post_counters(db, args.post_ids or None)
+    finally:
+        db.close()
+    print(f"Recounted {updated} posts")
+
+def prune_changes(args):
+    """오래된 변경 기록(GET /sync) 삭제"""
+    db = SessionLocal()
+    try:
+        deleted = change_log.prune(db, datetime.utcnow() - timedelta(days=args.days))
+    finally:
+        db.close()
+    print(f"Pruned {deleted} changes")
+
+def main():
+    parser = argparse.ArgumentParser(description="Threads-like 애플리케이션 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("migrate", help="스키마 마이그레이션 적용").set_defaults(func=migrate)
+
+    recount = subparsers.add_parser("recount-counters", help="게시물 좋아요/댓글 카운터 재계산")
+    recount.add_argument("post_ids", nargs="*", type=int, help="재계산할 게시물 ID (생략하면 전체)")
+    recount.set_defaults(func=recount_counters)
+
+    prune = subparsers.add_parser("prune-changes", help="오래된 변경 기록 삭제 (이보다 오래된 워터마크는 다시 불러와야 함)")
+    prune.add_argument("--days", type=int, default=30, help="보관 기간 (일, 기본 30)")
+    prune.set_defaults(func=prune_changes)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# 벤치마크 공용 모듈을 app 보다 먼저 import 해서 임시 SQLite 데이터베이스를 사용
+import benchmarks.common  # noqa: F401
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client():
+    """빈 데이터베이스로 시작하는 TestClient"""
+    from main import app
+
+    benchmarks.common.reset_database()
+    return TestClient(app)
@@ -0,0 +1,91 @@
+"""일괄 작성 테스트 (POST /posts/batch, POST /comments/batch)"""
+import pytest
+from sqlalchemy import func, select
+
+from benchmarks.common import SessionLocal
+from app.models import models
+from app.controllers import batch_service, user_service
+
+
+def _count(model) -> int:
+    db = SessionLocal()
+    try:
+        return db.execute(select(func.count()).select_from(model)).scalar()
+    finally:
+        db.close()
+
+
+def _usernames():
+    db = SessionLocal()
+    try:
+        return set(db.execute(select(models.User.username)).scalars())
+    finally:
+        db.close()
+
+
+def test_post_batch_reports_invalid_items_and_inserts_the_rest(client):
+    response = client.post("/posts/batch", json={"items": [
+        {"content": "first", "username": "alice"},
+        {"content": "", "username": "mallory"},
+        {"content": "no author"},
+        {"content": "second", "username": "bob"},
+        {"content": "x" * 501, "username": "trudy"},
+    ]})
+    assert response.status_code == 200, response.text
+    result = response.json()
+
+    assert (result["created"], result["failed"]) == (2, 3)
+    assert [item["index"] for item in result["items"]] == [0, 1, 2, 3, 4]
+    created = [item for item in result["items"] if item["id"] is not None]
+    assert [item["index"] for item in created] == [0, 3]
+    assert all(item["error"] is None for item in created)
+    assert all(item["id"] is None and item["error"] for item in result["items"] if item["index"] in (1, 2, 4))
+    assert "username" in result["items"][2]["error"]
+
+    # 실패한 항목의 작성자는 생성되지 않음
+    assert _count(models.Post) == 2
+    assert _usernames() == {"alice", "bob"}
+    post = client.get(f"/posts/{created[1]['id']}").json()
+    assert (post["content"], post["author"]["username"]) == ("second", "bob")
+
+
+def test_comment_batch_reports_missing_posts(client):
+    post_id = client.post("/posts", json={"content": "target", "username": "alice"}).json()["id"]
+
+    result = client.post("/comments/batch", json={"items": [
+        {"post_id": post_id, "content": "one", "username": "carol"},
+        {"post_id": 10 ** 9, "content": "nowhere", "username": "dave"},
+        {"post_id": post_id, "content": "", "username": "erin"},
+        {"post_id": post_id, "content": "two", "username": "alice"},
+    ]}).json()
+
+    assert (result["created"], result["failed"]) == (2, 2)
+    assert result["items"][1]["error"] == "Post not found"
+    assert result["items"][2]["error"] and result["items"][2]["id"] is None
+    assert _count(models.Comment) == 2
+    assert _usernames() == {"alice", "carol"}
+    assert client.get(f"/posts/{post_id}").json()["comments_count"] == 2
+    comments = client.get(f"/posts/{post_id}/comments").json()["items"]
+    assert sorted(comment["content"] for comment in comments) == ["one", "two"]
+
+
+def test_batch_with_no_valid_items_creates_nothing(client):
+    result = client.post("/posts/batch", json={"items": [{"content": "", "username": "ghost"}]}).json()
+    assert (result["created"], result["failed"]) == (0, 1)
+    assert _count(models.Post) == 0 and _usernames() == set()
+
+
+def test_failed_insert_rolls_back_new_authors(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(batch_service, "_insert_many", fail)
+    with pytest.raises(RuntimeError):
+        client.post("/posts/batch", json={"items": [{"content": "lost", "username": "ghost"}]})
+
+    # 새 작성자는 삽입과 같은 트랜잭션이므로 함께 롤백되고 캐시에도 남지 않음
+    assert _usernames() == set()
+    assert user_service.user_id_cache.get("ghost") is None
+    monkeypatch.undo()
+    result = client.post("/posts/batch", json={"items": [{"content": "kept", "username": "ghost"}]}).json()
+    assert result["created"] == 1 and _usernames() == {"ghost"}
@@ -0,0 +1,73 @@
+"""조건부 GET 테스트 (ETag, 304, Cache-Control)"""
+import pytest
+
+
+@pytest.fixture
+def post_id(client):
+    post_id = client.post("/posts", json={"content": "hello", "username": "alice"}).json()["id"]
+    client.post(f"/posts/{post_id}/comments", json={"content": "first", "username": "bob"})
+    return post_id
+
+
+def _urls(client, post_id):
+    user_id = client.get(f"/posts/{post_id}").json()["author"]["id"]
+    return [f"/posts/{post_id}", f"/posts/{post_id}/comments", f"/users/{user_id}"]
+
+
+def test_matching_etag_returns_empty_304(client, post_id):
+    for url in _urls(client, post_id):
+        response = client.get(url)
+        tag = response.headers["etag"]
+        assert response.status_code == 200 and tag
+
+        for header in (tag, f"W/{tag}", f'"other", {tag}', "*"):
+            cached = client.get(url, headers={"If-None-Match": header})
+            assert cached.status_code == 304, (url, header)
+            assert cached.content == b""
+            assert cached.headers["etag"] == tag
+
+        assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.parametrize("change", ["like", "comment", "edit"])
+def test_changed_resource_returns_new_etag(client, post_id, change):
+    urls = _urls(client, post_id)
+    before = {url: client.get(url).headers["etag"] for url in urls}
+
+    if change == "like":
+        client.post(f"/posts/{post_id}/like", params={"username": "bob"})
+        changed = [urls[0], urls[2]]
+    elif change == "comment":
+        client.post(f"/posts/{post_id}/comments", json={"content": "second", "username": "bob"})
+        changed = urls
+    else:
+        client.put(f"/posts/{post_id}", params={"username": "alice"}, json={"content": "edited"})
+        changed = [urls[0], urls[2]]
+
+    for url in urls:
+        response = client.get(url, headers={"If-None-Match": before[url]})
+        if url in changed:
+            assert response.status_code == 200, (change, url)
+            assert response.headers["etag"] != before[url]
+            assert client.get(url, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+        else:
+            assert response.status_code == 304, (change, url)
+
+
+def test_per_user_responses_are_not_publicly_cacheable(client, post_id):
+    client.post(f"/posts/{post_id}/like", params={"username": "bob"})
+    for url in _urls(client, post_id):
+        shared = client.get(url)
+        assert shared.headers["cache-control"].startswith("public")
+        if url.endswith("/comments"):
+            continue
+
+        personal = client.get(url, params={"username": "bob"})
+        assert "public" not in personal.headers["cache-control"]
+        assert personal.headers["cache-control"].startswith("private")
+        # 같은 게시물이라도 사용자마다 is_liked가 달라 ETag도 다름
+        assert personal.headers["etag"] != client.get(url, params={"username": "alice"}).headers["etag"]
+
+        cached = client.get(url, params={"username": "bob"}, headers={"If-None-Match": personal.headers["etag"]})
+        assert cached.status_code == 304
+        assert "public" not in cached.headers["cache-control"]
@@ -0,0 +1,33 @@
+"""실시간 이벤트 브로커 테스트"""
+import asyncio
+
+import pytest
+
+from app import events
+
+
+def test_redis_broker_survives_malformed_messages():
+    fakeredis = pytest.importorskip("fakeredis")  # 선택 의존성
+    client = fakeredis.FakeRedis()
+    broker = events.RedisBroker(client, queue_size=10, max_subscribers=10)
+
+    async def scenario():
+        subscription = broker.subscribe([events.FEED])
+        broker.start()
+        try:
+            await asyncio.sleep(0.1)
+            client.publish(events.REDIS_CHANNEL, "not json")
+            client.publish(events.REDIS_CHANNEL, '{"type": "post_created"}')
+            broker.publish("post_created", {"post_id": 1, "author_id": 2}, [events.FEED])
+            return await asyncio.wait_for(subscription.next(5.0), 5.0)
+        finally:
+            broker.stop()
+            broker.unsubscribe(subscription)
+
+    frame = asyncio.run(scenario())
+    assert frame == events.encode("post_created", {"post_id": 1, "author_id": 2})
+
+
+def test_event_broker_is_abstract():
+    with pytest.raises(TypeError):
+        events.EventBroker(10, 10)
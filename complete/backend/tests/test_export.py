@@ -0,0 +1,53 @@
+"""내보내기 테스트 (GET /export/posts, GET /export/comments의 since)"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from benchmarks.common import SessionLocal
+from app.models import models
+
+BASE = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def dated(client):
+    """한 시간 간격으로 작성된 게시물 3개와 각 게시물의 댓글 (created_at은 UTC)"""
+    post_ids = []
+    for i in range(3):
+        post_id = client.post("/posts", json={"content": f"post {i}", "username": "alice"}).json()["id"]
+        client.post(f"/posts/{post_id}/comments", json={"content": f"comment {i}", "username": "bob"})
+        post_ids.append(post_id)
+
+    db = SessionLocal()
+    try:
+        for i, post_id in enumerate(post_ids):
+            created_at = BASE + timedelta(hours=i)
+            db.execute(update(models.Post).where(models.Post.id == post_id).values(created_at=created_at))
+            db.execute(update(models.Comment).where(models.Comment.post_id == post_id).values(created_at=created_at))
+        db.commit()
+    finally:
+        db.close()
+    return post_ids
+
+
+def _export(client, kind, since=None):
+    params = {"since": since} if since else {}
+    response = client.get(f"/export/{kind}", params=params)
+    assert response.status_code == 200, response.text
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("kind", ["posts", "comments"])
+def test_since_with_timezone_matches_utc(client, dated, kind):
+    assert len(_export(client, kind)) == 3
+
+    # 13:00 UTC 이후 = 22:00 +09:00 이후 = 08:00 -05:00 이후
+    utc = _export(client, kind, "2024-01-01T13:00:00")
+    assert [item["created_at"] for item in utc] == ["2024-01-01T13:00:00", "2024-01-01T14:00:00"]
+    for since in ("2024-01-01T13:00:00Z", "2024-01-01T22:00:00+09:00", "2024-01-01T08:00:00-05:00"):
+        assert _export(client, kind, since) == utc, since
+
+    # 같은 벽시계 시각이라도 시간대가 다르면 다른 구간
+    assert len(_export(client, kind, "2024-01-01T13:00:00+09:00")) == 3
@@ -0,0 +1,75 @@
+"""피드 읽기 캐시 테스트 (쓰기 직후 피드가 새 게시물과 좋아요를 반영하는지)"""
+from benchmarks.common import SessionLocal
+from app import cache
+from app.cache import MemoryCache
+from app.controllers import post_service, user_service
+from app.models import schemas
+
+
+def _feed(client, username=None):
+    params = {"username": username} if username else {}
+    return {post["id"]: post for post in client.get("/posts", params=params).json()["items"]}
+
+
+def _use_memory_cache(monkeypatch):
+    monkeypatch.setattr(cache, "cache", MemoryCache(60.0, 1000))
+
+
+def test_feed_reflects_writes_immediately(client, monkeypatch):
+    _use_memory_cache(monkeypatch)
+    first = client.post("/posts", json={"content": "first", "username": "alice"}).json()["id"]
+    assert list(_feed(client)) == [first]
+
+    second = client.post("/posts", json={"content": "second", "username": "bob"}).json()["id"]
+    assert list(_feed(client)) == [second, first]
+
+    assert client.post(f"/posts/{first}/like", params={"username": "bob"}).status_code == 200
+    feed = _feed(client, "bob")
+    assert feed[first]["likes_count"] == 1 and feed[first]["is_liked"]
+    assert _feed(client)[first]["likes_count"] == 1
+
+
+def _write_during_query(monkeypatch, write):
+    """피드 조회가 DB를 읽은 직후, 캐시에 저장하기 전에 다른 요청의 쓰기를 끼워 넣음"""
+    get_posts_list = post_service.get_posts_list
+    pending = [write]
+
+    def interleaved(*args, **kwargs):
+        result = get_posts_list(*args, **kwargs)
+        while pending:
+            db = SessionLocal()
+            try:
+                pending.pop()(db)
+            finally:
+                db.close()
+        return result
+
+    monkeypatch.setattr(post_service, "get_posts_list", interleaved)
+
+
+def test_like_committed_during_feed_query_is_not_cached_stale(client, monkeypatch):
+    _use_memory_cache(monkeypatch)
+    post_id = client.post("/posts", json={"content": "hello", "username": "alice"}).json()["id"]
+    db = SessionLocal()
+    try:
+        user_service.get_or_create_user_ids(db, ["bob"])
+    finally:
+        db.close()
+    _write_during_query(monkeypatch, lambda db: post_service.like_post(db, post_id, "bob"))
+
+    # 끼워 넣은 좋아요 이전의 값을 읽은 응답
+    assert _feed(client)[post_id]["likes_count"] == 0
+    assert _feed(client)[post_id]["likes_count"] == 1
+    assert client.get(f"/posts/{post_id}").json()["likes_count"] == 1
+
+
+def test_post_created_during_feed_query_is_not_cached_stale(client, monkeypatch):
+    _use_memory_cache(monkeypatch)
+    first = client.post("/posts", json={"content": "first", "username": "alice"}).json()["id"]
+    created = []
+    _write_during_query(monkeypatch, lambda db: created.append(
+        post_service.create_post(db, schemas.PostCreate(content="late", username="bob")).id
+    ))
+
+    assert list(_feed(client)) == [first]
+    assert list(_feed(client)) == [created[0], first]
@@ -0,0 +1,45 @@
+"""좋아요 쓰기 지연 버퍼 테스트"""
+import threading
+
+from app import like_buffer as like_buffer_module
+from app.like_buffer import LikeBuffer
+
+
+def test_concurrent_first_likes_start_one_flush_thread(client, monkeypatch):
+    registered = []
+    monkeypatch.setattr(like_buffer_module.atexit, "register", registered.append)
+    started = []
+    original_start = threading.Thread.start
+
+    def counting_start(thread):
+        if thread.name == "like-buffer":
+            started.append(thread)
+        original_start(thread)
+
+    monkeypatch.setattr(threading.Thread, "start", counting_start)
+
+    buffer = LikeBuffer(enabled=True, interval=60, max_events=1000)
+    barrier = threading.Barrier(16)
+
+    def like(user_id):
+        barrier.wait()
+        buffer.record(1, user_id, True, stored=False)
+
+    workers = [threading.Thread(target=like, args=(user_id,)) for user_id in range(16)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    try:
+        assert len(started) == 1
+        assert registered == [buffer.stop]
+        assert buffer.delta(1) == 16
+    finally:
+        buffer._pending.clear()
+        buffer._pending_deltas.clear()
+        buffer.stop()
+
+    # 멈춘 뒤 다시 시작해도 atexit에는 한 번만 등록
+    buffer.start()
+    buffer.stop()
+    assert len(started) == 2 and registered == [buffer.stop]
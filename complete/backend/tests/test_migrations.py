@@ -0,0 +1,54 @@
+"""스키마 마이그레이션 테스트"""
+import json
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, inspect, text
+
+from app import migrations
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UPGRADE = "import json; from app import migrations; print(json.dumps(migrations.upgrade()))"
+
+
+def test_concurrent_workers_apply_each_migration_once(tmp_path):
+    url = f"sqlite:///{tmp_path}/race.db"
+    env = dict(os.environ, DATABASE_URL=url, PYTHONPATH=BACKEND_DIR)
+    workers = [
+        subprocess.Popen([sys.executable, "-c", UPGRADE], cwd=BACKEND_DIR, env=env,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for _ in range(6)
+    ]
+    results = []
+    for worker in workers:
+        stdout, stderr = worker.communicate(timeout=120)
+        assert worker.returncode == 0, stderr
+        results.append(json.loads(stdout.strip().splitlines()[-1]))
+
+    versions = [version for version, _, _ in migrations.MIGRATIONS]
+    assert sorted(v for applied in results for v in applied) == versions
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        recorded = conn.execute(text("SELECT version FROM schema_migrations ORDER BY version")).scalars().all()
+    engine.dispose()
+    assert recorded == versions
+
+
+def test_upgrade_adds_counters_to_existing_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(50) UNIQUE, profile_image_url VARCHAR(255), created_at DATETIME, updated_at DATETIME)"))
+        conn.execute(text("CREATE TABLE posts (id INTEGER PRIMARY KEY, content TEXT, author_id INTEGER, created_at DATETIME, updated_at DATETIME)"))
+        conn.execute(text("CREATE TABLE post_likes (post_id INTEGER, user_id INTEGER, created_at DATETIME, PRIMARY KEY (post_id, user_id))"))
+        conn.execute(text("INSERT INTO users (id, username) VALUES (1, 'a'), (2, 'b')"))
+        conn.execute(text("INSERT INTO posts (id, content, author_id) VALUES (1, 'hello', 1)"))
+        conn.execute(text("INSERT INTO post_likes (post_id, user_id) VALUES (1, 1), (1, 2)"))
+
+    assert migrations.upgrade(engine) == [version for version, _, _ in migrations.MIGRATIONS]
+    assert migrations.upgrade(engine) == []
+    assert "likes_count" in {column["name"] for column in inspect(engine).get_columns("posts")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT likes_count FROM posts WHERE id = 1")).scalar() == 2
+    engine.dispose()
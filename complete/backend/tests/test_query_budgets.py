@@ -0,0 +1,20 @@
+"""엔드포인트별 쿼리 수 예산 테스트 (benchmarks/query_budgets.py의 BUDGETS)"""
+import pytest
+
+from benchmarks import query_budgets
+
+
+@pytest.fixture(scope="module")
+def results():
+    return query_budgets.measure_scales()
+
+
+def test_every_route_has_budget():
+    assert query_budgets.missing_budgets() == []
+
+
+@pytest.mark.parametrize("key", list(query_budgets.BUDGETS), ids=lambda key: f"{key[0]} {key[1]}")
+def test_route_within_budget(results, key):
+    budget, _ = query_budgets.BUDGETS[key]
+    counts = [result[key] for result in results]
+    assert query_budgets.problems(budget, counts) == [], f"budget {budget}, counts per scale {counts}"
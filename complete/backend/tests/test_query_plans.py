@@ -0,0 +1,20 @@
+"""서비스 쿼리 실행 계획 테스트 (benchmarks/query_plans.py의 경우들이 인덱스를 사용하는지)"""
+import pytest
+
+from benchmarks import query_plans
+
+
+@pytest.fixture(scope="module")
+def plans():
+    if query_plans.engine.dialect.name != "sqlite":
+        pytest.skip("EXPLAIN QUERY PLAN 점검은 SQLite에서만 실행합니다")
+    return query_plans.check_plans()
+
+
+def test_cases_run_queries(plans):
+    assert plans
+
+
+def test_queries_use_an_index(plans):
+    failures = [f"{name}: {' / '.join(details)}" for name, problems, details in plans if problems]
+    assert failures == []
@@ -0,0 +1,54 @@
+"""검색 페이지네이션 테스트 (GET /search, GET /search/posts)"""
+import pytest
+
+from benchmarks.common import QueryCounter, seed_uniform
+
+
+def _walk(client, path, params):
+    """next_cursor를 따라 모든 페이지를 읽고 (항목 ID 목록, 마지막 응답, 커서 요청의 (SQL 문, 파라미터)) 반환"""
+    response = client.get(path, params=params).json()
+    ids = [item["id"] for item in response["items"]]
+    statements = []
+    while response["next_cursor"]:
+        with QueryCounter() as counter:
+            response = client.get(path, params={**params, "cursor": response["next_cursor"]}).json()
+        statements += zip(counter.statements, counter.parameters)
+        ids += [item["id"] for item in response["items"]]
+    return ids, response, statements
+
+
+@pytest.mark.parametrize("term", ["user", "us"], ids=["fts", "ilike"])
+def test_recent_cursor_walks_all_matches_without_offset(client, term):
+    seed_uniform(posts=1, likes_per_post=250, comments_per_post=0)
+
+    first = client.get("/search", params={"username": term, "limit": 40}).json()
+    assert first["total"] == 250 and first["pages"] == 7
+
+    ids, _, statements = _walk(client, "/search", {"username": term, "limit": 40})
+    assert ids == list(range(250, 0, -1))
+    # 커서 페이지는 마지막 ID 조건으로 읽고 행을 건너뛰지 않음 (SQLite는 OFFSET 0을 붙여 렌더링)
+    pages = [(statement, parameters) for statement, parameters in statements if "LIMIT" in statement]
+    assert pages and all("id < ?" in statement and parameters[-1] == 0 for statement, parameters in pages)
+
+
+def test_recent_post_search_cursor(client):
+    seed_uniform(posts=55, likes_per_post=1, comments_per_post=0)
+
+    ids, _, _ = _walk(client, "/search/posts", {"q": "post", "limit": 10})
+    assert ids == list(range(55, 0, -1))
+
+
+def test_relevance_is_top_n_view(client):
+    seed_uniform(posts=1, likes_per_post=250, comments_per_post=0)
+
+    ids, last, _ = _walk(client, "/search", {"username": "user", "limit": 50, "sort": "relevance"})
+    assert len(ids) == len(set(ids)) == 200
+    assert last["total"] is None and last["pages"] is None
+
+
+def test_cursor_kind_must_match_sort(client):
+    seed_uniform(posts=1, likes_per_post=30, comments_per_post=0)
+
+    relevance = client.get("/search", params={"username": "user", "limit": 10, "sort": "relevance"}).json()
+    response = client.get("/search", params={"username": "user", "cursor": relevance["next_cursor"]})
+    assert response.status_code == 400
@@ -0,0 +1,54 @@
+"""증분 동기화 테스트 (GET /sync 워터마크와 동시 쓰기)"""
+import threading
+
+from sqlalchemy.dialects import postgresql
+
+from benchmarks.common import SessionLocal, seed_uniform
+from app.controllers import change_log
+
+
+def _sync(client, since):
+    response = client.get("/sync", params={"since": since})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_interleaved_commit_is_not_skipped(client):
+    seed_uniform(posts=3, likes_per_post=1, comments_per_post=0)
+    watermark = client.get("/sync").json()["watermark"]
+
+    # A가 먼저 변경을 기록하고 아직 커밋하지 않은 동안 B가 다음 변경을 기록/커밋하려 함
+    first, second = SessionLocal(), SessionLocal()
+    change_log.record(first, [change_log.post_change(1, change_log.UPSERT)])
+    committed = threading.Event()
+
+    def write_second():
+        change_log.record(second, [change_log.post_change(2, change_log.UPSERT)])
+        second.commit()
+        committed.set()
+
+    writer = threading.Thread(target=write_second)
+    writer.start()
+    try:
+        # B는 A가 커밋할 때까지 기록/커밋하지 못하므로 A보다 높은 seq가 먼저 보이지 않음
+        assert not committed.wait(0.3)
+        pending = _sync(client, watermark)
+        assert pending["watermark"] == watermark and pending["posts"] == []
+
+        first.commit()
+        writer.join(10)
+        assert committed.is_set()
+    finally:
+        first.close()
+        second.close()
+
+    synced = _sync(client, watermark)
+    assert [post["id"] for post in synced["posts"]] == [1, 2]
+    assert synced["watermark"] > watermark
+
+
+def test_postgresql_serializes_change_log_writes():
+    lock = change_log.lock_statement("postgresql")
+    sql = str(lock.compile(dialect=postgresql.dialect()))
+    assert "pg_advisory_xact_lock" in sql
+    assert change_log.lock_statement("sqlite") is None
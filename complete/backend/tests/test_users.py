@@ -0,0 +1,101 @@
+"""사용자 ID 조회/생성 테스트 (동시 생성과 사용자 이름 -> ID 캐시)"""
+import threading
+
+from sqlalchemy import func, select
+
+from benchmarks.common import SessionLocal, reset_database
+from app.controllers import user_service
+from app.models import models
+
+
+def _user_rows():
+    db = SessionLocal()
+    try:
+        return db.execute(
+            select(models.User.username, func.count(), func.min(models.User.id)).group_by(models.User.username)
+        ).all()
+    finally:
+        db.close()
+
+
+def _create(usernames, commit=True):
+    db = SessionLocal()
+    try:
+        return user_service.get_or_create_user_ids(db, usernames, commit)
+    finally:
+        db.close()
+
+
+def test_concurrent_creation_returns_the_same_ids(client):
+    names = [f"user{i}" for i in range(50)]
+    barrier = threading.Barrier(2)
+    results, errors = [], []
+
+    def create(usernames):
+        try:
+            barrier.wait()
+            results.append(_create(usernames))
+        except Exception as error:
+            errors.append(error)
+
+    # 두 세션이 겹치는 이름들을 순서를 바꿔 동시에 생성
+    threads = [threading.Thread(target=create, args=(order,)) for order in (names, names[::-1])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert errors == [] and len(results) == 2
+    rows = {username: (count, user_id) for username, count, user_id in _user_rows()}
+    assert set(rows) == set(names)
+    assert all(count == 1 for count, _ in rows.values())
+    assert results[0] == results[1] == {username: user_id for username, (_, user_id) in rows.items()}
+
+
+def test_creation_waits_for_an_uncommitted_insert(client):
+    # A가 같은 이름을 삽입하고 아직 커밋하지 않은 동안 B가 생성을 시도
+    first = SessionLocal()
+    pending = user_service.get_or_create_user_ids(first, ["alice", "bob"], commit=False)
+    assert "alice" not in user_service.user_id_cache.get_many(["alice"])
+    result = {}
+    writer = threading.Thread(target=lambda: result.update(_create(["bob", "carol"])))
+    writer.start()
+    try:
+        writer.join(0.3)
+        assert writer.is_alive()
+        first.commit()
+        writer.join(10)
+    finally:
+        first.close()
+
+    assert result["bob"] == pending["bob"]
+    assert sorted(username for username, count, _ in _user_rows() if count == 1) == ["alice", "bob", "carol"]
+    assert _create(["alice", "bob", "carol"]) == {**pending, "carol": result["carol"]}
+
+
+def test_rolled_back_users_are_not_cached(client):
+    db = SessionLocal()
+    try:
+        user_service.get_or_create_user_ids(db, ["ghost"], commit=False)
+        db.rollback()
+    finally:
+        db.close()
+    assert user_service.user_id_cache.get("ghost") is None
+    assert _user_rows() == []
+
+
+def test_user_id_cache_is_cleared_with_the_database(client):
+    ids = _create(["alice", "bob"])
+    assert user_service.user_id_cache.get_many(["alice", "bob"]) == ids
+
+    # 다시 만든 DB에서는 같은 이름이 다른 ID를 받으므로 이전 ID가 남아 있으면 안 됨
+    reset_database()
+    assert user_service.user_id_cache.get_many(["alice", "bob"]) == {}
+    recreated = _create(["bob", "alice"])
+    assert recreated == {"bob": 1, "alice": 2}
+    db = SessionLocal()
+    try:
+        assert user_service.get_user_ids(db, ["alice", "bob"]) == recreated
+        assert user_service.get_user_id(db, "alice") == 2
+    finally:
+        db.close()